@@ -9,64 +9,180 @@ import json
 import sqlite3
 import sys
 import argparse
+import functools
 from pathlib import Path
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+FETCH_BATCH_SIZE = 256
+CLEANUP_CHUNK_SIZE = 10000
+
+# Device status labels indexed by the status bucket computed in SQL
+_STATUS = ("🟢 Online", "🟡 Recent", "🔴 Offline")
+_EXEC = ("❌ No", "✅ Yes")
+
+# Row builders pad fixed-width columns with str.ljust rather than the format
+# mini-language; output is collected and written once per batch
+def _device_row(device_id, tags, exec_str, last_seen, status):
+    return " ".join((device_id.ljust(20), tags.ljust(20), exec_str.ljust(6),
+                     last_seen.ljust(12), status)) + "\n"
+
+def _upload_row(upload_id, filename, size, uploader, date):
+    return " ".join((upload_id.ljust(38), filename.ljust(25), size.ljust(10),
+                     uploader.ljust(12), date)) + "\n"
+
+_AUDIT_ENTRY = "🕒 {}\n   Device: {}\n   Action: {}\n   Command: {}\n".format
+
+def iter_rows(cursor, batch_size=FETCH_BATCH_SIZE):
+    """Yield rows from a cursor in fetchmany() batches instead of fetchall()"""
+    cursor.arraysize = batch_size
+    for batch in iter(cursor.fetchmany, []):
+        yield from batch
+
+def parse_tags(tags):
+    """Parse a stored JSON tag list, splitting plain string lists without json"""
+    if tags[0] == '[' and tags[-1] == ']' and '\\' not in tags:
+        inner = tags[1:-1].strip()
+        if not inner:
+            return []
+        parts = [part.strip() for part in inner.split(',')]
+        # Each part must be exactly one quoted string for the fast path to hold
+        if inner.count('"') == 2 * len(parts) and all(
+                len(part) >= 2 and part[0] == '"' and part[-1] == '"' for part in parts):
+            return [part[1:-1] for part in parts]
+    return json.loads(tags)
+
+def flush_lines(out):
+    """Write buffered output lines with a single stdout write"""
+    sys.stdout.write("".join(out))
+    out.clear()
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_minute(minute):
+    """Format a minute-aligned epoch timestamp as 'YYYY-MM-DD HH:MM'"""
+    return time.strftime("%Y-%m-%d %H:%M", time.localtime(minute))
+
+def format_timestamp(ts, seconds=False):
+    """Format a timestamp, reusing one strftime call per minute bucket"""
+    ts = int(ts)
+    minute_str = _fmt_minute(ts - ts % 60)
+    return f"{minute_str}:{ts % 60:02d}" if seconds else minute_str
+
 class UnifiedControlCLI:
     """Command-line interface for Unified Control System"""
-    
+
+    # Indexes only need to be created once per process
+    _indexes_ready = False
+    # Same names and definitions the server creates, so the two never build duplicate indexes
+    INDEX_NAMES = ("idx_devices_last_seen", "idx_audit_ts_dev", "idx_uploads_created")
+
     def __init__(self, db_path="./unified_control.sqlite", server_url=None, auth_token=None):
         self.db_path = db_path
         self.server_url = server_url
         self.auth_token = auth_token
+        self._session = None
     
-    def connect_db(self):
-        """Connect to database"""
+    def _get_session(self):
+        """Return a keep-alive HTTP session, created on first use"""
+        if self._session is None:
+            session = requests.Session()
+            # Only connection failures are retried; a read error may mean the command already ran
+            adapter = HTTPAdapter(max_retries=Retry(total=2, read=0, backoff_factor=0.1))
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._session = session
+        return self._session
+    
+    def _require_db(self):
+        """Exit with an error if the database file does not exist"""
         if not Path(self.db_path).exists():
             print(f"❌ Database not found: {self.db_path}")
             sys.exit(1)
-        return sqlite3.connect(self.db_path)
+    
+    def connect_db(self):
+        """Connect to database"""
+        self._require_db()
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+
+        if not UnifiedControlCLI._indexes_ready:
+            # Cover the columns every verb sorts or filters on
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_devices_last_seen ON devices(last_seen DESC)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_audit_ts_dev ON audit_log(timestamp DESC, device_id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_uploads_created ON uploads(created_at DESC)")
+            conn.commit()
+            UnifiedControlCLI._indexes_ready = True
+        return conn
+    
+    def _connect_ro(self):
+        """Open a read-only autocommit connection for the listing verbs"""
+        self._require_db()
+        uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+        conn = sqlite3.connect(uri, uri=True, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA query_only=ON")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        
+        if not UnifiedControlCLI._indexes_ready:
+            # Only fall back to a writable connection when indexes are missing
+            placeholders = ",".join("?" * len(self.INDEX_NAMES))
+            found = conn.execute(
+                f"SELECT COUNT(*) FROM sqlite_master WHERE type = 'index' AND name IN ({placeholders})",
+                self.INDEX_NAMES
+            ).fetchone()[0]
+            if found == len(self.INDEX_NAMES):
+                UnifiedControlCLI._indexes_ready = True
+            else:
+                self.connect_db().close()
+        return conn
     
     def list_devices(self):
         """List all devices from database"""
-        conn = self.connect_db()
+        conn = self._connect_ro()
         try:
+            # Age and status bucket are computed by SQLite during the scan
             cursor = conn.execute("""
-                SELECT id, tags, exec_allowed, last_seen, created_at, metadata 
+                SELECT id, tags, exec_allowed, last_seen,
+                       :now - COALESCE(last_seen, 0) AS age,
+                       CASE WHEN :now - COALESCE(last_seen, 0) < 60 THEN 0
+                            WHEN :now - COALESCE(last_seen, 0) < 300 THEN 1
+                            ELSE 2 END AS status_bucket
                 FROM devices ORDER BY last_seen DESC
-            """)
+            """, {"now": int(time.time())})
             
-            devices = cursor.fetchall()
-            if not devices:
+            # The summary comes before the streamed rows, so count them up front
+            count = conn.execute("SELECT COUNT(*) FROM devices").fetchone()[0]
+            if not count:
                 print("📱 No devices found")
                 return
             
-            print(f"📱 Found {len(devices)} devices:\n")
-            print(f"{'Device ID':<20} {'Tags':<20} {'Exec':<6} {'Last Seen':<12} {'Status':<8}")
-            print("-" * 80)
-            
-            current_time = int(time.time())
-            for device in devices:
-                device_id, tags, exec_allowed, last_seen, created_at, metadata = device
+            out = [f"📱 Found {count} devices:\n\n",
+                   _device_row("Device ID", "Tags", "Exec", "Last Seen", "Status"),
+                   "-" * 80 + "\n"]
+            for device in iter_rows(cursor):
+                device_id, tags, exec_allowed, last_seen, age, status_bucket = device
                 
                 # Parse tags
                 try:
-                    tag_list = json.loads(tags) if tags else []
+                    tag_list = parse_tags(tags) if tags else []
                     tags_str = ",".join(tag_list[:3])  # Show first 3 tags
                     if len(tag_list) > 3:
                         tags_str += "..."
                 except:
                     tags_str = tags or ""
                 
-                # Calculate status
-                age = current_time - (last_seen or 0)
-                if age < 60:
-                    status = "🟢 Online"
-                elif age < 300:
-                    status = "🟡 Recent"
-                else:
-                    status = "🔴 Offline"
+                status = _STATUS[status_bucket]
                 
                 # Format last seen
                 if last_seen:
@@ -79,33 +195,37 @@ class UnifiedControlCLI:
                 else:
                     last_seen_str = "Never"
                 
-                exec_str = "✅ Yes" if exec_allowed else "❌ No"
+                exec_str = _EXEC[bool(exec_allowed)]
                 
-                print(f"{device_id:<20} {tags_str:<20} {exec_str:<6} {last_seen_str:<12} {status}")
+                out.append(_device_row(device_id, tags_str, exec_str, last_seen_str, status))
+                if len(out) >= FETCH_BATCH_SIZE:
+                    flush_lines(out)
+            
+            flush_lines(out)
         
         finally:
             conn.close()
     
     def list_uploads(self):
         """List all uploaded files"""
-        conn = self.connect_db()
+        conn = self._connect_ro()
         try:
             cursor = conn.execute("""
-                SELECT id, filename, size, uploader, created_at, sha256 
+                SELECT id, filename, size, uploader, created_at
                 FROM uploads ORDER BY created_at DESC
             """)
             
-            uploads = cursor.fetchall()
-            if not uploads:
+            # The summary comes before the streamed rows, so count them up front
+            count = conn.execute("SELECT COUNT(*) FROM uploads").fetchone()[0]
+            if not count:
                 print("📁 No uploads found")
                 return
             
-            print(f"📁 Found {len(uploads)} uploads:\n")
-            print(f"{'File ID':<38} {'Filename':<25} {'Size':<10} {'Uploader':<12} {'Date'}")
-            print("-" * 100)
-            
-            for upload in uploads:
-                upload_id, filename, size, uploader, created_at, sha256 = upload
+            out = [f"📁 Found {count} uploads:\n\n",
+                   _upload_row("File ID", "Filename", "Size", "Uploader", "Date"),
+                   "-" * 100 + "\n"]
+            for upload in iter_rows(cursor):
+                upload_id, filename, size, uploader, created_at = upload
                 
                 # Format size
                 if size < 1024:
@@ -116,49 +236,61 @@ class UnifiedControlCLI:
                     size_str = f"{size/(1024*1024):.1f}MB"
                 
                 # Format date
-                date_str = time.strftime("%Y-%m-%d %H:%M", time.localtime(created_at))
+                date_str = format_timestamp(created_at)
                 
-                print(f"{upload_id:<38} {filename:<25} {size_str:<10} {uploader:<12} {date_str}")
+                out.append(_upload_row(upload_id, filename, size_str, uploader, date_str))
+                if len(out) >= FETCH_BATCH_SIZE:
+                    flush_lines(out)
+            
+            flush_lines(out)
         
         finally:
             conn.close()
     
     def audit_log(self, limit=50):
         """Show audit log"""
-        conn = self.connect_db()
+        conn = self._connect_ro()
         try:
             cursor = conn.execute("""
-                SELECT timestamp, device_id, action, command, result, user_agent
+                SELECT timestamp, device_id, action, command, result
                 FROM audit_log ORDER BY timestamp DESC LIMIT ?
             """, (limit,))
             
-            logs = cursor.fetchall()
-            if not logs:
-                print("📋 No audit logs found")
-                return
-            
-            print(f"📋 Audit Log (last {len(logs)} entries):\n")
-            
-            for log in logs:
-                timestamp, device_id, action, command, result, user_agent = log
-                date_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timestamp))
+            count = 0
+            out = []
+            for log in iter_rows(cursor):
+                if not count:
+                    out.append(f"📋 Audit Log (newest first, limit {limit}):\n\n")
+                count += 1
+                timestamp, device_id, action, command, result = log
+                date_str = format_timestamp(timestamp, seconds=True)
                 
-                print(f"🕒 {date_str}")
-                print(f"   Device: {device_id}")
-                print(f"   Action: {action}")
-                print(f"   Command: {command}")
+                out.append(_AUDIT_ENTRY(date_str, device_id, action, command))
                 if result:
-                    try:
-                        result_obj = json.loads(result)
-                        if isinstance(result_obj, dict) and 'success' in result_obj:
-                            status = "✅ Success" if result_obj['success'] else "❌ Failed"
-                            print(f"   Result: {status}")
-                        else:
-                            print(f"   Result: {result[:100]}...")
-                    except:
-                        print(f"   Result: {result[:100]}...")
-                print()
-        
+                    status = None
+                    # Only results carrying a "success" key are worth decoding
+                    if '"success"' in result:
+                        try:
+                            result_obj = _json_loads(result)
+                            if isinstance(result_obj, dict) and 'success' in result_obj:
+                                status = "✅ Success" if result_obj['success'] else "❌ Failed"
+                        except:
+                            pass
+                    if status:
+                        out.append(f"   Result: {status}\n")
+                    else:
+                        out.append(f"   Result: {result[:100]}...\n")
+                out.append("\n")
+                if len(out) >= FETCH_BATCH_SIZE:
+                    flush_lines(out)
+
+            flush_lines(out)
+            if not count:
+                print("📋 No audit logs found")
+                return
+
+            print(f"📋 Showed {count} entries")
+
         finally:
             conn.close()
     
@@ -168,14 +300,15 @@ class UnifiedControlCLI:
             print("❌ Server URL and auth token required for API commands")
             sys.exit(1)
         
+        url = f"{self.server_url.replace('ws://', 'http://').replace('wss://', 'https://')}/api/send"
+        params = {"token": self.auth_token}
+        
         try:
-            url = f"{self.server_url.replace('ws://', 'http://').replace('wss://', 'https://')}/api/send"
-            params = {"token": self.auth_token}
             data = {"target": target, "cmd": command}
             
             print(f"📤 Sending command '{command}' to {target}...")
             
-            response = requests.post(url, params=params, json=data, timeout=10)
+            response = self._get_session().post(url, params=params, json=data, timeout=10)
             response.raise_for_status()
             
             result = response.json()
@@ -185,6 +318,20 @@ class UnifiedControlCLI:
         except Exception as e:
             print(f"❌ Command failed: {e}")
     
+    def _delete_in_chunks(self, conn, table, column, cutoff_time):
+        """Delete rows older than cutoff in bounded transactions, return count"""
+        deleted = 0
+        while True:
+            with conn:
+                cursor = conn.execute(f"""
+                    DELETE FROM {table} WHERE rowid IN (
+                        SELECT rowid FROM {table} WHERE {column} < ? LIMIT ?
+                    )
+                """, (cutoff_time, CLEANUP_CHUNK_SIZE))
+            if cursor.rowcount <= 0:
+                return deleted
+            deleted += cursor.rowcount
+    
     def cleanup_old_data(self, days=7):
         """Clean up old audit logs and disconnected devices"""
         conn = self.connect_db()
@@ -192,14 +339,10 @@ class UnifiedControlCLI:
             cutoff_time = int(time.time()) - (days * 24 * 3600)
             
             # Clean old audit logs
-            cursor = conn.execute("DELETE FROM audit_log WHERE timestamp < ?", (cutoff_time,))
-            audit_deleted = cursor.rowcount
+            audit_deleted = self._delete_in_chunks(conn, "audit_log", "timestamp", cutoff_time)
             
             # Clean old disconnected devices
-            cursor = conn.execute("DELETE FROM devices WHERE last_seen < ?", (cutoff_time,))
-            devices_deleted = cursor.rowcount
-            
-            conn.commit()
+            devices_deleted = self._delete_in_chunks(conn, "devices", "last_seen", cutoff_time)
             
             print(f"🧹 Cleanup completed:")
             print(f"   Deleted {audit_deleted} old audit log entries")
@@ -210,30 +353,23 @@ class UnifiedControlCLI:
     
     def stats(self):
         """Show system statistics"""
-        conn = self.connect_db()
+        conn = self._connect_ro()
         try:
-            # Device stats
-            cursor = conn.execute("SELECT COUNT(*) FROM devices")
-            total_devices = cursor.fetchone()[0]
-            
-            cursor = conn.execute("SELECT COUNT(*) FROM devices WHERE exec_allowed = 1")
-            exec_devices = cursor.fetchone()[0]
-            
+            # Device, upload and audit stats in a single round-trip
             current_time = int(time.time())
-            cursor = conn.execute("SELECT COUNT(*) FROM devices WHERE last_seen > ?", (current_time - 300,))
-            online_devices = cursor.fetchone()[0]
-            
-            # Upload stats
-            cursor = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM uploads")
-            upload_count, total_size = cursor.fetchone()
-            
-            # Audit stats
-            cursor = conn.execute("SELECT COUNT(*) FROM audit_log")
-            audit_count = cursor.fetchone()[0]
-            
-            cursor = conn.execute("SELECT COUNT(*) FROM audit_log WHERE timestamp > ?", (current_time - 86400,))
-            recent_commands = cursor.fetchone()[0]
-            
+            cursor = conn.execute("""
+                SELECT
+                    (SELECT COUNT(*) FROM devices),
+                    (SELECT COUNT(*) FROM devices WHERE exec_allowed = 1),
+                    (SELECT COUNT(*) FROM devices WHERE last_seen > ?),
+                    (SELECT COUNT(*) FROM uploads),
+                    (SELECT COALESCE(SUM(size), 0) FROM uploads),
+                    (SELECT COUNT(*) FROM audit_log),
+                    (SELECT COUNT(*) FROM audit_log WHERE timestamp > ?)
+            """, (current_time - 300, current_time - 86400))
+            (total_devices, exec_devices, online_devices, upload_count,
+             total_size, audit_count, recent_commands) = cursor.fetchone()
+
             print("📊 System Statistics")
             print("=" * 40)
             print(f"📱 Devices:")
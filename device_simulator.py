@@ -9,24 +9,34 @@ import sys
 import logging
 from unified_agent_with_ui import DeviceClient
 import random
-import string
+import secrets
 
 # Configuration
 DEFAULT_SERVER = "ws://127.0.0.1:8765"
 DEFAULT_TOKEN = "your_auth_token_here"
+STAGGER_DELAY = 0.5  # Seconds between device connections
+CONCURRENCY_FACTOR = 8  # Devices ramped up per stagger interval
 
-def generate_device_id():
-    """Generate a random device ID"""
-    return f"sim-{''.join(random.choices(string.ascii_lowercase + string.digits, k=8))}"
+DEVICE_ID_BYTES = 4  # Rendered as 8 hex characters
+TAG_OPTIONS = ("alpha", "beta", "production", "testing", "mobile", "server", "edge")
+
+def generate_device_ids(count):
+    """Generate random device IDs from a single entropy draw"""
+    blob = secrets.token_bytes(count * DEVICE_ID_BYTES)
+    return [f"sim-{blob[i:i + DEVICE_ID_BYTES].hex()}"
+            for i in range(0, len(blob), DEVICE_ID_BYTES)]
 
 def generate_tags():
     """Generate random tags for device"""
-    tag_options = ["alpha", "beta", "production", "testing", "mobile", "server", "edge"]
-    return random.sample(tag_options, random.randint(1, 3))
+    return random.sample(TAG_OPTIONS, random.randint(1, 3))
 
-async def run_simulated_device(device_id, server_url, auth_token, exec_allowed=False):
+async def run_simulated_device(device_id, server_url, auth_token, exec_allowed=False, start_delay=0):
     """Run a single simulated device"""
     try:
+        # Ramp connections up gradually without blocking the scheduler
+        if start_delay:
+            await asyncio.sleep(start_delay)
+        
         client = DeviceClient(
             device_id=device_id,
             server_url=server_url,
@@ -79,21 +89,18 @@ Examples:
 🔧 Exec ratio: {exec_ratio:.1%}
 """)
     
-    # Create device tasks
+    # Create all device tasks up front; each one staggers its own start
     tasks = []
-    for i in range(num_devices):
-        device_id = generate_device_id()
+    for i, device_id in enumerate(generate_device_ids(num_devices)):
         exec_allowed = random.random() < exec_ratio
+        start_delay = i * STAGGER_DELAY / CONCURRENCY_FACTOR
         
         task = asyncio.create_task(
-            run_simulated_device(device_id, server_url, auth_token, exec_allowed)
+            run_simulated_device(device_id, server_url, auth_token, exec_allowed, start_delay)
         )
         tasks.append(task)
-        
-        # Stagger device connections
-        await asyncio.sleep(0.5)
     
-    print(f"✅ All {num_devices} devices started")
+    print(f"✅ All {num_devices} devices scheduled")
     print("Press Ctrl+C to stop all devices")
     
     try:
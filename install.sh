@@ -492,6 +492,18 @@ optimize_device_capacity() {
     print_success "System optimized for current hardware"
 }
 
+# Precompile Python sources
+precompile_sources() {
+    print_status "Precompiling Python sources..."
+    
+    # Populate __pycache__ up front so the first import of each module skips compilation
+    if $PYTHON_CMD -m compileall -q . >/dev/null 2>&1; then
+        print_success "Python sources precompiled"
+    else
+        print_warning "Could not precompile sources (they will compile on first use)"
+    fi
+}
+
 # Main installation process
 main() {
     echo ""
@@ -517,6 +529,7 @@ main() {
     create_docs
     create_gitignore
     optimize_device_capacity
+    precompile_sources
     
     echo ""
     print_success "Installation completed successfully!"
@@ -10,7 +10,58 @@ echo ""
 echo "⚠️  Keep your auth token secure: $UC_AUTH_TOKEN"
 echo ""
 
-python3 unified_agent_with_ui.py \
+# Size limits from RAM without starting a Python launcher. start_unified.py is the source of truth:
+# this mirrors its TIERS, CGROUP_MEMORY_FILES and WORKERS_PER_CORE, so keep the two in step
+mem_mb=$(awk '/^MemTotal:/ {print int($2 / 1024)}' /proc/meminfo 2>/dev/null)
+for cgroup_file in /sys/fs/cgroup/memory.max /sys/fs/cgroup/memory/memory.limit_in_bytes; do
+    [ -r "$cgroup_file" ] || continue
+    cgroup_max=$(cat "$cgroup_file" 2>/dev/null)
+    # v2 reports 'max' when unlimited; v1's huge unlimited value loses to host RAM below
+    case "$cgroup_max" in
+        ''|*[!0-9]*) ;;
+        *) [ $((cgroup_max / 1048576)) -lt "${mem_mb:-0}" ] && mem_mb=$((cgroup_max / 1048576)) ;;
+    esac
+    break
+done
+mem_mb=${mem_mb:-4096}
+
+if [ "$mem_mb" -lt 1024 ]; then
+    tier="50 20 256"
+elif [ "$mem_mb" -lt 2048 ]; then
+    tier="500 50 512"
+elif [ "$mem_mb" -lt 4096 ]; then
+    tier="2000 100 1024"
+elif [ "$mem_mb" -lt 8192 ]; then
+    tier="5000 150 1536"
+elif [ "$mem_mb" -lt 16384 ]; then
+    tier="10000 200 2048"
+else
+    tier="50000 500 4096"
+fi
+read -r tier_devices tier_workers tier_memory <<< "$tier"
+# At most 32 workers per usable CPU; nproc honors cpuset/taskset masks like sched_getaffinity
+cpu_cap=$(( $(nproc 2>/dev/null || echo 1) * 32 ))
+[ "$tier_workers" -gt "$cpu_cap" ] && tier_workers=$cpu_cap
+export UC_MAX_DEVICES="${UC_MAX_DEVICES:-$tier_devices}"
+export UC_MAX_WORKERS="${UC_MAX_WORKERS:-$tier_workers}"
+export UC_MEMORY_LIMIT="${UC_MEMORY_LIMIT:-$tier_memory}"
+
+# Overrides must be positive integers, as start_unified.py's detect_optimal_settings requires
+for var in UC_MAX_DEVICES UC_MAX_WORKERS UC_MEMORY_LIMIT; do
+    if [[ ! ${!var} =~ ^[1-9][0-9]*$ ]]; then
+        echo "❌ Invalid $var: '${!var}' (expected a positive integer)"
+        exit 1
+    fi
+done
+
+# Kernel-enforced limits; failures (e.g. above the hard limit) are not fatal
+ulimit -S -v $((UC_MEMORY_LIMIT * 1024 * 4)) 2>/dev/null
+open_files=$((UC_MAX_DEVICES * 2))
+[ "$open_files" -lt 4096 ] && open_files=4096
+ulimit -S -n "$open_files" 2>/dev/null || ulimit -S -n "$(ulimit -H -n)" 2>/dev/null
+
+# Replace this shell with the server so signals reach it directly
+exec python3 unified_agent_with_ui.py \
     --mode server \
     --auth "$UC_AUTH_TOKEN" \
     --host "$UC_HOST" \
